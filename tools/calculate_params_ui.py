@@ -1,12 +1,10 @@
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict
 
 from PySide6.QtCore import Qt, QRegularExpression
 from PySide6.QtGui import (
     QAction,
-    QColor,
     QFont,
-    QPalette,
     QRegularExpressionValidator,
 )
 from PySide6.QtWidgets import (
@@ -19,11 +17,7 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
     QMessageBox,
-    QFileDialog,
     QSplitter,
     QLabel,
     QDialog,
@@ -31,6 +25,14 @@ from PySide6.QtWidgets import (
     QTextBrowser,
 )
 
+from flightlab.motor_esc import (
+    RESULT_COLUMNS,
+    TORQUE_LABELS,
+    MotorEscResults,
+    motor_esc_columns,
+)
+from ui_common import ArrayTableModel, CacheStatus, apply_dark_theme, cancel_export, export_model_csv, make_table_view
+
 
 HELP_HTML = """
 <h2 style="margin:0;">Motor & ESC Glossary and Calculation Notes</h2>
@@ -111,38 +113,14 @@ ESC_Rec ~ round(40 * 1.20) = 48 A -> choose the next standard size above this va
 <p style="color:#aaaaaa; font-size: 90%;">This helper explains the UI terms and the simplified math used by the calculator.</p>
 """
 
-
-def calculate_motor_esc_params(
-    kv_ratings: List[int],
-    battery_voltages: List[float],
-    current_draws: Dict[int, float],
-) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-    for kv in kv_ratings:
-        for voltage in battery_voltages:
-            rpm = kv * voltage
-            if kv >= 2000:
-                torque = "Low"
-            elif 1000 <= kv < 2000:
-                torque = "Medium"
-            else:
-                torque = "High"
-
-            current = current_draws.get(kv, 0.0)
-            power = voltage * current
-            esc_rating = round(current * 1.2)
-
-            results.append(
-                {
-                    "KV": kv,
-                    "Voltage (V)": voltage,
-                    "RPM": rpm,
-                    "Torque": torque,
-                    "Power (W)": power,
-                    "ESC Recommendation (A)": esc_rating,
-                }
-            )
-    return results
+HEADER_TOOLTIPS = [
+    "KV: RPM per Volt (no-load speed constant).",
+    "Voltage (V): Battery voltage used for the estimate.",
+    "RPM: Estimated no-load speed = KV * Voltage.",
+    "Torque: Heuristic category from KV (inverse trend).",
+    "Power (W): Electrical input power = V * I.",
+    "ESC Rec. (A): Suggested ESC rating with 20% margin.",
+]
 
 
 class HelpDialog(QDialog):
@@ -168,9 +146,10 @@ class MotorEscCalculator(QMainWindow):
         self.setWindowTitle("Motor & ESC Parameter Calculator")
         self.resize(760, 480)
 
-        self._apply_dark_theme()
+        apply_dark_theme()
         self._build_menu()
         self._build_ui()
+        self.cache_status = CacheStatus(self)
 
     # ---- UI ----
     def _build_menu(self):
@@ -266,16 +245,15 @@ class MotorEscCalculator(QMainWindow):
         header.setFont(small_bold)
         right_layout.addWidget(header)
 
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(
-            ["KV", "Voltage (V)", "RPM", "Torque", "Power (W)", "ESC Rec. (A)"]
+        self.model = ArrayTableModel(
+            ["KV", "Voltage (V)", "RPM", "Torque", "Power (W)", "ESC Rec. (A)"],
+            formats=["{}", "{:.2f}", "{:.2f}", TORQUE_LABELS.__getitem__, "{:.2f}", "{}"],
+            right_align=(0, 1, 2, 4, 5),
+            tooltips=HEADER_TOOLTIPS,
+            export_formats=[None, None, None, TORQUE_LABELS.__getitem__, None, None],
         )
-        self._apply_header_tooltips()
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.verticalHeader().setVisible(False)
+        self.table = make_table_view(self.model)
         self.table.setSortingEnabled(True)
-        self.table.setAlternatingRowColors(True)
-        self.table.verticalHeader().setDefaultSectionSize(22)
         right_layout.addWidget(self.table, stretch=1)
 
         splitter.addWidget(right_panel)
@@ -307,14 +285,14 @@ class MotorEscCalculator(QMainWindow):
             volt_list = self._parse_csv_floats(self.voltage_edit.text(), "Battery Voltages")
             kv_curr = self._parse_kv_current_pairs(self.current_edit.text(), "Current Draws")
 
-            results = calculate_motor_esc_params(kv_list, volt_list, kv_curr)
+            results = self.cache_status.call(motor_esc_columns, kv_list, volt_list, kv_curr)
             self._populate_table(results)
             self.statusBar().showMessage(f"Calculated {len(results)} combinations.", 2500)
         except ValueError as e:
             QMessageBox.critical(self, "Error", str(e))
 
     def _on_clear(self):
-        self.table.setRowCount(0)
+        self.model.clear()
         self.statusBar().clearMessage()
 
     def _load_sample(self):
@@ -323,26 +301,11 @@ class MotorEscCalculator(QMainWindow):
         self.current_edit.setText("2300:30,1200:40,900:50")
 
     def _export_csv(self):
-        if self.table.rowCount() == 0:
-            QMessageBox.information(self, "Export", "No results to export.")
-            return
-        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "results.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-            lines = [",".join(headers)]
-            for r in range(self.table.rowCount()):
-                row = []
-                for c in range(self.table.columnCount()):
-                    item = self.table.item(r, c)
-                    row.append("" if item is None else item.text())
-                lines.append(",".join(row))
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            self.statusBar().showMessage(f"Exported to {path}", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {e}")
+        export_model_csv(self, self.model, "results.csv")
+
+    def closeEvent(self, event):
+        cancel_export(self)
+        super().closeEvent(event)
 
     def _open_help(self):
         dlg = HelpDialog(self)
@@ -386,141 +349,9 @@ class MotorEscCalculator(QMainWindow):
             )
 
     # ---- Table ----
-    def _populate_table(self, results: List[Dict[str, Any]]):
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(results))
-
-        for row, res in enumerate(results):
-            self._set_item(row, 0, f"{res['KV']}")
-            self._set_item(row, 1, f"{res['Voltage (V)']:.2f}")
-            self._set_item(row, 2, f"{res['RPM']:.2f}")
-            self._set_item(row, 3, f"{res['Torque']}")
-            self._set_item(row, 4, f"{res['Power (W)']:.2f}")
-            self._set_item(row, 5, f"{res['ESC Recommendation (A)']}")
-
-        self.table.setSortingEnabled(True)
-        self.table.sortItems(0, Qt.SortOrder.AscendingOrder)
-        self.table.resizeRowsToContents()
-
-    def _set_item(self, row: int, col: int, text: str):
-        item = QTableWidgetItem(text)
-        if col in (0, 1, 2, 4, 5):
-            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.table.setItem(row, col, item)
-
-    def _apply_header_tooltips(self):
-        tooltips = [
-            "KV: RPM per Volt (no-load speed constant).",
-            "Voltage (V): Battery voltage used for the estimate.",
-            "RPM: Estimated no-load speed = KV * Voltage.",
-            "Torque: Heuristic category from KV (inverse trend).",
-            "Power (W): Electrical input power = V * I.",
-            "ESC Rec. (A): Suggested ESC rating with 20% margin.",
-        ]
-        for i in range(self.table.columnCount()):
-            item = QTableWidgetItem(self.table.horizontalHeaderItem(i).text())
-            item.setToolTip(tooltips[i])
-            self.table.setHorizontalHeaderItem(i, item)
-
-    # ---- Theme ----
-    def _apply_dark_theme(self):
-        base_font = QFont("Arial", 10)
-        QApplication.instance().setFont(base_font)
-
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#121212"))
-        palette.setColor(QPalette.WindowText, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Base, QColor("#1a1a1a"))
-        palette.setColor(QPalette.AlternateBase, QColor("#171717"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#2a2a2a"))
-        palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Button, QColor("#232323"))
-        palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
-        palette.setColor(QPalette.BrightText, QColor("#ff6666"))
-        palette.setColor(QPalette.Highlight, QColor("#0a84ff"))
-        palette.setColor(QPalette.HighlightedText, QColor("#000000"))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #dcdcdc;
-                font-family: Arial;
-                font-size: 10pt;
-            }
-            QGroupBox {
-                border: 1px solid #2b2b2b;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 2px;
-                font-size: 10pt;
-            }
-            QLineEdit {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 4px 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0a84ff;
-            }
-            QPushButton {
-                background-color: #0a84ff;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-height: 26px;
-            }
-            QPushButton:hover { background-color: #2b95ff; }
-            QPushButton:pressed { background-color: #086ed6; }
-            QTableWidget {
-                gridline-color: #2a2a2a;
-                background-color: #161616;
-                alternate-background-color: #141414;
-                color: #dcdcdc;
-                selection-background-color: #0a84ff;
-                selection-color: #000000;
-                border: 1px solid #2a2a2a;
-                border-radius: 6px;
-                font-size: 10pt;
-            }
-            QHeaderView::section {
-                background-color: #1c1c1c;
-                color: #dcdcdc;
-                padding: 4px 6px;
-                border: 0px;
-                border-right: 1px solid #2a2a2a;
-                font-size: 10pt;
-            }
-            QSplitter::handle { background: #1b1b1b; }
-            QLabel#tips {
-                color: #a0a0a0;
-                padding: 4px 0;
-                font-size: 9pt;
-            }
-            QTextBrowser {
-                background-color: #1a1a1a;
-                color: #e6e6e6;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            """
-        )
+    def _populate_table(self, results: MotorEscResults):
+        self.model.set_columns([results[name] for name in RESULT_COLUMNS])
+        self.table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
 
 if __name__ == "__main__":
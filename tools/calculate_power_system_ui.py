@@ -1,9 +1,12 @@
+import os
 import sys
-import math
-from typing import Dict, Any, List
+import time
+from typing import List, Optional
+
+import numpy as np
 
 from PySide6.QtCore import Qt, QRegularExpression
-from PySide6.QtGui import QAction, QColor, QFont, QPalette, QRegularExpressionValidator
+from PySide6.QtGui import QAction, QFont, QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,9 +17,6 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
     QMessageBox,
     QFileDialog,
     QSplitter,
@@ -25,57 +25,42 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QTextBrowser,
     QComboBox,
+    QGridLayout,
+    QListWidget,
 )
 
-# ----------------------------
-# Domain logic (unchanged math)
-# ----------------------------
-
-def recommend_power(weight_kg: float, flight_type: str = "trainer") -> float:
-    if flight_type == "glider":
-        return weight_kg * 65
-    elif flight_type == "aerobatic":
-        return weight_kg * 200
-    else:
-        return weight_kg * 120
-
-def motor_efficiency_output(input_power: float, efficiency_percent: float) -> float:
-    return input_power * (efficiency_percent / 100.0)
-
-def motor_weight_from_power(power_watt: float, efficiency: float = 70.0) -> float:
-    factor = 3 if efficiency <= 70 else 5
-    return power_watt / factor  # grams
-
-def battery_voltage_from_wingspan_cm(cm: float) -> float:
-    if cm < 100:
-        return 11.1  # 3s
-    elif cm < 140:
-        return 14.8  # 4s
-    elif cm < 175:
-        return 22.2  # 6s
-    elif cm < 215:
-        return 29.6  # 8s
-    elif cm < 245:
-        return 37.0  # 10s
-    else:
-        return 44.4  # 12s
-
-def prop_pitch_speed(pitch_cm: float, rpm: float) -> float:
-    return (pitch_cm * rpm) / 60000.0  # m/s
-
-def thrust_check(thrust_g: float, plane_weight_g: float) -> Dict[str, bool]:
-    return {
-        "hover": thrust_g >= plane_weight_g,
-        "takeoff": thrust_g >= 0.5 * plane_weight_g,
-        "climb": thrust_g >= 0.33 * plane_weight_g,
-    }
-
-def esc_rating(max_current: float) -> float:
-    return max_current * 1.2
-
-def battery_discharge_check(capacity_mah: float, c_rating: float, load_current: float) -> bool:
-    max_safe_continuous = (capacity_mah * c_rating * 0.6) / 1000.0  # A
-    return load_current <= max_safe_continuous
+from flightlab.mass import (
+    DEFAULT_INFILL,
+    DEFAULT_SHELL_MM,
+    MATERIAL_DENSITY_G_CM3,
+    PART_COLUMNS,
+    estimate_printed_mass,
+)
+from flightlab.optimize import SAMPLERS, optimize_airframe
+from flightlab.power import (
+    AIRFRAME_COLUMNS,
+    AIRFRAME_RESULT_COLUMNS,
+    FLIGHT_TYPES,
+    battery_discharge_check,
+    battery_voltage_from_wingspan_cm,
+    esc_rating,
+    evaluate_airframes,
+    motor_efficiency_output,
+    motor_weight_from_power,
+    prop_pitch_speed,
+    read_airframe_csv,
+    recommend_power,
+    thrust_check,
+)
+from ui_common import (
+    ArrayTableModel,
+    CacheStatus,
+    ComputeJob,
+    apply_dark_theme,
+    cancel_export,
+    export_model_csv,
+    make_table_view,
+)
 
 # ----------------------------
 # Help content
@@ -120,6 +105,27 @@ HELP_HTML = """
   <li><b>Battery Safe</b>: Checks continuous discharge using 60% of C rating.</li>
 </ul>
 
+<h3>Airframe Tables</h3>
+<p><b>File &gt; Evaluate Airframe Table...</b> loads a CSV with one airframe per row and shows every
+input and output above for all rows at once (sortable, exportable). The header must name the columns
+<code>weight_kg, wingspan_cm, flight_type, efficiency_pct, pitch_cm, rpm, thrust_g, max_current_a,
+capacity_mah, c_rate</code>; flight_type is trainer, glider or aerobatic. The same table can be
+evaluated headless with <code>python -m flightlab power --airframes table.csv</code>.</p>
+
+<h3>Weight from STL Parts</h3>
+<p><b>Weight from STL Parts...</b> estimates the printed mass and centre of gravity of each STL part
+and of the assembly: walls of the given shell thickness plus the interior at the infill ratio, times
+the filament density. Add the non-printed mass (electronics, battery, servos) to get the all-up
+weight, which is filled into <b>Weight (kg)</b>; the status bar shows the recommended power and the
+thrust checks at that weight. Parts are assumed to be in millimetres and in one coordinate system.</p>
+
+<h3>Optimizer</h3>
+<p><b>Optimize...</b> searches for the lightest motor that still passes every thrust check and the
+battery check. Give each input a fixed value (Min only) or a Min/Max range. The box is sampled on a
+grid, uniformly at random or by Latin hypercube, then resampled around the best designs, which sit on
+the edge of the feasible region. The ranked feasible designs replace the results table. Large
+searches are split across all CPU cores. Headless: <code>python -m flightlab optimize --help</code>.</p>
+
 <h3>Assumptions and Limits</h3>
 <ul>
   <li>Rules-of-thumb; tune for your airframe, prop, and environment.</li>
@@ -149,20 +155,183 @@ class HelpDialog(QDialog):
         btns.accepted.connect(self.accept)
         v.addWidget(btns)
 
+# (column, label, line edit attribute on PlanePowerCalculator)
+OPTIMIZER_INPUTS = [
+    ("weight_kg", "Weight (kg)", "weight_kg"),
+    ("wingspan_cm", "Wingspan (cm)", "wingspan_cm"),
+    ("efficiency_pct", "Efficiency (%)", "efficiency_pct"),
+    ("pitch_cm", "Prop pitch (cm)", "pitch_cm"),
+    ("rpm", "RPM", "rpm"),
+    ("thrust_g", "Static thrust (g)", "thrust_g"),
+    ("max_current_a", "Max current (A)", "max_current_a"),
+    ("capacity_mah", "Capacity (mAh)", "batt_capacity_mah"),
+    ("c_rate", "C-rate", "c_rate"),
+]
+
+
+class OptimizeDialog(QDialog):
+    """Design-space bounds and search settings for optimize_airframe()."""
+
+    def __init__(self, values: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Optimize Design")
+        v = QVBoxLayout(self)
+        grid = QGridLayout()
+        grid.addWidget(QLabel("Min (or fixed)"), 0, 1)
+        grid.addWidget(QLabel("Max"), 0, 2)
+        self.edits = {}
+        for row, (name, label, _) in enumerate(OPTIMIZER_INPUTS, start=1):
+            lo, hi = QLineEdit(values.get(name, "")), QLineEdit()
+            hi.setPlaceholderText("fixed")
+            grid.addWidget(QLabel(label + ":"), row, 0)
+            grid.addWidget(lo, row, 1)
+            grid.addWidget(hi, row, 2)
+            self.edits[name] = (lo, hi)
+        v.addLayout(grid)
+
+        form = QFormLayout()
+        self.sampler = QComboBox()
+        self.sampler.addItems(SAMPLERS)
+        self.sampler.setCurrentText("lhs")
+        self.samples = QLineEdit("200000")
+        self.keep = QLineEdit("100")
+        self.seed = QLineEdit()
+        self.seed.setPlaceholderText("random")
+        form.addRow("Sampling:", self.sampler)
+        form.addRow("Samples:", self.samples)
+        form.addRow("Designs to keep:", self.keep)
+        form.addRow("Seed:", self.seed)
+        v.addLayout(form)
+
+        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        v.addWidget(btns)
+
+    def settings(self) -> dict:
+        """optimize_airframe() keyword arguments (bounds without flight_type)."""
+        bounds = {}
+        for name, label, _ in OPTIMIZER_INPUTS:
+            lo, hi = (e.text().strip() for e in self.edits[name])
+            try:
+                bounds[name] = (float(lo), float(hi)) if hi else float(lo)
+            except ValueError:
+                raise ValueError(f"{label} needs a number (and an optional max).")
+        try:
+            samples = int(self.samples.text())
+            keep = int(self.keep.text())
+            seed = int(self.seed.text()) if self.seed.text().strip() else None
+        except ValueError:
+            raise ValueError("Samples, designs to keep and seed must be integers.")
+        return dict(bounds=bounds, sampler=self.sampler.currentText(), samples=samples, keep=keep, seed=seed)
+
+
+class PartsMassDialog(QDialog):
+    """STL parts and print settings for estimate_printed_mass()."""
+
+    def __init__(self, settings: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Weight from STL Parts")
+        self.resize(520, 420)
+        v = QVBoxLayout(self)
+
+        self.parts = QListWidget()
+        self.parts.addItems(settings.get("paths", []))
+        v.addWidget(QLabel("Parts:"))
+        v.addWidget(self.parts, stretch=1)
+        row = QHBoxLayout()
+        add_btn = QPushButton("Add...")
+        add_btn.clicked.connect(self._add_parts)
+        remove_btn = QPushButton("Remove")
+        remove_btn.clicked.connect(lambda: [self.parts.takeItem(self.parts.row(i)) for i in self.parts.selectedItems()])
+        row.addWidget(add_btn)
+        row.addWidget(remove_btn)
+        row.addStretch(1)
+        v.addLayout(row)
+
+        form = QFormLayout()
+        self.material = QComboBox()
+        self.material.addItems(list(MATERIAL_DENSITY_G_CM3) + ["Custom"])
+        self.density = QLineEdit()
+        self.material.currentTextChanged.connect(self._on_material)
+        self.material.setCurrentText(settings.get("material", "PLA"))
+        self._on_material(self.material.currentText())
+        if "density_g_cm3" in settings:
+            self.density.setText(f"{settings['density_g_cm3']:g}")
+        self.shell = QLineEdit(f"{settings.get('shell_mm', DEFAULT_SHELL_MM):g}")
+        self.infill = QLineEdit(f"{settings.get('infill', DEFAULT_INFILL) * 100:g}")
+        self.extra = QLineEdit(f"{settings.get('extra_g', 0.0):g}")
+        self.extra.setToolTip("Electronics, battery, servos, spars... (g).")
+        form.addRow("Material:", self.material)
+        form.addRow("Density (g/cm³):", self.density)
+        form.addRow("Shell thickness (mm):", self.shell)
+        form.addRow("Infill (%):", self.infill)
+        form.addRow("Non-printed mass (g):", self.extra)
+        v.addLayout(form)
+
+        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        v.addWidget(btns)
+
+    def _add_parts(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "STL Parts", "", "STL Files (*.stl);;All Files (*)")
+        self.parts.addItems(paths)
+
+    def _on_material(self, name: str):
+        custom = name not in MATERIAL_DENSITY_G_CM3
+        self.density.setReadOnly(not custom)
+        if not custom:
+            self.density.setText(f"{MATERIAL_DENSITY_G_CM3[name]:g}")
+
+    def settings(self) -> dict:
+        paths = [self.parts.item(i).text() for i in range(self.parts.count())]
+        if not paths:
+            raise ValueError("Add at least one STL part.")
+        try:
+            density, shell, infill, extra = (
+                float(e.text()) for e in (self.density, self.shell, self.infill, self.extra)
+            )
+        except ValueError:
+            raise ValueError("Density, shell thickness, infill and non-printed mass must be numbers.")
+        if extra < 0:
+            raise ValueError("Non-printed mass must be non-negative.")
+        return dict(
+            paths=paths, material=self.material.currentText(), density_g_cm3=density,
+            shell_mm=shell, infill=infill / 100.0, extra_g=extra,
+        )
+
+
+def evaluate_airframe_file(path: str, mtime_ns: int, size: int):
+    """(table, results) for an airframe CSV; mtime/size key the result cache."""
+    table = read_airframe_csv(path)
+    return table, evaluate_airframes(table)
+
+
 class PlanePowerCalculator(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RC Plane Power System Estimator")
         self.resize(780, 520)
-        self._apply_dark_theme()
+        apply_dark_theme()
         self._build_menu()
         self._build_ui()
+        self.cache_status = CacheStatus(self)
 
     # Menu
     def _build_menu(self):
         menubar = self.menuBar()
 
         file_menu = menubar.addMenu("File")
+        table_action = QAction("Evaluate Airframe Table...", self)
+        table_action.triggered.connect(self._evaluate_table)
+        file_menu.addAction(table_action)
+        mass_action = QAction("Weight from STL Parts...", self)
+        mass_action.triggered.connect(self._weight_from_parts)
+        file_menu.addAction(mass_action)
+        optimize_action = QAction("Optimize Design...", self)
+        optimize_action.triggered.connect(self._optimize)
+        file_menu.addAction(optimize_action)
         export_action = QAction("Export Results to CSV...", self)
         export_action.triggered.connect(self._export_csv)
         file_menu.addAction(export_action)
@@ -259,11 +428,14 @@ class PlanePowerCalculator(QMainWindow):
         btn_row.setSpacing(6)
         self.calc_btn = QPushButton("Calculate")
         self.calc_btn.clicked.connect(self._on_calculate)
+        self.optimize_btn = QPushButton("Optimize...")
+        self.optimize_btn.clicked.connect(self._optimize)
         self.clear_btn = QPushButton("Clear")
         self.clear_btn.clicked.connect(self._on_clear)
         self.help_btn = QPushButton("Glossary")
         self.help_btn.clicked.connect(self._open_help)
         btn_row.addWidget(self.calc_btn)
+        btn_row.addWidget(self.optimize_btn)
         btn_row.addWidget(self.clear_btn)
         btn_row.addStretch(1)
         btn_row.addWidget(self.help_btn)
@@ -288,13 +460,8 @@ class PlanePowerCalculator(QMainWindow):
         header.setFont(small_bold)
         right.addWidget(header)
 
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Metric", "Value"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(False)
+        self.model = ArrayTableModel(["Metric", "Value"], right_align=(1,))
+        self.table = make_table_view(self.model)
         right.addWidget(self.table, stretch=1)
 
         tips = QLabel("ESC rating adds 20% margin. Battery check uses 60% of rated C for continuous load.")
@@ -316,7 +483,7 @@ class PlanePowerCalculator(QMainWindow):
 
     # Actions
     def _on_clear(self):
-        self.table.setRowCount(0)
+        self.model.clear()
         for w in [
             self.weight_kg, self.wingspan_cm, self.efficiency_pct, self.pitch_cm,
             self.rpm, self.thrust_g, self.max_current_a, self.batt_capacity_mah, self.c_rate
@@ -364,6 +531,138 @@ class PlanePowerCalculator(QMainWindow):
         except ValueError as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def _evaluate_table(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Airframe Table", "", "CSV Files (*.csv);;All Files (*)")
+        if not path:
+            return
+        try:
+            t0 = time.perf_counter()
+            st = os.stat(path)
+            table, results = self.cache_status.call(evaluate_airframe_file, path, st.st_mtime_ns, st.st_size)
+            elapsed = time.perf_counter() - t0
+        except (ValueError, OSError) as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self._show_airframes(table, results)
+        self.statusBar().showMessage(f"Evaluated {len(table['flight_type']):,} airframes in {elapsed:.2f} s.")
+
+    def _optimize(self):
+        job = getattr(self, "_optimize_job", None)
+        if job is not None and job.active:
+            QMessageBox.information(self, "Optimize", "A search is already running.")
+            return
+        values = {name: getattr(self, attr).text().strip() for name, _, attr in OPTIMIZER_INPUTS}
+        dlg = OptimizeDialog(values, self)
+        if dlg.exec() != QDialog.Accepted:
+            return
+        try:
+            kwargs = dlg.settings()
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        kwargs["bounds"]["flight_type"] = self.flight_type.currentText()
+        if kwargs["seed"] is not None or kwargs["sampler"] == "grid":
+            # Reproducible, so worth caching; the search shards to processes itself.
+            job = ComputeJob(self, self.cache_status.cache.call, optimize_airframe, **kwargs)
+        else:
+            job = ComputeJob(self, optimize_airframe, **kwargs)
+        job.finished.connect(self._on_optimized)
+        job.failed.connect(self._on_optimize_failed)
+        self._optimize_job = job
+        self.optimize_btn.setEnabled(False)
+        self.statusBar().showMessage(f"Optimizing ({kwargs['samples']:,} {kwargs['sampler']} samples)...")
+        job.start()
+
+    def _on_optimized(self, result, seconds: float):
+        self.optimize_btn.setEnabled(True)
+        self.cache_status.refresh()
+        if not len(result):
+            self.statusBar().showMessage(f"No feasible design in {result.evaluated:,} samples.")
+            return
+        self._show_airframes(result.designs)
+        self.statusBar().showMessage(
+            f"{len(result):,} best of {result.feasible:,} feasible / {result.evaluated:,} evaluated "
+            f"designs in {seconds:.2f} s (seed {result.seed})."
+        )
+
+    def _on_optimize_failed(self, message: str):
+        self.optimize_btn.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Optimize Error", message)
+
+    def _weight_from_parts(self):
+        job = getattr(self, "_mass_job", None)
+        if job is not None and job.active:
+            QMessageBox.information(self, "Weight from STL Parts", "An estimate is already running.")
+            return
+        dlg = PartsMassDialog(getattr(self, "_mass_settings", {}), self)
+        if dlg.exec() != QDialog.Accepted:
+            return
+        try:
+            settings = dlg.settings()
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self._mass_settings = settings
+        job = ComputeJob(
+            self, estimate_printed_mass, settings["paths"],
+            settings["density_g_cm3"], settings["shell_mm"], settings["infill"],
+        )
+        job.finished.connect(self._on_parts_mass)
+        job.failed.connect(self._on_parts_mass_failed)
+        self._mass_job = job
+        self.statusBar().showMessage(f"Estimating {len(settings['paths'])} part(s)...")
+        job.start()
+
+    def _on_parts_mass_failed(self, message: str):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Weight from STL Parts", message)
+
+    def _on_parts_mass(self, result, seconds: float):
+        extra_g = self._mass_settings["extra_g"]
+        thrust_txt = self.thrust_g.text().strip()
+        check = result.power_check(
+            self.flight_type.currentText(), float(thrust_txt) if thrust_txt else None, extra_g
+        )
+        self.weight_kg.setText(f"{check['weight_kg']:.3f}")
+
+        cg = result.cg_mm
+        cols = [np.append(result.parts[c], v) for c, v in zip(PART_COLUMNS, (
+            "Assembly", result.parts["triangles"].sum(), result.parts["volume_cm3"].sum(),
+            result.parts["shell_cm3"].sum(), result.parts["printed_cm3"].sum(), result.mass_g, *cg,
+        ))]
+        cols[0] = cols[0].astype(object)
+        self.model.set_columns(
+            cols,
+            headers=list(PART_COLUMNS),
+            formats=[None, "{:,}"] + ["{:.2f}"] * 7,
+            right_align=range(1, len(cols)),
+        )
+        thrust = "".join(
+            f", {k} {'OK' if check[k] else 'No'}" for k in ("hover", "takeoff", "climb") if k in check
+        )
+        self.statusBar().showMessage(
+            f"Printed {result.mass_g:.1f} g + {extra_g:g} g = {check['weight_kg']:.3f} kg, "
+            f"CG ({cg[0]:.1f}, {cg[1]:.1f}, {cg[2]:.1f}) mm; power {check['input_power_w']:.0f} W{thrust} "
+            f"[{seconds:.2f} s]"
+        )
+
+    def _show_airframes(self, table: dict, results: Optional[dict] = None):
+        # One row per airframe: inputs, then results (table may already hold both).
+        results = table if results is None else results
+        ok = lambda v: "OK" if v else "No"
+        names = np.array(FLIGHT_TYPES, dtype=object)
+        columns = [names[table[c].astype(np.intp)] if c == "flight_type" else table[c] for c in AIRFRAME_COLUMNS]
+        columns += [results[c] for c in AIRFRAME_RESULT_COLUMNS]
+        formats = ["{:g}"] * len(AIRFRAME_COLUMNS) + ["{:.1f}"] * 4 + ["{:.2f}"] + [ok] * 3 + ["{:.1f}", ok]
+        formats[AIRFRAME_COLUMNS.index("flight_type")] = None
+        self.model.set_columns(
+            columns,
+            headers=list(AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS),
+            formats=formats,
+            right_align=range(len(columns)),
+        )
+
     # Parsing helpers
     def _f(self, widget: QLineEdit, label: str) -> float:
         txt = widget.text().strip()
@@ -385,148 +684,22 @@ class PlanePowerCalculator(QMainWindow):
 
     # Results table
     def _populate(self, rows: List[tuple]):
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(rows))
-        for r, (k, v) in enumerate(rows):
-            k_item = QTableWidgetItem(k)
-            v_item = QTableWidgetItem(v)
-            v_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(r, 0, k_item)
-            self.table.setItem(r, 1, v_item)
-        self.table.resizeRowsToContents()
+        keys = np.array([k for k, _ in rows], dtype=object)
+        vals = np.array([v for _, v in rows], dtype=object)
+        self.model.set_columns([keys, vals], headers=["Metric", "Value"], formats=[None, None], right_align=(1,))
 
     # Export
     def _export_csv(self):
-        if self.table.rowCount() == 0:
-            QMessageBox.information(self, "Export", "No results to export.")
-            return
-        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "plane_power_results.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            lines = ["Metric,Value"]
-            for r in range(self.table.rowCount()):
-                k = self.table.item(r, 0).text() if self.table.item(r, 0) else ""
-                v = self.table.item(r, 1).text() if self.table.item(r, 1) else ""
-                # Basic CSV escaping
-                k = '"' + k.replace('"', '""') + '"'
-                v = '"' + v.replace('"', '""') + '"'
-                lines.append(f"{k},{v}")
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            self.statusBar().showMessage(f"Exported to {path}", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {e}")
+        export_model_csv(self, self.model, "plane_power_results.csv")
+
+    def closeEvent(self, event):
+        cancel_export(self)
+        super().closeEvent(event)
 
     # Help
     def _open_help(self):
         HelpDialog(self).exec()
 
-    # Theme
-    def _apply_dark_theme(self):
-        base_font = QFont("Arial", 10)
-        QApplication.instance().setFont(base_font)
-
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#121212"))
-        palette.setColor(QPalette.WindowText, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Base, QColor("#1a1a1a"))
-        palette.setColor(QPalette.AlternateBase, QColor("#171717"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#2a2a2a"))
-        palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Button, QColor("#232323"))
-        palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
-        palette.setColor(QPalette.Highlight, QColor("#0a84ff"))
-        palette.setColor(QPalette.HighlightedText, QColor("#000000"))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #dcdcdc;
-                font-family: Arial;
-                font-size: 10pt;
-            }
-            QGroupBox {
-                border: 1px solid #2b2b2b;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 2px;
-                font-size: 10pt;
-            }
-            QLineEdit {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 4px 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0a84ff;
-            }
-            QComboBox {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 3px 6px;
-                font-size: 10pt;
-            }
-            QPushButton {
-                background-color: #0a84ff;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-height: 26px;
-            }
-            QPushButton:hover { background-color: #2b95ff; }
-            QPushButton:pressed { background-color: #086ed6; }
-            QTableWidget {
-                gridline-color: #2a2a2a;
-                background-color: #161616;
-                alternate-background-color: #141414;
-                color: #dcdcdc;
-                selection-background-color: #0a84ff;
-                selection-color: #000000;
-                border: 1px solid #2a2a2a;
-                border-radius: 6px;
-                font-size: 10pt;
-            }
-            QHeaderView::section {
-                background-color: #1c1c1c;
-                color: #dcdcdc;
-                padding: 4px 6px;
-                border: 0px;
-                border-right: 1px solid #2a2a2a;
-                font-size: 10pt;
-            }
-            QSplitter::handle { background: #1b1b1b; }
-            QLabel#tips {
-                color: #a0a0a0;
-                padding: 4px 0;
-                font-size: 9pt;
-            }
-            QTextBrowser {
-                background-color: #1a1a1a;
-                color: #e6e6e6;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            """
-        )
 
 # ----------------------------
 # Entrypoint
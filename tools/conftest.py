@@ -0,0 +1 @@
+"""pytest root: keeps tools/ on sys.path so tests import flightlab as the tools do."""
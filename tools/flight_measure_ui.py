@@ -1,10 +1,14 @@
+import os
 import sys
+import tempfile
 import time
 import random
-from typing import List, Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from PySide6.QtCore import Qt, QRegularExpression, QTimer
-from PySide6.QtGui import QAction, QColor, QFont, QPalette, QRegularExpressionValidator
+from PySide6.QtGui import QAction, QFont, QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -15,9 +19,6 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
     QMessageBox,
     QFileDialog,
     QSplitter,
@@ -26,7 +27,38 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QTextBrowser,
     QCheckBox,
+    QComboBox,
+)
+
+from flightlab.battery import (
+    ETA_SENTINEL_MIN,
+    RECORD_COLUMNS,
+    DischargeSimulation,
+    coulomb_step,
+    effective_capacity,
+    integrate_samples,
 )
+from flightlab.ringbuffer import RingBuffer
+from flightlab.telemetry import CurrentSource, ReplaySource, open_source
+from ui_common import RingTableModel, apply_dark_theme, cancel_export, export_model_csv, make_table_view
+
+
+# Max wall time spent stepping per timer tick in simulated-clock mode.
+SIM_FRAME_BUDGET_S = 0.02
+# Rows kept in memory (and in the table); older rows are dropped or spilled.
+DEFAULT_HISTORY_ROWS = 100_000
+# Telemetry sources are drained and integrated in batches at this period.
+TELEMETRY_POLL_MS = 50
+# Upper bound on samples integrated per poll, so a backlog cannot stall the UI.
+TELEMETRY_MAX_BATCH = 20_000
+
+# Current source key -> combo label; "random" is the built-in simulator.
+CURRENT_SOURCES = {
+    "random": "Random (simulated)",
+    "replay": "Replay log file",
+    "udp": "UDP telemetry",
+    "serial": "Serial telemetry",
+}
 
 
 HELP_HTML = """
@@ -53,23 +85,50 @@ HELP_HTML = """
     <ul><li>If current <= 0.1 A, estimate is set to a large sentinel value.</li></ul>
   </li>
 </ul>
+<h3>Simulated clock</h3>
+<ul>
+  <li>When enabled, each step advances time by exactly the sampling interval instead of following the wall clock.</li>
+  <li><b>Speed (x)</b>: Simulated seconds per real second. 0 runs as fast as possible.</li>
+  <li><b>Seed</b>: Fixes the random current sequence. The same inputs and seed always give identical results.</li>
+</ul>
+<h3>Current source</h3>
+<ul>
+  <li><b>Random</b>: Current drawn uniformly from [min, max] (wall or simulated clock).</li>
+  <li><b>Replay log file</b>: Plays a CSV log of time (s), current (A) rows, e.g. an export of this tool. <b>Speed (x)</b> sets the playback rate; 0 replays as fast as possible.</li>
+  <li><b>UDP</b>: Address <code>port</code> or <code>host:port</code>. <b>Serial</b>: <code>device</code> or <code>device:baud</code> (requires pyserial).</li>
+  <li>Telemetry frames carry one sample per line, either <code>current</code> or <code>t,current</code>. Samples without a timestamp are stamped on arrival.</li>
+  <li>Samples are read on a background thread and integrated in batches, so fast streams do not block the window.</li>
+</ul>
+<h3>History</h3>
+<ul>
+  <li><b>History (rows)</b>: Rows kept in memory and shown in the table. Older rows are dropped, so long runs use constant memory.</li>
+  <li><b>Spill old rows to disk</b>: Dropped rows are written to a temporary file and included in CSV exports.</li>
+</ul>
 <h3>Termination</h3>
 <ul>
   <li>Stops when simulation duration is reached or effective capacity is depleted.</li>
 </ul>
 <h3>Notes</h3>
 <ul>
-  <li>Random current is a stand-in for real telemetry.</li>
+  <li>Random current is a stand-in for real telemetry; pick a telemetry or replay source to integrate measured current instead.</li>
   <li>Coulomb counting accumulates error without calibration; real systems often fuse voltage, current, and state models.</li>
 </ul>
 <p style="color:#aaaaaa; font-size:90%;">This tool is a simplified simulator for educational and sizing purposes.</p>
 """
 
 
+def _fmt_eta(eta: float) -> str:
+    return "--" if eta >= 9999 else f"{eta:0.1f}"
+
+
 def _val_float_nonneg() -> QRegularExpressionValidator:
     return QRegularExpressionValidator(QRegularExpression(r"^\s*(\d+(\.\d+)?)\s*$"))
 
 
+def _val_int_nonneg() -> QRegularExpressionValidator:
+    return QRegularExpressionValidator(QRegularExpression(r"^\s*\d*\s*$"))
+
+
 class HelpDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -91,9 +150,8 @@ class BatterySimWindow(QMainWindow):
         self.setWindowTitle("Battery Monitor Simulator")
         self.resize(820, 540)
 
-        self._apply_dark_theme()
-        self._build_menu()
-        self._build_ui()
+        # (t, I, consumed, remaining, eta_min) rows; bounded, see _new_records()
+        self.records = RingBuffer(DEFAULT_HISTORY_ROWS, len(RECORD_COLUMNS))
 
         # Simulation state
         self.timer = QTimer(self)
@@ -104,7 +162,17 @@ class BatterySimWindow(QMainWindow):
         self.total_elapsed_s = 0.0
         self.consumed_mAh = 0.0
         self.effective_capacity_mAh = 0.0
-        self.records: List[Tuple[float, float, float, float, float]] = []  # (t, I, consumed, remaining, eta_min)
+        self.sim: Optional[DischargeSimulation] = None  # set in simulated-clock mode
+        self.source: Optional[CurrentSource] = None  # set for telemetry/replay sources
+        self._source_t = 0.0  # timestamp of the last integrated sample
+        self._source_resync = False
+        self.sim_speed = 0.0
+        self._pace_wall0 = 0.0
+        self._pace_step0 = 0
+
+        apply_dark_theme()
+        self._build_menu()
+        self._build_ui()
 
     # Menu
     def _build_menu(self):
@@ -172,12 +240,57 @@ class BatterySimWindow(QMainWindow):
         self.i_max_a.setValidator(_val_float_nonneg())
         self.i_max_a.setToolTip("Maximum current draw (A).")
 
+        self.source_kind = QComboBox()
+        for key, label in CURRENT_SOURCES.items():
+            self.source_kind.addItem(label, key)
+        self.source_kind.setToolTip("Where current samples come from.")
+        self.source_kind.currentIndexChanged.connect(self._on_source_changed)
+
+        self.source_addr = QLineEdit()
+        self.source_addr.setToolTip("Log file, UDP port/host:port, or serial device[:baud].")
+        self.browse_btn = QPushButton("...")
+        self.browse_btn.setToolTip("Choose a log file to replay.")
+        self.browse_btn.clicked.connect(self._browse_log)
+        addr_row = QHBoxLayout()
+        addr_row.setSpacing(4)
+        addr_row.addWidget(self.source_addr, stretch=1)
+        addr_row.addWidget(self.browse_btn)
+
+        self.sim_clock = QCheckBox("Simulated clock")
+        self.sim_clock.setToolTip("Advance time by the sampling interval per step instead of real time.")
+        self.sim_clock.toggled.connect(self._on_sim_clock_toggled)
+
+        self.speed_x = QLineEdit()
+        self.speed_x.setPlaceholderText("0 = as fast as possible")
+        self.speed_x.setValidator(_val_float_nonneg())
+        self.speed_x.setToolTip("Simulated seconds per real second. 0 runs as fast as possible.")
+
+        self.seed = QLineEdit()
+        self.seed.setPlaceholderText("e.g. 42 (optional)")
+        self.seed.setValidator(_val_int_nonneg())
+        self.seed.setToolTip("Random seed for the current draw. Same seed, same results.")
+
+        self.history_rows = QLineEdit()
+        self.history_rows.setPlaceholderText(f"e.g. {DEFAULT_HISTORY_ROWS}")
+        self.history_rows.setValidator(_val_int_nonneg())
+        self.history_rows.setToolTip("Rows kept in memory and shown in the table. Older rows are dropped.")
+
+        self.spill = QCheckBox("Spill old rows to disk")
+        self.spill.setToolTip("Write rows that leave the history to a temporary file so exports stay complete.")
+
         form.addRow("Capacity (mAh):", self.capacity_mAh)
         form.addRow("", self.use_80)
         form.addRow("Sampling (s):", self.sampling_s)
         form.addRow("Duration (s):", self.duration_s)
+        form.addRow("Current source:", self.source_kind)
+        form.addRow("Address:", addr_row)
         form.addRow("Current min (A):", self.i_min_a)
         form.addRow("Current max (A):", self.i_max_a)
+        form.addRow("", self.sim_clock)
+        form.addRow("Speed (x):", self.speed_x)
+        form.addRow("Seed:", self.seed)
+        form.addRow("History (rows):", self.history_rows)
+        form.addRow("", self.spill)
 
         btn_row = QHBoxLayout()
         btn_row.setSpacing(6)
@@ -234,14 +347,13 @@ class BatterySimWindow(QMainWindow):
         status_row.addStretch(1)
         right.addLayout(status_row)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            ["Time (s)", "Current (A)", "Consumed (mAh)", "Remaining (mAh)", "Est. Flight (min)"]
+        self.model = RingTableModel(
+            self.records,
+            list(RECORD_COLUMNS),
+            formats=["{:0.1f}", "{:0.2f}", "{:0.1f}", "{:0.1f}", _fmt_eta],
+            right_align=(1, 2, 3, 4),
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(False)
+        self.table = make_table_view(self.model)
         right.addWidget(self.table, stretch=1)
 
         tips = QLabel("Coulomb counting with 80% capacity option; stops on duration or depletion.")
@@ -259,6 +371,9 @@ class BatterySimWindow(QMainWindow):
         self.duration_s.setText("120")
         self.i_min_a.setText("2.0")
         self.i_max_a.setText("10.0")
+        self.speed_x.setText("0")
+        self.history_rows.setText(str(DEFAULT_HISTORY_ROWS))
+        self._on_source_changed(0)
 
     # Actions
     def _on_start(self):
@@ -270,16 +385,29 @@ class BatterySimWindow(QMainWindow):
             i_max = self._f(self.i_max_a, "Current max (A)")
             if i_max < i_min:
                 raise ValueError("Current max (A) must be >= Current min (A).")
+            history = int(self._f(self.history_rows, "History (rows)"))
+            if history < 1:
+                raise ValueError("History (rows) must be >= 1.")
         except ValueError as e:
             QMessageBox.critical(self, "Error", str(e))
             return
 
-        self.effective_capacity_mAh = cap * (0.8 if self.use_80.isChecked() else 1.0)
+        self.effective_capacity_mAh = effective_capacity(cap, self.use_80.isChecked())
         self.sampling_interval_s = samp
         self.sim_duration_s = dur
         self.i_min = i_min
         self.i_max = i_max
 
+        if self._source_key() != "random":
+            self._start_source(history)
+            return
+
+        if self.sim_clock.isChecked():
+            if self.sim is None:
+                self._new_records(history)
+            self._start_sim_clock()
+            return
+
         now = time.time()
         if not self.running:
             # fresh start or resume
@@ -289,8 +417,7 @@ class BatterySimWindow(QMainWindow):
                 self.last_time = now
                 self.total_elapsed_s = 0.0
                 self.consumed_mAh = 0.0
-                self.records.clear()
-                self.table.setRowCount(0)
+                self._new_records(history)
             else:
                 # resume from pause
                 self.last_time = now
@@ -301,11 +428,64 @@ class BatterySimWindow(QMainWindow):
         self.running = True
         self.timer.start(int(self.sampling_interval_s * 1000))
 
+    def _start_sim_clock(self):
+        try:
+            speed = self._f(self.speed_x, "Speed (x)") if self.speed_x.text().strip() else 0.0
+            seed_txt = self.seed.text().strip()
+            seed = int(seed_txt) if seed_txt else None
+            if self.sim is None:
+                self.sim = DischargeSimulation(
+                    self.effective_capacity_mAh, self.sampling_interval_s, self.sim_duration_s,
+                    self.i_min, self.i_max, seed,
+                )
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+
+        self.sim_speed = speed
+        self._pace_wall0 = time.perf_counter()
+        self._pace_step0 = self.sim.steps
+        self._set_inputs_enabled(False)
+        self.start_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.running = True
+        interval_ms = 0 if speed <= 0 else max(1, int(self.sampling_interval_s * 1000.0 / speed))
+        self.timer.start(interval_ms)
+
+    def _start_source(self, history: int):
+        try:
+            speed = self._f(self.speed_x, "Speed (x)") if self.speed_x.text().strip() else 0.0
+            if self.source is None:
+                source = open_source(self._source_key(), self.source_addr.text(), speed)
+                self._new_records(history)
+                self.consumed_mAh = 0.0
+                self.total_elapsed_s = 0.0
+                self._source_t = 0.0
+                self._source_resync = False
+                self.source = source
+            else:
+                # Live streams keep running while paused; skip the gap.
+                self._source_resync = not isinstance(self.source, ReplaySource)
+            if isinstance(self.source, ReplaySource):
+                self.source.speed = speed
+            self.source.start()
+        except (ValueError, OSError) as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+
+        self._set_inputs_enabled(False)
+        self.start_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.running = True
+        self.timer.start(TELEMETRY_POLL_MS)
+
     def _on_pause(self):
         if not self.running:
             return
         self.running = False
         self.timer.stop()
+        if self.source is not None:
+            self.source.stop()
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self._set_inputs_enabled(True)
@@ -317,8 +497,13 @@ class BatterySimWindow(QMainWindow):
         self.last_time = 0.0
         self.total_elapsed_s = 0.0
         self.consumed_mAh = 0.0
-        self.records.clear()
-        self.table.setRowCount(0)
+        self.sim = None
+        if self.source is not None:
+            self.source.stop()
+            self.source = None
+        self._close_records()
+        self.records = RingBuffer(self.records.capacity, len(RECORD_COLUMNS))
+        self.model.set_ring(self.records)
         self.status_time.setText("t: 0.0 s")
         self.status_current.setText("I: 0.00 A")
         self.status_consumed.setText("Used: 0.0 mAh")
@@ -330,6 +515,13 @@ class BatterySimWindow(QMainWindow):
         self.statusBar().clearMessage()
 
     def _on_tick(self):
+        if self.sim is not None:
+            self._on_sim_tick()
+            return
+        if self.source is not None:
+            self._on_source_tick()
+            return
+
         now = time.time()
         elapsed_s = now - self.last_time
         self.total_elapsed_s = now - self.start_time
@@ -346,32 +538,18 @@ class BatterySimWindow(QMainWindow):
         # 1) random current
         current_A = random.uniform(self.i_min, self.i_max)
 
-        # 2) elapsed hours
-        elapsed_h = elapsed_s / 3600.0
-
-        # 3) mAh used in this interval
-        used_mAh = current_A * elapsed_h * 1000.0
-
-        # 4) update totals
-        self.consumed_mAh += used_mAh
-        remaining_mAh = max(self.effective_capacity_mAh - self.consumed_mAh, 0.0)
-
-        # 5) ETA
-        if current_A > 0.1:
-            flight_time_left_h = (remaining_mAh / 1000.0) / current_A
-            flight_time_left_min = flight_time_left_h * 60.0
-        else:
-            flight_time_left_min = 9999.0
+        # 2-5) integrate the interval, update totals and ETA
+        self.consumed_mAh, remaining_mAh, flight_time_left_min = coulomb_step(
+            self.consumed_mAh, current_A, elapsed_s, self.effective_capacity_mAh
+        )
 
         # 6) append row
-        self._append_row(self.total_elapsed_s, current_A, self.consumed_mAh, remaining_mAh, flight_time_left_min)
+        rec = (self.total_elapsed_s, current_A, self.consumed_mAh, remaining_mAh, flight_time_left_min)
+        self.records.append(rec)
+        self._show_new_rows()
 
         # 7) status labels
-        self.status_time.setText(f"t: {self.total_elapsed_s:0.1f} s")
-        self.status_current.setText(f"I: {current_A:0.2f} A")
-        self.status_consumed.setText(f"Used: {self.consumed_mAh:0.1f} mAh")
-        self.status_remaining.setText(f"Rem: {remaining_mAh:0.1f} mAh")
-        self.status_eta.setText(f"ETA: {flight_time_left_min:0.1f} min" if flight_time_left_min < 9999 else "ETA: -- min")
+        self._show_status(rec)
 
         # 8) depletion stop
         if remaining_mAh <= 0.0:
@@ -381,16 +559,109 @@ class BatterySimWindow(QMainWindow):
 
         self.last_time = now
 
+    def _on_sim_tick(self):
+        # Take every step that is due at the requested speed (all of them
+        # within the frame budget when running flat out), then update the UI
+        # once for the whole batch.
+        sim = self.sim
+        if self.sim_speed > 0:
+            elapsed = time.perf_counter() - self._pace_wall0
+            due = self._pace_step0 + int(elapsed * self.sim_speed / sim.sampling_interval_s)
+        else:
+            due = None
+        deadline = time.perf_counter() + SIM_FRAME_BUDGET_S
+        batch = []
+        while due is None or sim.steps < due:
+            rec = sim.step()
+            if rec is None:
+                break
+            batch.append(rec)
+            if len(batch) % 256 == 0 and time.perf_counter() >= deadline:
+                break
+
+        if batch:
+            self.records.extend(batch)
+            self._show_new_rows()
+            self.consumed_mAh = sim.consumed_mAh
+            self.total_elapsed_s = sim.time_s
+            self._show_status(batch[-1])
+
+        if sim.finished == "duration":
+            self.statusBar().showMessage("Reached simulation duration.")
+            self._on_pause()
+        elif sim.finished == "depleted":
+            self.statusBar().showMessage("Battery effectively depleted.")
+            self._on_pause()
+
+    def _on_source_tick(self):
+        # Integrate everything that arrived since the last poll in one batch.
+        src = self.source
+        samples = src.read(TELEMETRY_MAX_BATCH)
+        if len(samples):
+            if self._source_resync:
+                self._source_t = samples[0, 0]
+                self._source_resync = False
+            recs = integrate_samples(
+                self.consumed_mAh, self._source_t, samples[:, 0], samples[:, 1], self.effective_capacity_mAh
+            )
+            stop = None
+            n = len(recs)
+            late = np.flatnonzero(recs[:, 0] >= self.sim_duration_s)
+            if late.size:
+                n, stop = int(late[0]), "Reached simulation duration."
+            empty = np.flatnonzero(recs[:n, 3] <= 0.0)
+            if empty.size:
+                n, stop = int(empty[0]) + 1, "Battery effectively depleted."
+            if n:
+                self.records.extend(recs[:n])
+                self._show_new_rows()
+                last = recs[n - 1]
+                self.consumed_mAh = float(last[2])
+                self._source_t = self.total_elapsed_s = float(last[0])
+                self._show_status(tuple(last))
+            if stop:
+                self.statusBar().showMessage(stop)
+                self._on_pause()
+                return
+
+        if src.error:
+            self.statusBar().showMessage(f"Telemetry error: {src.error}")
+            self._on_pause()
+        elif src.finished:
+            self.statusBar().showMessage("Replay finished.")
+            self._on_pause()
+
     # Helpers
-    def _append_row(self, t: float, i: float, used: float, rem: float, eta: float):
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        vals = [f"{t:0.1f}", f"{i:0.2f}", f"{used:0.1f}", f"{rem:0.1f}", ("--" if eta >= 9999 else f"{eta:0.1f}")]
-        for c, v in enumerate(vals):
-            item = QTableWidgetItem(v)
-            if c >= 1:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(r, c, item)
+    def _show_status(self, rec: Tuple[float, float, float, float, float]):
+        t, current_A, consumed, remaining_mAh, eta = rec
+        self.status_time.setText(f"t: {t:0.1f} s")
+        self.status_current.setText(f"I: {current_A:0.2f} A")
+        self.status_consumed.setText(f"Used: {consumed:0.1f} mAh")
+        self.status_remaining.setText(f"Rem: {remaining_mAh:0.1f} mAh")
+        self.status_eta.setText(f"ETA: {eta:0.1f} min" if eta < ETA_SENTINEL_MIN else "ETA: -- min")
+
+    def _new_records(self, capacity: int):
+        path = None
+        if self.spill.isChecked():
+            fd, path = tempfile.mkstemp(prefix="battery_sim_", suffix=".bin")
+            os.close(fd)
+        self._close_records()
+        self.records = RingBuffer(capacity, len(RECORD_COLUMNS), spill_path=path)
+        self.model.set_ring(self.records)
+        if path:
+            self.statusBar().showMessage(f"Spilling old rows to {path}", 4000)
+
+    def _close_records(self):
+        """Close the history and delete its spill file, if any."""
+        self.records.close()
+        if self.records.spill_path:
+            try:
+                os.remove(self.records.spill_path)
+            except OSError:
+                pass
+
+    def _show_new_rows(self):
+        self.model.sync()
         self.table.scrollToBottom()
 
     def _f(self, widget: QLineEdit, label: str) -> float:
@@ -408,136 +679,56 @@ class BatterySimWindow(QMainWindow):
     def _set_inputs_enabled(self, enabled: bool):
         for w in (self.capacity_mAh, self.sampling_s, self.duration_s, self.i_min_a, self.i_max_a, self.use_80):
             w.setEnabled(enabled)
+        # Clock mode, seed and history settings can only change before a run starts.
+        fresh = self.sim is None and self.start_time == 0.0 and self.source is None
+        random_src = self._source_key() == "random"
+        sim = random_src and self.sim_clock.isChecked()
+        for w in (self.source_kind, self.history_rows, self.spill):
+            w.setEnabled(enabled and fresh)
+        self.source_addr.setEnabled(enabled and fresh and not random_src)
+        self.browse_btn.setEnabled(enabled and fresh and self._source_key() == "replay")
+        self.i_min_a.setEnabled(enabled and random_src)
+        self.i_max_a.setEnabled(enabled and random_src)
+        self.sim_clock.setEnabled(enabled and fresh and random_src)
+        self.seed.setEnabled(enabled and fresh and sim)
+        self.speed_x.setEnabled(enabled and (sim or self._source_key() == "replay"))
+
+    def _on_sim_clock_toggled(self, checked: bool):
+        self._set_inputs_enabled(True)
+
+    def _on_source_changed(self, _index: int):
+        placeholders = {
+            "random": "",
+            "replay": "path/to/log.csv",
+            "udp": "e.g. 5005 or 0.0.0.0:5005",
+            "serial": "e.g. /dev/ttyUSB0:115200 or COM3",
+        }
+        self.source_addr.setPlaceholderText(placeholders[self._source_key()])
+        self._set_inputs_enabled(True)
+
+    def _source_key(self) -> str:
+        return self.source_kind.currentData()
+
+    def _browse_log(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Replay Log", "", "CSV Files (*.csv);;All Files (*)")
+        if path:
+            self.source_addr.setText(path)
 
     # Export
     def _export_csv(self):
-        if self.table.rowCount() == 0:
-            QMessageBox.information(self, "Export", "No results to export.")
-            return
-        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "battery_sim_results.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-            lines = [",".join(headers)]
-            for r in range(self.table.rowCount()):
-                row = []
-                for c in range(self.table.columnCount()):
-                    item = self.table.item(r, c)
-                    txt = "" if item is None else item.text()
-                    row.append('"' + txt.replace('"', '""') + '"')
-                lines.append(",".join(row))
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            self.statusBar().showMessage(f"Exported to {path}", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {e}")
+        export_model_csv(self, self.model, "battery_sim_results.csv")
+
+    def closeEvent(self, event):
+        cancel_export(self)
+        if self.source is not None:
+            self.source.stop()
+        self._close_records()
+        super().closeEvent(event)
 
     # Help
     def _open_help(self):
         HelpDialog(self).exec()
 
-    # Theme
-    def _apply_dark_theme(self):
-        base_font = QFont("Arial", 10)
-        QApplication.instance().setFont(base_font)
-
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#121212"))
-        palette.setColor(QPalette.WindowText, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Base, QColor("#1a1a1a"))
-        palette.setColor(QPalette.AlternateBase, QColor("#171717"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#2a2a2a"))
-        palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Button, QColor("#232323"))
-        palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
-        palette.setColor(QPalette.Highlight, QColor("#0a84ff"))
-        palette.setColor(QPalette.HighlightedText, QColor("#000000"))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #dcdcdc;
-                font-family: Arial;
-                font-size: 10pt;
-            }
-            QGroupBox {
-                border: 1px solid #2b2b2b;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 2px;
-                font-size: 10pt;
-            }
-            QLineEdit {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 4px 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0a84ff;
-            }
-            QCheckBox {
-                spacing: 6px;
-            }
-            QPushButton {
-                background-color: #0a84ff;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-height: 26px;
-            }
-            QPushButton:hover { background-color: #2b95ff; }
-            QPushButton:pressed { background-color: #086ed6; }
-            QTableWidget {
-                gridline-color: #2a2a2a;
-                background-color: #161616;
-                alternate-background-color: #141414;
-                color: #dcdcdc;
-                selection-background-color: #0a84ff;
-                selection-color: #000000;
-                border: 1px solid #2a2a2a;
-                border-radius: 6px;
-                font-size: 10pt;
-            }
-            QHeaderView::section {
-                background-color: #1c1c1c;
-                color: #dcdcdc;
-                padding: 4px 6px;
-                border: 0px;
-                border-right: 1px solid #2a2a2a;
-                font-size: 10pt;
-            }
-            QSplitter::handle { background: #1b1b1b; }
-            QLabel#tips {
-                color: #a0a0a0;
-                padding: 4px 0;
-                font-size: 9pt;
-            }
-            QTextBrowser {
-                background-color: #1a1a1a;
-                color: #e6e6e6;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            """
-        )
-
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
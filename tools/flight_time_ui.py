@@ -1,12 +1,14 @@
 import sys
+import time
+
+_IMPORT_T0 = time.perf_counter()  # for --startup-time
+
 from typing import List, Tuple
 
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
 from PySide6.QtCore import Qt, QRegularExpression
-from PySide6.QtGui import QAction, QColor, QFont, QPalette, QRegularExpressionValidator
+from PySide6.QtGui import QAction, QFont, QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -17,9 +19,6 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
     QMessageBox,
     QFileDialog,
     QSplitter,
@@ -30,25 +29,21 @@ from PySide6.QtWidgets import (
     QCheckBox,
 )
 
-
-# ----------------------------
-# Domain logic
-# ----------------------------
-
-def calculate_flight_time(capacity_mAh: float, avg_current_A: float, use_80_percent: bool = True) -> float:
-    """Returns flight time in minutes."""
-    capacity_Ah = capacity_mAh / 1000.0
-    if use_80_percent:
-        capacity_Ah *= 0.8
-    return (capacity_Ah / max(avg_current_A, 1e-9)) * 60.0
-
-
-def series_flight_time_vs_capacity(capacities: np.ndarray, current_A: float, use_80_percent: bool = True) -> np.ndarray:
-    return np.array([calculate_flight_time(c, current_A, use_80_percent) for c in capacities])
-
-
-def series_flight_time_vs_current(currents: np.ndarray, capacity_mAh: float, use_80_percent: bool = True) -> np.ndarray:
-    return np.array([calculate_flight_time(capacity_mAh, i, use_80_percent) for i in currents])
+from flightlab.flight_time import (
+    calculate_flight_time,
+    flight_time_grid,
+    series_flight_time_vs_capacity,
+    series_flight_time_vs_current,
+)
+from ui_common import (
+    ArrayTableModel,
+    CacheStatus,
+    StartupProbe,
+    apply_dark_theme,
+    cancel_export,
+    export_model_csv,
+    make_table_view,
+)
 
 
 # ----------------------------
@@ -69,6 +64,7 @@ HELP_HTML = """
 <ul>
   <li><b>Flight time vs. Capacity</b>: Fix current, sweep capacity. Shows benefit of larger packs with 80% cap applied.</li>
   <li><b>Flight time vs. Current</b>: Fix capacity, sweep current. Shows the penalty of higher draw.</li>
+  <li><b>Time Map</b>: Sweep both ranges at once. Heatmap with contour lines of flight time; the table lists an evenly sampled subset of the grid.</li>
 </ul>
 <h3>Notes</h3>
 <ul>
@@ -112,23 +108,14 @@ class HelpDialog(QDialog):
 
 
 # ----------------------------
-# Matplotlib canvas (dark)
+# Plot limits
 # ----------------------------
 
-class MplCanvas(FigureCanvas):
-    def __init__(self):
-        fig = Figure(figsize=(5, 4), dpi=100, facecolor="#121212")
-        self.ax = fig.add_subplot(111)
-        # Dark theme for axes
-        self.ax.set_facecolor("#161616")
-        self.ax.grid(True, alpha=0.25)
-        for spine in self.ax.spines.values():
-            spine.set_color("#aaaaaa")
-        self.ax.tick_params(colors="#dddddd")
-        self.ax.title.set_color("#dddddd")
-        self.ax.xaxis.label.set_color("#dddddd")
-        self.ax.yaxis.label.set_color("#dddddd")
-        super().__init__(fig)
+MAX_MARKER_POINTS = 200
+MAP_MAX_CELLS = 800       # heatmap cells drawn per axis
+MAP_CONTOUR_CELLS = 200   # contour input cells per axis
+MAP_TABLE_ROWS = 25
+MAP_TABLE_COLS = 8
 
 
 # ----------------------------
@@ -141,9 +128,10 @@ class FlightTimeEstimator(QMainWindow):
         self.setWindowTitle("Flight Time Estimator")
         self.resize(980, 560)
 
-        self._apply_dark_theme()
+        apply_dark_theme()
         self._build_menu()
         self._build_ui()
+        self.cache_status = CacheStatus(self)
 
     # Menu
     def _build_menu(self):
@@ -235,6 +223,9 @@ class FlightTimeEstimator(QMainWindow):
         self.plot_cap_btn.clicked.connect(self._on_plot_vs_capacity)
         self.plot_cur_btn = QPushButton("Plot: Time vs Current")
         self.plot_cur_btn.clicked.connect(self._on_plot_vs_current)
+        self.plot_map_btn = QPushButton("Plot: Time Map")
+        self.plot_map_btn.setToolTip("Heatmap of flight time over the capacity and current ranges.")
+        self.plot_map_btn.clicked.connect(self._on_plot_map)
         self.save_fig_btn = QPushButton("Save Figure...")
         self.save_fig_btn.clicked.connect(self._on_save_figure)
         self.help_btn = QPushButton("Glossary")
@@ -242,17 +233,21 @@ class FlightTimeEstimator(QMainWindow):
 
         btn_row.addWidget(self.calc_btn)
         btn_row.addStretch(1)
-        btn_row.addWidget(self.plot_cap_btn)
-        btn_row.addWidget(self.plot_cur_btn)
-        btn_row.addStretch(1)
         btn_row.addWidget(self.save_fig_btn)
         btn_row.addWidget(self.help_btn)
 
+        plot_row = QHBoxLayout()
+        plot_row.setSpacing(6)
+        plot_row.addWidget(self.plot_cap_btn)
+        plot_row.addWidget(self.plot_cur_btn)
+        plot_row.addWidget(self.plot_map_btn)
+
         left_box = QVBoxLayout()
         left_box.setContentsMargins(0, 0, 0, 0)
         left_box.setSpacing(6)
         left_box.addWidget(inputs_group)
         left_box.addLayout(btn_row)
+        left_box.addLayout(plot_row)
         leftw = QWidget()
         leftw.setLayout(left_box)
         splitter.addWidget(leftw)
@@ -268,18 +263,20 @@ class FlightTimeEstimator(QMainWindow):
         header.setFont(small_bold)
         right.addWidget(header)
 
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Metric", "Value"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(False)
+        self.model = ArrayTableModel(["Metric", "Value"], right_align=(1,))
+        self.table = make_table_view(self.model)
         right.addWidget(self.table)
 
-        # Chart canvas
-        self.canvas = MplCanvas()
-        right.addWidget(self.canvas, stretch=1)
+        # Chart area: a placeholder until the first plot creates the canvas
+        self.canvas = None
+        self.chart_area = QWidget()
+        self._chart_layout = QVBoxLayout(self.chart_area)
+        self._chart_layout.setContentsMargins(0, 0, 0, 0)
+        self.chart_placeholder = QLabel("Use the Plot buttons to draw a chart.")
+        self.chart_placeholder.setObjectName("chartPlaceholder")
+        self.chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._chart_layout.addWidget(self.chart_placeholder)
+        right.addWidget(self.chart_area, stretch=1)
 
         tips = QLabel("80% rule reduces usable capacity. Charts update from the controls on the left.")
         tips.setObjectName("tips")
@@ -336,13 +333,8 @@ class FlightTimeEstimator(QMainWindow):
             i_fixed = self._f(self.avg_current_A, "Avg current (A)")
             if i_fixed <= 0:
                 raise ValueError("Avg current (A) must be > 0.")
-            cap_min = int(self._f(self.cap_min, "Cap min"))
-            cap_max = int(self._f(self.cap_max, "Cap max"))
-            cap_step = int(self._f(self.cap_step, "Cap step"))
-            if not (cap_min > 0 and cap_max > cap_min and cap_step > 0):
-                raise ValueError("Capacity range must be positive, max > min, step > 0.")
-            caps = np.arange(cap_min, cap_max + 1, cap_step)
-            times = series_flight_time_vs_capacity(caps, i_fixed, self.use_80.isChecked())
+            caps = self._capacity_range()
+            times = self.cache_status.call(series_flight_time_vs_capacity, caps, i_fixed, self.use_80.isChecked())
             self._plot_xy(caps, times, "Battery Capacity (mAh)", "Flight Time (min)",
                           f"Flight Time vs Capacity @ {i_fixed:.2f} A")
         except ValueError as e:
@@ -351,19 +343,55 @@ class FlightTimeEstimator(QMainWindow):
     def _on_plot_vs_current(self):
         try:
             cap_fixed = self._f(self.capacity_mAh, "Capacity (mAh)")
-            i_min = int(self._f(self.cur_min, "I min"))
-            i_max = int(self._f(self.cur_max, "I max"))
-            i_step = int(self._f(self.cur_step, "I step"))
-            if not (i_min > 0 and i_max > i_min and i_step > 0):
-                raise ValueError("Current range must be positive, max > min, step > 0.")
-            currents = np.arange(i_min, i_max + 1, i_step)
-            times = series_flight_time_vs_current(currents, cap_fixed, self.use_80.isChecked())
+            currents = self._current_range()
+            times = self.cache_status.call(series_flight_time_vs_current, currents, cap_fixed, self.use_80.isChecked())
             self._plot_xy(currents, times, "Average Current (A)", "Flight Time (min)",
                           f"Flight Time vs Current @ {cap_fixed:.0f} mAh")
         except ValueError as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def _on_plot_map(self):
+        try:
+            caps = self._capacity_range()
+            currents = self._current_range()
+            grid = self.cache_status.call(flight_time_grid, caps, currents, self.use_80.isChecked())
+            self._plot_map(caps, currents, grid)
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+
+    def _capacity_range(self) -> np.ndarray:
+        cap_min = int(self._f(self.cap_min, "Cap min"))
+        cap_max = int(self._f(self.cap_max, "Cap max"))
+        cap_step = int(self._f(self.cap_step, "Cap step"))
+        if not (cap_min > 0 and cap_max > cap_min and cap_step > 0):
+            raise ValueError("Capacity range must be positive, max > min, step > 0.")
+        return np.arange(cap_min, cap_max + 1, cap_step)
+
+    def _current_range(self) -> np.ndarray:
+        i_min = int(self._f(self.cur_min, "I min"))
+        i_max = int(self._f(self.cur_max, "I max"))
+        i_step = int(self._f(self.cur_step, "I step"))
+        if not (i_min > 0 and i_max > i_min and i_step > 0):
+            raise ValueError("Current range must be positive, max > min, step > 0.")
+        return np.arange(i_min, i_max + 1, i_step)
+
+    def _ensure_canvas(self):
+        # matplotlib and its Qt backend are imported on first use only;
+        # together they cost more than the rest of the window's startup.
+        if self.canvas is None:
+            from mpl_canvas import MplCanvas
+
+            self.canvas = MplCanvas()
+            self._chart_layout.removeWidget(self.chart_placeholder)
+            self.chart_placeholder.deleteLater()
+            self.chart_placeholder = None
+            self._chart_layout.addWidget(self.canvas)
+        return self.canvas
+
     def _on_save_figure(self):
+        if self.canvas is None:
+            QMessageBox.information(self, "Save Figure", "Nothing plotted yet.")
+            return
         path, _ = QFileDialog.getSaveFileName(self, "Save Figure", "flight_time.png", "PNG Files (*.png);;SVG Files (*.svg)")
         if not path:
             return
@@ -375,74 +403,86 @@ class FlightTimeEstimator(QMainWindow):
 
     # Plot helper
     def _plot_xy(self, x: np.ndarray, y: np.ndarray, xlabel: str, ylabel: str, title: str):
+        self._ensure_canvas().reset()
         ax = self.canvas.ax
-        ax.clear()
-        # Re-apply dark axis styling after clear
-        ax.set_facecolor("#161616")
-        for spine in ax.spines.values():
-            spine.set_color("#aaaaaa")
-        ax.tick_params(colors="#dddddd")
-        ax.title.set_color("#dddddd")
-        ax.xaxis.label.set_color("#dddddd")
-        ax.yaxis.label.set_color("#dddddd")
-
-        ax.plot(x, y, marker="o")
+        # Markers only while individual points are distinguishable
+        ax.plot(x, y, marker="o" if len(x) <= MAX_MARKER_POINTS else None)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
         ax.set_title(title)
         ax.grid(True, alpha=0.25)
         self.canvas.draw()
 
-        # Also reflect data in a table for exportability
-        self._populate_table([("Series points", f"{len(x)}")])
+        # Also reflect data in the table for exportability
         self._fill_series_into_table(x, y, xlabel, ylabel)
+        self.statusBar().showMessage(f"Series points: {len(x)}", 2500)
+
+    def _plot_map(self, caps: np.ndarray, currents: np.ndarray, grid: np.ndarray):
+        self._ensure_canvas().reset()
+        ax = self.canvas.ax
+
+        # Draw a strided view: the screen cannot show more cells than pixels.
+        sy = -(-len(caps) // MAP_MAX_CELLS)
+        sx = -(-len(currents) // MAP_MAX_CELLS)
+        img = grid[::sy, ::sx]
+        ys, xs = caps[::sy], currents[::sx]
+        dy = (ys[1] - ys[0]) if len(ys) > 1 else 1.0
+        dx = (xs[1] - xs[0]) if len(xs) > 1 else 1.0
+        extent = (xs[0] - dx / 2, xs[-1] + dx / 2, ys[0] - dy / 2, ys[-1] + dy / 2)
+        im = ax.imshow(img, origin="lower", aspect="auto", extent=extent,
+                       cmap="viridis", interpolation="nearest")
+
+        cy = -(-len(ys) // MAP_CONTOUR_CELLS)
+        cx = -(-len(xs) // MAP_CONTOUR_CELLS)
+        if len(ys[::cy]) > 1 and len(xs[::cx]) > 1:
+            cs = ax.contour(xs[::cx], ys[::cy], img[::cy, ::cx], levels=8,
+                            colors="#ffffff", linewidths=0.6, alpha=0.7)
+            ax.clabel(cs, fmt="%.0f", fontsize=7, colors="#ffffff")
+
+        self.canvas.colorbar = self.canvas.figure.colorbar(im, ax=ax)
+        self.canvas.colorbar.set_label("Flight Time (min)", color="#dddddd")
+        self.canvas.colorbar.ax.tick_params(colors="#dddddd")
+        ax.set_xlabel("Average Current (A)")
+        ax.set_ylabel("Battery Capacity (mAh)")
+        ax.set_title("Flight Time over Capacity x Current")
+        self.canvas.draw()
+
+        self._fill_map_summary_into_table(caps, currents, grid)
+        self.statusBar().showMessage(
+            f"Grid {grid.shape[0]} x {grid.shape[1]}: "
+            f"{grid.min():.2f} - {grid.max():.2f} min", 4000)
 
     # Table helpers
     def _populate_table(self, rows: List[Tuple[str, str]]):
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(rows))
-        for r, (k, v) in enumerate(rows):
-            k_item = QTableWidgetItem(k)
-            v_item = QTableWidgetItem(v)
-            v_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(r, 0, k_item)
-            self.table.setItem(r, 1, v_item)
-        self.table.resizeRowsToContents()
+        keys = np.array([k for k, _ in rows], dtype=object)
+        vals = np.array([v for _, v in rows], dtype=object)
+        self.model.set_columns(
+            [keys, vals], headers=["Metric", "Value"], formats=[None, None], right_align=(1,)
+        )
 
     def _fill_series_into_table(self, x: np.ndarray, y: np.ndarray, xlabel: str, ylabel: str):
-        # Append series rows after current content
-        start = self.table.rowCount()
-        self.table.setRowCount(start + len(x) + 1)
-        sep = QTableWidgetItem("--- Series Data ---")
-        self.table.setItem(start, 0, sep)
-        for i, (xi, yi) in enumerate(zip(x, y), start=start + 1):
-            self.table.setItem(i, 0, QTableWidgetItem(f"{xlabel}: {xi:g}"))
-            val = QTableWidgetItem(f"{yi:.3f}")
-            val.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(i, 1, val)
-        self.table.resizeRowsToContents()
+        # One row per series point; the arrays are shared, not copied into items
+        self.model.set_columns(
+            [x, y], headers=[xlabel, ylabel], formats=["{:g}", "{:.3f}"], right_align=(0, 1)
+        )
+
+    def _fill_map_summary_into_table(self, caps: np.ndarray, currents: np.ndarray, grid: np.ndarray):
+        # Evenly sampled rows/columns of the grid instead of every cell
+        ri = np.unique(np.linspace(0, len(caps) - 1, min(len(caps), MAP_TABLE_ROWS)).round().astype(int))
+        ci = np.unique(np.linspace(0, len(currents) - 1, min(len(currents), MAP_TABLE_COLS)).round().astype(int))
+        cols = [caps[ri]] + [grid[ri, j] for j in ci]
+        headers = ["Capacity (mAh)"] + [f"{currents[j]:g} A" for j in ci]
+        self.model.set_columns(
+            cols, headers=headers, formats=["{:g}"] + ["{:.2f}"] * len(ci), right_align=range(len(cols))
+        )
 
     # Export
     def _export_csv(self):
-        if self.table.rowCount() == 0:
-            QMessageBox.information(self, "Export", "No results to export.")
-            return
-        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "flight_time_results.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            lines = ["Metric,Value"]
-            for r in range(self.table.rowCount()):
-                k = self.table.item(r, 0).text() if self.table.item(r, 0) else ""
-                v = self.table.item(r, 1).text() if self.table.item(r, 1) else ""
-                k = '"' + k.replace('"', '""') + '"'
-                v = '"' + v.replace('"', '""') + '"'
-                lines.append(f"{k},{v}")
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            self.statusBar().showMessage(f"Exported to {path}", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {e}")
+        export_model_csv(self, self.model, "flight_time_results.csv")
+
+    def closeEvent(self, event):
+        cancel_export(self)
+        super().closeEvent(event)
 
     # Parse helpers
     def _f(self, widget: QLineEdit, label: str) -> float:
@@ -457,105 +497,6 @@ class FlightTimeEstimator(QMainWindow):
             raise ValueError(f"{label} must be non-negative.")
         return val
 
-    # Theme
-    def _apply_dark_theme(self):
-        base_font = QFont("Arial", 10)
-        QApplication.instance().setFont(base_font)
-
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#121212"))
-        palette.setColor(QPalette.WindowText, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Base, QColor("#1a1a1a"))
-        palette.setColor(QPalette.AlternateBase, QColor("#171717"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#2a2a2a"))
-        palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#dcdcdc"))
-        palette.setColor(QPalette.Button, QColor("#232323"))
-        palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
-        palette.setColor(QPalette.Highlight, QColor("#0a84ff"))
-        palette.setColor(QPalette.HighlightedText, QColor("#000000"))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #dcdcdc;
-                font-family: Arial;
-                font-size: 10pt;
-            }
-            QGroupBox {
-                border: 1px solid #2b2b2b;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 2px;
-                font-size: 10pt;
-            }
-            QLineEdit {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 4px 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0a84ff;
-            }
-            QCheckBox { spacing: 6px; }
-            QPushButton {
-                background-color: #0a84ff;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-height: 26px;
-            }
-            QPushButton:hover { background-color: #2b95ff; }
-            QPushButton:pressed { background-color: #086ed6; }
-            QTableWidget {
-                gridline-color: #2a2a2a;
-                background-color: #161616;
-                alternate-background-color: #141414;
-                color: #dcdcdc;
-                selection-background-color: #0a84ff;
-                selection-color: #000000;
-                border: 1px solid #2a2a2a;
-                border-radius: 6px;
-                font-size: 10pt;
-            }
-            QHeaderView::section {
-                background-color: #1c1c1c;
-                color: #dcdcdc;
-                padding: 4px 6px;
-                border: 0px;
-                border-right: 1px solid #2a2a2a;
-                font-size: 10pt;
-            }
-            QSplitter::handle { background: #1b1b1b; }
-            QLabel#tips {
-                color: #a0a0a0;
-                padding: 4px 0;
-                font-size: 9pt;
-            }
-            QTextBrowser {
-                background-color: #1a1a1a;
-                color: #e6e6e6;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            """
-        )
-
 
 # ----------------------------
 # Entrypoint
@@ -564,6 +505,10 @@ class FlightTimeEstimator(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("Flight Time Estimator")
+    probe = StartupProbe(_IMPORT_T0, "flight_time_ui") if StartupProbe.requested(sys.argv) else None
     win = FlightTimeEstimator()
+    if probe:
+        probe.window_built()
+        probe.after_paint("deferred canvas", win._ensure_canvas)
     win.show()
     sys.exit(app.exec())
@@ -0,0 +1,71 @@
+"""FlightLab core: GUI-free domain math shared by the tools/*_ui.py front-ends.
+
+Nothing in this package imports PySide6 or matplotlib, so it can be used from
+scripts, CI jobs and worker processes. Headless commands live in
+``flightlab.cli`` and are run with ``python -m flightlab <command>``.
+
+Importing the package is cheap: it loads nothing but the standard library,
+and the public names below resolve on first access, importing only the
+submodule that defines them.
+"""
+
+from importlib import import_module
+
+# public name -> submodule defining it
+_EXPORTS = {
+    "recommend_power": "power",
+    "motor_efficiency_output": "power",
+    "motor_weight_from_power": "power",
+    "battery_voltage_from_wingspan_cm": "power",
+    "prop_pitch_speed": "power",
+    "thrust_check": "power",
+    "esc_rating": "power",
+    "battery_discharge_check": "power",
+    "evaluate_airframes": "power",
+    "optimize_airframe": "optimize",
+    "calculate_flight_time": "flight_time",
+    "flight_time_grid": "flight_time",
+    "calculate_motor_esc_params": "motor_esc",
+    "motor_esc_columns": "motor_esc",
+    "MotorEscResults": "motor_esc",
+    "effective_capacity": "battery",
+    "coulomb_step": "battery",
+    "integrate_samples": "battery",
+    "DischargeSimulation": "battery",
+    "monte_carlo_discharge": "battery",
+    "RingBuffer": "ringbuffer",
+    "open_source": "telemetry",
+    "open_writer": "writers",
+    "load_stl": "stl",
+    "StlMesh": "stl",
+    "check_mesh": "meshcheck",
+    "estimate_printed_mass": "mass",
+    "slice_wing": "slicing",
+    "build_polars": "aero",
+    "load_polars": "aero",
+    "PanelAirfoil": "panel",
+    "naca4": "panel",
+    "airfoil_from_section": "panel",
+    "Planform": "vlm",
+    "VortexLattice": "vlm",
+    "build_web_mesh": "webmesh",
+    "render_thumbnails": "render",
+    "ResultCache": "cache",
+    "default_cache": "cache",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # cache; later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
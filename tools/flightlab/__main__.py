@@ -0,0 +1,50 @@
+import sys
+from importlib import import_module
+from typing import List, Optional
+
+# command -> (module exposing main(argv, prog), one-line help)
+COMMANDS = {
+    "motor-esc": ("flightlab.cli.motor_esc", "Sweep KV x voltage; stream motor/ESC results."),
+    "power": ("flightlab.cli.power", "Evaluate power-system rules of thumb for a table of airframes."),
+    "optimize": ("flightlab.cli.optimize", "Search power-system designs for the best feasible ones."),
+    "discharge": ("flightlab.cli.discharge", "Deterministic simulated-clock battery discharge run."),
+    "discharge-mc": ("flightlab.cli.discharge_mc", "Monte Carlo discharge: remaining/ETA percentile bands."),
+    "mesh": ("flightlab.cli.mesh", "STL bounding box, area, volume, centroid and inertia."),
+    "check": ("flightlab.cli.check", "Watertightness and mesh-health check of STL files (exit 1 on failure)."),
+    "mass": ("flightlab.cli.mass", "Printed mass and CG of STL parts; weight for the power estimate."),
+    "sections": ("flightlab.cli.sections", "Slice a wing STL into sections: chord, thickness, reference area S."),
+    "polar": ("flightlab.cli.polar", "C_L, C_D and L/D polars from CFD exports (goal tables or AoA tables)."),
+    "airfoil": ("flightlab.cli.airfoil", "2-D airfoil polar (c_l, c_m, drag estimate) from a vortex panel method."),
+    "vlm": ("flightlab.cli.vlm", "Wing C_L, induced drag, span loading and Oswald e from a vortex lattice method."),
+    "webmesh": ("flightlab.cli.webmesh", "Convert STL to indexed, quantized glb levels of detail for the web viewer."),
+    "thumbnail": ("flightlab.cli.thumbnail", "Render cached PNG thumbnails of STL files for the docs viewer."),
+    "telemetry": ("flightlab.cli.telemetry", "Coulomb-count a serial/UDP stream or replay a recorded log."),
+}
+
+
+def _usage() -> str:
+    lines = ["usage: python -m flightlab <command> [options]", "", "commands:"]
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, text) in COMMANDS.items():
+        lines.append(f"  {name.ljust(width)}  {text}")
+    lines.append("")
+    lines.append("Run 'python -m flightlab <command> --help' for command options.")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_usage())
+        return 0 if argv else 2
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(_usage(), file=sys.stderr)
+        print(f"\nerror: unknown command '{name}'", file=sys.stderr)
+        return 2
+    module = import_module(COMMANDS[name][0])
+    return module.main(rest, prog=f"python -m flightlab {name}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+import csv
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# ----------------------------
+# Aerodynamic coefficients from CFD exports
+# ----------------------------
+#
+# C_L = L / (0.5 rho V^2 S), C_D = D / (0.5 rho V^2 S), L/D = C_L / C_D, as
+# in the aerodynamics guide. Two export layouts are read:
+#
+# - Flow Simulation goal tables (a "Goal Name" column, one run per file):
+#   force goals ("GG Force (Y) 1", "GG X - Component of Force 1", or goals
+#   named Lift/Drag) give the forces; configuration, AoA and speed come
+#   from the file name (see DEFAULT_PATTERN).
+# - Point tables (one run per row) with an AoA column and lift/drag or
+#   force-component columns, optionally config and speed columns.
+#
+# Forces along lift_axis/drag_axis are wind-axis lift and drag when the
+# flow stays fixed and the model is rotated (frame="wind"); with
+# frame="body" the flow direction was rotated by the AoA instead and the
+# components are rotated back into lift and drag.
+
+RHO_KG_M3 = 1.225
+MU_KG_MS = 1.7894e-5
+DEFAULT_SPEED_MS = 15.0
+FRAMES = ("wind", "body")
+
+# e.g. "wing_v2_aoa5.csv", "wing-v2_aoa-2.5_v15.csv"
+DEFAULT_PATTERN = r"(?P<config>.+?)[_-]+aoa[_=]?(?P<aoa>[-+]?\d+(?:\.\d+)?)(?:[_-]+v(?P<speed>\d+(?:\.\d+)?))?$"
+
+POLAR_COLUMNS = ("config", "aoa_deg", "speed_ms", "lift_n", "drag_n", "cl", "cd", "ld", "reynolds", "source")
+
+_UNIT_TO_N = {"n": 1.0, "mn": 1e-3, "kn": 1e3, "lbf": 4.4482216152605, "kgf": 9.80665}
+_AERO_PARALLEL_FILES = 64  # auto mode uses processes above this many files
+
+_ALIASES = {
+    "aoa": ("aoa", "aoa_deg", "alpha", "alpha_deg", "angle_of_attack"),
+    "speed": ("speed", "speed_ms", "v", "velocity", "airspeed", "v_ms"),
+    "config": ("config", "configuration", "case", "design"),
+    "lift": ("lift", "lift_n"),
+    "drag": ("drag", "drag_n"),
+    "x": ("fx", "force_x", "fx_n"),
+    "y": ("fy", "force_y", "fy_n"),
+    "z": ("fz", "force_z", "fz_n"),
+}
+_FORCE_AXIS = re.compile(r"\(\s*([xyz])\s*\)|\b([xyz])\s*-\s*component", re.IGNORECASE)
+_BRACKETS = re.compile(r"\s*[\[\(][^\]\)]*[\]\)]")
+
+
+def coefficients(lift_n: ArrayLike, drag_n: ArrayLike, speed_ms: ArrayLike, area_m2: ArrayLike, rho: ArrayLike = RHO_KG_M3):
+    """(C_L, C_D, L/D) for forces in N, speed in m/s and reference area in m^2.
+
+    L/D is NaN where the drag is zero.
+    """
+    q_s = 0.5 * np.asarray(rho, dtype=np.float64) * np.square(speed_ms, dtype=np.float64) * np.asarray(area_m2, dtype=np.float64)
+    if np.any(q_s <= 0):
+        raise ValueError("Air density, speed and reference area must be > 0.")
+    cl = np.divide(lift_n, q_s)
+    cd = np.divide(drag_n, q_s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ld = np.where(cd != 0, cl / np.where(cd != 0, cd, 1.0), np.nan)
+    return cl, cd, ld
+
+
+def _axis(spec: str) -> Tuple[str, float]:
+    s = spec.strip().lower()
+    sign = -1.0 if s.startswith("-") else 1.0
+    s = s.lstrip("+-")
+    if s not in ("x", "y", "z"):
+        raise ValueError(f"Unknown force axis '{spec}'. Use x, y, z, -x, -y or -z.")
+    return s, sign
+
+
+def _lift_drag(forces: Dict[str, np.ndarray], aoa_deg: np.ndarray, frame: str, lift_axis: str, drag_axis: str, where: str):
+    if "lift" in forces and "drag" in forces:
+        return forces["lift"], forces["drag"]
+    (la, ls), (da, ds) = _axis(lift_axis), _axis(drag_axis)
+    if la == da:
+        raise ValueError("Lift and drag axes must differ.")
+    if la not in forces or da not in forces:
+        raise ValueError(f"{where}: no lift/drag or {la.upper()}/{da.upper()} force found.")
+    fl, fd = ls * forces[la], ds * forces[da]
+    if frame == "wind":
+        return fl, fd
+    a = np.radians(aoa_deg)
+    return fl * np.cos(a) - fd * np.sin(a), fd * np.cos(a) + fl * np.sin(a)
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[\s\-]+", "_", _BRACKETS.sub("", name).strip().lower())
+
+
+def _find(header: List[str], key: str) -> Optional[int]:
+    for alias in _ALIASES[key]:
+        if alias in header:
+            return header.index(alias)
+    return None
+
+
+def _number(text: str, where: str) -> float:
+    try:
+        return float(text.replace(",", ".") if text.count(",") == 1 and "." not in text else text)
+    except ValueError:
+        raise ValueError(f"{where}: not a number: '{text}'.")
+
+
+def _read_goal_table(rows, header: List[str], path: str, name_fields: Dict[str, str]):
+    lower = [h.strip().lower() for h in header]
+    name_i = lower.index("goal name")
+    value_i = lower.index("averaged value") if "averaged value" in lower else lower.index("value") if "value" in lower else None
+    if value_i is None:
+        raise ValueError(f"{path}: goal table has no Value column.")
+    unit_i = lower.index("unit") if "unit" in lower else None
+    forces: Dict[str, float] = {}
+    for row in rows:
+        if len(row) <= max(name_i, value_i) or not row[value_i].strip():
+            continue
+        goal = row[name_i].strip()
+        low = goal.lower()
+        if "lift" in low:
+            key = "lift"
+        elif "drag" in low:
+            key = "drag"
+        elif "force" in low:
+            m = _FORCE_AXIS.search(goal)
+            if not m:
+                continue
+            key = (m.group(1) or m.group(2)).lower()
+        else:
+            continue
+        if key in forces:
+            continue  # the first goal per component wins
+        unit = row[unit_i].strip(" []").lower() if unit_i is not None and len(row) > unit_i else "n"
+        if unit not in _UNIT_TO_N:
+            raise ValueError(f"{path}: goal '{goal}' is in [{unit}]; use N, mN, kN, lbf or kgf.")
+        forces[key] = _number(row[value_i], f"{path}: goal '{goal}'") * _UNIT_TO_N[unit]
+    if name_fields.get("aoa") is None:
+        raise ValueError(f"{path}: no angle of attack in the file name (see --pattern).")
+    return (
+        [name_fields["config"]],
+        np.array([float(name_fields["aoa"])]),
+        np.array([float(name_fields["speed"]) if name_fields.get("speed") else np.nan]),
+        {k: np.array([v]) for k, v in forces.items()},
+    )
+
+
+def _read_point_table(rows, header: List[str], path: str, default_config: str):
+    names = [_normalize(h) for h in header]
+    aoa_i = _find(names, "aoa")
+    cols = {k: _find(names, k) for k in ("speed", "config", "lift", "drag", "x", "y", "z")}
+    configs, aoa, speed = [], [], []
+    forces: Dict[str, list] = {k: [] for k in ("lift", "drag", "x", "y", "z") if cols[k] is not None}
+    for line, row in enumerate(rows, start=2):
+        if not row or not "".join(row).strip():
+            continue
+        where = f"{path}:{line}"
+        aoa.append(_number(row[aoa_i], where))
+        speed.append(_number(row[cols["speed"]], where) if cols["speed"] is not None else np.nan)
+        configs.append(row[cols["config"]].strip() if cols["config"] is not None else default_config)
+        for k in forces:
+            forces[k].append(_number(row[cols[k]], where))
+    return configs, np.array(aoa, dtype=np.float64), np.array(speed, dtype=np.float64), {
+        k: np.array(v, dtype=np.float64) for k, v in forces.items()
+    }
+
+
+def read_export(
+    path: str,
+    pattern: str = DEFAULT_PATTERN,
+    frame: str = "wind",
+    lift_axis: str = "y",
+    drag_axis: str = "x",
+) -> Dict[str, object]:
+    """Runs in one CFD export: config names, AoA (deg), speed (m/s, NaN if absent), lift and drag (N)."""
+    if frame not in FRAMES:
+        raise ValueError(f"Unknown frame '{frame}'. Use one of: {', '.join(FRAMES)}.")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    m = re.search(pattern, stem, re.IGNORECASE)
+    name_fields = m.groupdict() if m else {}
+    name_fields.setdefault("config", None)
+    name_fields["config"] = name_fields["config"] or stem
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        rows = csv.reader(f, dialect)
+        for header in rows:
+            lower = [h.strip().lower() for h in header]
+            if "goal name" in lower:
+                configs, aoa, speed, forces = _read_goal_table(rows, header, path, name_fields)
+                break
+            if _find([_normalize(h) for h in header], "aoa") is not None:
+                configs, aoa, speed, forces = _read_point_table(rows, header, path, name_fields["config"])
+                break
+        else:
+            raise ValueError(f"{path}: neither a goal table nor a table with an AoA column.")
+    if name_fields.get("speed"):
+        speed = np.where(np.isnan(speed), float(name_fields["speed"]), speed)
+    lift, drag = _lift_drag(forces, aoa, frame, lift_axis, drag_axis, path)
+    return {"config": configs, "aoa_deg": aoa, "speed_ms": speed, "lift_n": lift, "drag_n": drag}
+
+
+def _read_task(task):
+    path, options = task
+    return read_export(path, **options)
+
+
+class PolarSet:
+    """Polars of many configurations, array-backed and sorted by (config, speed, AoA).
+
+    `configs` holds the configuration names and `code` each row's index
+    into it; rows of one configuration are contiguous, so polar() and
+    lookup() slice instead of searching. Columns are POLAR_COLUMNS.
+    """
+
+    def __init__(self, configs: Sequence[str], data: Dict[str, np.ndarray], sources: Sequence[str],
+                 area_m2: float, rho: float, mac_m: Optional[float] = None):
+        self.configs = list(configs)
+        self.data = data
+        self.sources = list(sources)
+        self.area_m2 = area_m2
+        self.rho = rho
+        self.mac_m = mac_m
+        self._bounds = np.searchsorted(data["code"], np.arange(len(self.configs) + 1))
+
+    def __len__(self) -> int:
+        return len(self.data["code"])
+
+    def _rows(self, config: str) -> slice:
+        try:
+            c = self.configs.index(config)
+        except ValueError:
+            raise KeyError(f"Unknown configuration '{config}'.")
+        return slice(self._bounds[c], self._bounds[c + 1])
+
+    def polar(self, config: str, speed_ms: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Rows of one configuration, at the recorded speed nearest to speed_ms if given."""
+        rows = {k: v[self._rows(config)] for k, v in self.data.items()}
+        if speed_ms is not None and len(rows["speed_ms"]):
+            nearest = rows["speed_ms"][np.argmin(np.abs(rows["speed_ms"] - speed_ms))]
+            keep = rows["speed_ms"] == nearest
+            rows = {k: v[keep] for k, v in rows.items()}
+        return rows
+
+    def lookup(self, config: str, aoa_deg: ArrayLike, speed_ms: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """C_L, C_D and L/D interpolated linearly in AoA (clamped at the ends)."""
+        p = self.polar(config, speed_ms)
+        if speed_ms is None and len(np.unique(p["speed_ms"])) > 1:
+            raise ValueError(f"'{config}' has several speeds; pass speed_ms.")
+        if not len(p["aoa_deg"]):
+            raise ValueError(f"'{config}' has no data.")
+        cl = np.interp(aoa_deg, p["aoa_deg"], p["cl"])
+        cd = np.interp(aoa_deg, p["aoa_deg"], p["cd"])
+        return {"cl": cl, "cd": cd, "ld": np.divide(cl, cd, out=np.full_like(cl, np.nan), where=cd != 0)}
+
+    def best(self, config: str) -> Dict[str, object]:
+        """The row with the highest L/D for one configuration."""
+        p = self.polar(config)
+        ld = np.where(np.isnan(p["ld"]), -np.inf, p["ld"])
+        i = int(np.argmax(ld))
+        return {k: (v[i].item() if hasattr(v[i], "item") else v[i]) for k, v in p.items() if k != "code"}
+
+    def summary(self) -> List[Dict[str, object]]:
+        out = []
+        for config in self.configs:
+            p = self.polar(config)
+            best = self.best(config)
+            out.append({
+                "config": config,
+                "points": len(p["aoa_deg"]),
+                "best_ld": best["ld"],
+                "best_ld_aoa_deg": best["aoa_deg"],
+                "cl_max": float(np.max(p["cl"])),
+                "cd_min": float(np.min(p["cd"])),
+            })
+        return out
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        cols = {k: self.data[k] for k in POLAR_COLUMNS if k not in ("config", "source")}
+        cols["config"] = np.array(self.configs, dtype=object)[self.data["code"]]
+        cols["source"] = np.array(self.sources, dtype=object)[self.data["source"]]
+        return cols
+
+    def save(self, path: str):
+        """Compressed .npz; load_polars() reads it back."""
+        np.savez_compressed(
+            path, configs=np.array(self.configs), sources=np.array(self.sources),
+            meta=np.array([self.area_m2, self.rho, np.nan if self.mac_m is None else self.mac_m]),
+            **self.data,
+        )
+
+
+def load_polars(path: str) -> PolarSet:
+    with np.load(path, allow_pickle=False) as z:
+        data = {k: z[k] for k in z.files if k not in ("configs", "sources", "meta")}
+        area, rho, mac = z["meta"].tolist()
+        return PolarSet(z["configs"].tolist(), data, z["sources"].tolist(), area, rho, None if np.isnan(mac) else mac)
+
+
+def build_polars(
+    paths: Sequence[str],
+    area_m2: float,
+    rho: float = RHO_KG_M3,
+    default_speed_ms: float = DEFAULT_SPEED_MS,
+    mac_m: Optional[float] = None,
+    mu: float = MU_KG_MS,
+    pattern: str = DEFAULT_PATTERN,
+    frame: str = "wind",
+    lift_axis: str = "y",
+    drag_axis: str = "x",
+    workers: Optional[int] = None,
+) -> PolarSet:
+    """Read every export (in parallel) and compute the coefficients in one vectorized pass.
+
+    default_speed_ms applies to runs whose export names no speed.
+    Reynolds numbers use mac_m as the length (NaN without it).
+    workers=None uses all cores above _AERO_PARALLEL_FILES files;
+    workers=1 reads in-process.
+    """
+    if not paths:
+        raise ValueError("No CFD exports given.")
+    if area_m2 <= 0 or rho <= 0 or default_speed_ms <= 0:
+        raise ValueError("Reference area, air density and speed must be > 0.")
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid file-name pattern: {e}.")
+    options = {"pattern": pattern, "frame": frame, "lift_axis": lift_axis, "drag_axis": drag_axis}
+    tasks = [(p, options) for p in paths]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(tasks) > _AERO_PARALLEL_FILES else 1
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        runs = [_read_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            runs = list(pool.map(_read_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+
+    names = [c for r in runs for c in r["config"]]
+    configs, code = np.unique(np.array(names, dtype=str), return_inverse=True) if names else ([], np.empty(0, int))
+    data = {k: np.concatenate([r[k] for r in runs]) if runs else np.empty(0) for k in ("aoa_deg", "speed_ms", "lift_n", "drag_n")}
+    data["speed_ms"] = np.where(np.isnan(data["speed_ms"]), default_speed_ms, data["speed_ms"])
+    data["code"] = code.astype(np.int32)
+    data["source"] = np.repeat(np.arange(len(runs), dtype=np.int32), [len(r["aoa_deg"]) for r in runs])
+    data["cl"], data["cd"], data["ld"] = coefficients(data["lift_n"], data["drag_n"], data["speed_ms"], area_m2, rho)
+    data["reynolds"] = rho * data["speed_ms"] * (mac_m if mac_m else np.nan) / mu
+
+    order = np.lexsort((data["aoa_deg"], data["speed_ms"], data["code"]))
+    data = {k: v[order] for k, v in data.items()}
+    return PolarSet([str(c) for c in configs], data, list(paths), area_m2, rho, mac_m)
@@ -0,0 +1,308 @@
+import multiprocessing
+import os
+import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ----------------------------
+# Coulomb counting
+# ----------------------------
+
+USABLE_FRACTION_80 = 0.8
+ETA_IDLE_CURRENT_A = 0.1
+ETA_SENTINEL_MIN = 9999.0
+
+RECORD_COLUMNS = ("Time (s)", "Current (A)", "Consumed (mAh)", "Remaining (mAh)", "Est. Flight (min)")
+
+# (t_s, current_A, consumed_mAh, remaining_mAh, eta_min)
+Record = Tuple[float, float, float, float, float]
+
+
+def effective_capacity(capacity_mAh: float, use_80_percent: bool = True) -> float:
+    return capacity_mAh * (USABLE_FRACTION_80 if use_80_percent else 1.0)
+
+
+def coulomb_step(
+    consumed_mAh: float, current_A: float, elapsed_s: float, effective_capacity_mAh: float
+) -> Tuple[float, float, float]:
+    """Integrate one interval. Returns (consumed_mAh, remaining_mAh, eta_min)."""
+    elapsed_h = elapsed_s / 3600.0
+    consumed_mAh += current_A * elapsed_h * 1000.0
+    remaining_mAh = max(effective_capacity_mAh - consumed_mAh, 0.0)
+    if current_A > ETA_IDLE_CURRENT_A:
+        eta_min = ((remaining_mAh / 1000.0) / current_A) * 60.0
+    else:
+        eta_min = ETA_SENTINEL_MIN
+    return consumed_mAh, remaining_mAh, eta_min
+
+
+def integrate_samples(
+    consumed_mAh: float, last_t_s: float, t_s, current_A, effective_capacity_mAh: float
+) -> np.ndarray:
+    """coulomb_step() over a batch of samples at once.
+
+    Each sample integrates its current over the time since the previous one
+    (since last_t_s for the first). Returns an (n, 5) array of records in
+    RECORD_COLUMNS order; the last row's consumed column carries the state.
+    """
+    t_s = np.asarray(t_s, dtype=float)
+    current_A = np.asarray(current_A, dtype=float)
+    out = np.empty((len(t_s), len(RECORD_COLUMNS)))
+    if len(t_s) == 0:
+        return out
+    elapsed_s = np.diff(t_s, prepend=last_t_s)
+    np.maximum(elapsed_s, 0.0, out=elapsed_s)  # out-of-order samples add nothing
+    # Same operation order as coulomb_step; cumsum accumulates sequentially.
+    inc = current_A * (elapsed_s / 3600.0)
+    inc *= 1000.0
+    inc[0] += consumed_mAh
+    consumed = np.cumsum(inc)
+    remaining = np.maximum(effective_capacity_mAh - consumed, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = np.where(current_A > ETA_IDLE_CURRENT_A, ((remaining / 1000.0) / current_A) * 60.0, ETA_SENTINEL_MIN)
+    out[:, 0] = t_s
+    out[:, 1] = current_A
+    out[:, 2] = consumed
+    out[:, 3] = remaining
+    out[:, 4] = eta
+    return out
+
+
+# ----------------------------
+# Simulated-clock discharge
+# ----------------------------
+
+class DischargeSimulation:
+    """Coulomb-counting discharge driven by a simulated clock.
+
+    Every step() advances time by exactly sampling_interval_s and draws the
+    current from random.Random(seed), so a configuration and seed always
+    produce bit-identical records regardless of how fast steps are taken.
+    Termination matches the wall-clock simulator: stop once the duration is
+    reached (checked before sampling) or the effective capacity is depleted.
+    """
+
+    def __init__(
+        self,
+        effective_capacity_mAh: float,
+        sampling_interval_s: float,
+        duration_s: float,
+        i_min: float,
+        i_max: float,
+        seed: Optional[int] = None,
+    ):
+        if sampling_interval_s <= 0:
+            raise ValueError("Sampling (s) must be > 0 for the simulated clock.")
+        if i_max < i_min:
+            raise ValueError("Current max (A) must be >= Current min (A).")
+        self.effective_capacity_mAh = effective_capacity_mAh
+        self.sampling_interval_s = sampling_interval_s
+        self.duration_s = duration_s
+        self.i_min = i_min
+        self.i_max = i_max
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.steps = 0
+        self.consumed_mAh = 0.0
+        self.finished: Optional[str] = None  # "duration" or "depleted"
+
+    @property
+    def time_s(self) -> float:
+        # Multiply rather than accumulate so t does not drift over long runs.
+        return self.steps * self.sampling_interval_s
+
+    def step(self) -> Optional[Record]:
+        if self.finished:
+            return None
+        t = (self.steps + 1) * self.sampling_interval_s
+        if t >= self.duration_s:
+            self.finished = "duration"
+            return None
+        self.steps += 1
+        current_A = self.rng.uniform(self.i_min, self.i_max)
+        self.consumed_mAh, remaining_mAh, eta_min = coulomb_step(
+            self.consumed_mAh, current_A, self.sampling_interval_s, self.effective_capacity_mAh
+        )
+        if remaining_mAh <= 0.0:
+            self.finished = "depleted"
+        return (t, current_A, self.consumed_mAh, remaining_mAh, eta_min)
+
+    def steps_iter(self, max_steps: Optional[int] = None) -> Iterator[Record]:
+        n = 0
+        while max_steps is None or n < max_steps:
+            rec = self.step()
+            if rec is None:
+                return
+            n += 1
+            yield rec
+
+    def run(self, max_steps: Optional[int] = None) -> List[Record]:
+        return list(self.steps_iter(max_steps))
+
+
+# ----------------------------
+# Batch Monte Carlo discharge
+# ----------------------------
+
+MC_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+# Above this many run x step cells the work is sharded across processes.
+_MC_PARALLEL_CELLS = 50_000_000
+# Cells (runs x steps) simulated at once inside one shard.
+_MC_BLOCK_CELLS = 2_000_000
+
+
+class MonteCarloResult:
+    """Summary of a batch of independent discharge trajectories.
+
+    Bands have shape (len(percentiles), len(times_s)). Remaining capacity is
+    in mAh; ETA error is predicted ETA minus actual time to depletion, in
+    minutes, over runs that deplete (NaN where no run contributes).
+    depletion_s holds one entry per run, NaN for runs that outlast the
+    duration.
+    """
+
+    def __init__(self, seed, runs, percentiles, times_s, remaining_bands, eta_error_bands, depletion_s):
+        self.seed = seed
+        self.runs = runs
+        self.percentiles = tuple(percentiles)
+        self.times_s = times_s
+        self.remaining_bands = remaining_bands
+        self.eta_error_bands = eta_error_bands
+        self.depletion_s = depletion_s
+
+    @property
+    def depleted_fraction(self) -> float:
+        return float(np.mean(~np.isnan(self.depletion_s))) if self.runs else 0.0
+
+    def depletion_percentiles(self):
+        """Depletion time (s) percentiles over the runs that deplete."""
+        dep = self.depletion_s[~np.isnan(self.depletion_s)]
+        if dep.size == 0:
+            return np.full(len(self.percentiles), np.nan)
+        return np.percentile(dep, self.percentiles)
+
+
+def steps_within(duration_s: float, sampling_interval_s: float) -> int:
+    """Number of samples k = 1, 2, ... with k * dt < duration (as DischargeSimulation)."""
+    n = max(int(duration_s // sampling_interval_s), 0)
+    while n > 0 and n * sampling_interval_s >= duration_s:
+        n -= 1
+    while (n + 1) * sampling_interval_s < duration_s:
+        n += 1
+    return n
+
+
+def _run_rng(entropy, run: int):
+    # Child stream of run `run`; identical to SeedSequence(entropy).spawn(...)[run],
+    # so results do not depend on how runs are sharded.
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(run,)))
+
+
+def _simulate_runs(task):
+    entropy, start, stop, eff_mAh, dt, n_steps, i_min, i_max, sample_idx = task
+    n_runs = stop - start
+    n_pts = len(sample_idx)
+    remaining = np.empty((n_runs, n_pts))
+    eta_err = np.empty((n_runs, n_pts))
+    depletion = np.empty(n_runs)
+    t_s = (sample_idx + 1) * dt
+
+    block = max(1, _MC_BLOCK_CELLS // max(n_steps, 1))
+    for b0 in range(0, n_runs, block):
+        b1 = min(b0 + block, n_runs)
+        currents = np.empty((b1 - b0, n_steps))
+        for j in range(b1 - b0):
+            currents[j] = _run_rng(entropy, start + b0 + j).uniform(i_min, i_max, n_steps)
+
+        # Same operation order as coulomb_step, so a run matches the scalar
+        # integrator exactly for the same current sequence.
+        consumed = currents * (dt / 3600.0)
+        consumed *= 1000.0
+        np.cumsum(consumed, axis=1, out=consumed)
+
+        empty = consumed >= eff_mAh
+        hit = empty.any(axis=1)
+        dep_step = np.where(hit, np.argmax(empty, axis=1), n_steps)
+        depletion[b0:b1] = np.where(hit, (dep_step + 1) * dt, np.nan)
+
+        rem = np.maximum(eff_mAh - consumed[:, sample_idx], 0.0)
+        cur = currents[:, sample_idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eta = np.where(cur > ETA_IDLE_CURRENT_A, ((rem / 1000.0) / cur) * 60.0, np.nan)
+        actual = (depletion[b0:b1, None] - t_s[None, :]) / 60.0
+        valid = sample_idx[None, :] <= dep_step[:, None]
+        remaining[b0:b1] = rem
+        eta_err[b0:b1] = np.where(valid, eta - actual, np.nan)
+    return remaining, eta_err, depletion
+
+
+def monte_carlo_discharge(
+    effective_capacity_mAh: float,
+    sampling_interval_s: float,
+    duration_s: float,
+    i_min: float,
+    i_max: float,
+    runs: int,
+    seed: Optional[int] = None,
+    percentiles: Sequence[float] = MC_PERCENTILES,
+    n_points: int = 500,
+    workers: Optional[int] = None,
+) -> MonteCarloResult:
+    """Simulate `runs` independent random-current discharges at once.
+
+    Each run draws its currents from its own numpy Generator derived from
+    `seed` and the run index, and integrates them with cumsum over a
+    (runs x steps) block. Bands are reported at up to n_points evenly spaced
+    samples. workers=None shards across all cores only for very large
+    jobs; workers=1 forces a single process.
+    """
+    if sampling_interval_s <= 0:
+        raise ValueError("Sampling (s) must be > 0.")
+    if i_max < i_min:
+        raise ValueError("Current max (A) must be >= Current min (A).")
+    if runs < 1:
+        raise ValueError("Runs must be >= 1.")
+
+    ss = np.random.SeedSequence(seed)
+    n_steps = steps_within(duration_s, sampling_interval_s)
+    if n_steps == 0:
+        raise ValueError("Duration is shorter than one sampling interval.")
+    sample_idx = np.unique(np.linspace(0, n_steps - 1, min(n_points, n_steps)).round().astype(np.int64))
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if runs * n_steps > _MC_PARALLEL_CELLS else 1
+    workers = max(1, min(workers, runs))
+    bounds = np.linspace(0, runs, workers + 1).round().astype(int)
+    tasks = [
+        (ss.entropy, int(a), int(b), effective_capacity_mAh, sampling_interval_s, n_steps, i_min, i_max, sample_idx)
+        for a, b in zip(bounds[:-1], bounds[1:])
+        if b > a
+    ]
+    if len(tasks) == 1:
+        parts = [_simulate_runs(tasks[0])]
+    else:
+        # spawn: callers may be threaded (GUI, services), where fork can deadlock.
+        with ProcessPoolExecutor(max_workers=len(tasks), mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_simulate_runs, tasks))
+
+    remaining = np.concatenate([p[0] for p in parts])
+    eta_err = np.concatenate([p[1] for p in parts])
+    depletion = np.concatenate([p[2] for p in parts])
+
+    with warnings.catch_warnings():
+        # Columns with no depleting run are all-NaN; report NaN quietly.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        eta_bands = np.nanpercentile(eta_err, percentiles, axis=0)
+    return MonteCarloResult(
+        seed=ss.entropy,
+        runs=runs,
+        percentiles=percentiles,
+        times_s=(sample_idx + 1) * sampling_interval_s,
+        remaining_bands=np.percentile(remaining, percentiles, axis=0),
+        eta_error_bands=eta_bands,
+        depletion_s=depletion,
+    )
@@ -0,0 +1,301 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+# ----------------------------
+# Content-addressed result cache
+# ----------------------------
+#
+# Results are keyed by a hash of the function's qualified name, an explicit
+# version, the source of the package (or module) defining it and its
+# normalized arguments, so a changed function, a changed helper it calls or
+# changed inputs never return a stale entry. Code outside that package is
+# not covered: bump cache_version when such a dependency changes. Cached
+# arrays are made read-only in place, including those of the object the
+# computing caller gets back: the same object is handed to every caller.
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+CACHE_DIR_ENV = "FLIGHTLAB_CACHE_DIR"  # enables the on-disk store for default_cache()
+CACHE_DISK_MB_ENV = "FLIGHTLAB_CACHE_MB"
+
+_MISSING = object()
+
+
+def _feed(h, value):
+    """Hash `value` in a normalized, type-tagged form."""
+    if value is None:
+        h.update(b"N")
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(b"T" if value else b"F")
+    elif isinstance(value, (int, np.integer)):
+        h.update(b"i%d;" % int(value))
+    elif isinstance(value, (float, np.floating)):
+        v = float(value)
+        # 2 and 2.0 are the same input; -0.0 is 0.0.
+        h.update(b"i%d;" % int(v) if v.is_integer() else b"f" + struct.pack("<d", v))
+    elif isinstance(value, str):
+        b = value.encode("utf-8")
+        h.update(b"s%d;" % len(b) + b)
+    elif isinstance(value, (bytes, bytearray)):
+        h.update(b"b%d;" % len(value) + bytes(value))
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            _feed(h, value.tolist())
+            return
+        a = np.ascontiguousarray(value)
+        h.update(b"a" + a.dtype.str.encode() + repr(a.shape).encode())
+        h.update(memoryview(a).cast("B"))
+    elif isinstance(value, (list, tuple)):
+        h.update(b"l%d;" % len(value))
+        for v in value:
+            _feed(h, v)
+    elif isinstance(value, dict):
+        h.update(b"d%d;" % len(value))
+        for k in sorted(value, key=repr):
+            _feed(h, k)
+            _feed(h, value[k])
+    elif isinstance(value, (set, frozenset)):
+        _feed(h, sorted(value, key=repr))
+    else:
+        raise TypeError(f"Cannot build a cache key from {type(value).__name__}.")
+
+
+_source_digests: Dict[str, bytes] = {}
+
+
+def _source_digest(module_name: str) -> bytes:
+    """Hash of every .py file of the top-level package holding the module (or of the module file)."""
+    top = module_name.split(".")[0]
+    digest = _source_digests.get(top)
+    if digest is None:
+        h = hashlib.blake2b(digest_size=20)
+        mod = sys.modules.get(top)
+        paths = []
+        if mod is not None and getattr(mod, "__path__", None):
+            for root in mod.__path__:
+                for d, dirs, files in os.walk(root):
+                    dirs.sort()
+                    paths.extend(os.path.join(d, f) for f in sorted(files) if f.endswith(".py"))
+        elif mod is not None and getattr(mod, "__file__", None):
+            paths.append(mod.__file__)
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    h.update(path.encode("utf-8", "replace") + b"\0" + f.read())
+            except OSError:
+                pass
+        digest = _source_digests[top] = h.digest()
+    return digest
+
+
+def cache_key(fn: Callable, args: tuple = (), kwargs: Optional[dict] = None, version: object = 1) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    code = getattr(fn, "__code__", None)
+    module = getattr(fn, "__module__", "") or ""
+    _feed(h, [module, getattr(fn, "__qualname__", repr(fn)), str(version)])
+    if code is not None:
+        h.update(code.co_code)
+        _feed(h, [c for c in code.co_consts if isinstance(c, (int, float, str, bytes, type(None)))])
+    h.update(_source_digest(module))
+    _feed(h, list(args))
+    _feed(h, kwargs or {})
+    return h.hexdigest()
+
+
+def _freeze(value, seen=None) -> int:
+    """Make arrays in `value` read-only (in place); returns the approximate size in bytes."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+        return value.nbytes
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_freeze(v, seen) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_freeze(v, seen) for v in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + _freeze(vars(value), seen)
+    return sys.getsizeof(value)
+
+
+class DiskStore:
+    """sqlite-backed store of pickled results, trimmed to `max_bytes` by last use."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_DISK_MAX_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "results.sqlite")
+        self.max_bytes = max_bytes
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB, size INTEGER, used REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+
+    def get(self, key: str):
+        row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return _MISSING
+        self._db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value) -> bool:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes // 4:
+            return False  # one result may not flush most of the store
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, used) VALUES (?, ?, ?, ?)",
+            (key, blob, len(blob), time.time()),
+        )
+        self._trim()
+        return True
+
+    def _trim(self):
+        total = self.size_bytes()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY used").fetchall():
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def size_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def clear(self):
+        self._db.execute("DELETE FROM results")
+        self._db.execute("VACUUM")
+
+    def close(self):
+        self._db.close()
+
+
+class ResultCache:
+    """Bounded in-memory LRU with an optional DiskStore behind it.
+
+    call(fn, *args, **kwargs) returns fn's cached result for the same
+    function (name, version, bytecode, package source) and normalized
+    arguments, computing and storing it on a miss. Arrays in a stored
+    result are made read-only in place, so even the caller that computed
+    it gets read-only arrays; copy before modifying. Thread-safe; a miss
+    computes outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk: Optional[DiskStore] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self._entries = OrderedDict()  # key -> (value, size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            value = self.disk.get(key) if self.disk is not None else _MISSING
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.disk_hits += 1
+            self._remember(key, value)
+            return value
+
+    def put(self, key: str, value, persist: bool = True):
+        with self._lock:
+            self._remember(key, value)
+            if persist and self.disk is not None:
+                self.disk.put(key, value)
+
+    def call(self, fn: Callable, *args, cache_version: object = 1, **kwargs):
+        key = cache_key(fn, args, kwargs, cache_version)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fn(*args, **kwargs)
+            self.put(key, value)
+        return value
+
+    def _remember(self, key: str, value):
+        size = _freeze(value)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+            if disk and self.disk is not None:
+                self.disk.clear()
+
+    def stats_text(self) -> str:
+        lookups = self.hits + self.disk_hits + self.misses
+        rate = f" ({100 * (self.hits + self.disk_hits) / lookups:.0f}%)" if lookups else ""
+        disk = f", {self.disk_hits} from disk" if self.disk is not None else ""
+        return (
+            f"Cache: {self.hits + self.disk_hits} hits{disk}, {self.misses} misses{rate}; "
+            f"{len(self)} entries, {self._bytes / 1e6:.1f} MB"
+        )
+
+
+_default: Optional[ResultCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> ResultCache:
+    """Process-wide cache shared by the tools.
+
+    Memory-only unless FLIGHTLAB_CACHE_DIR names a directory for the
+    on-disk store (capped at FLIGHTLAB_CACHE_MB, default 512 MB).
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            disk = None
+            directory = os.environ.get(CACHE_DIR_ENV)
+            if directory:
+                mb = float(os.environ.get(CACHE_DISK_MB_ENV) or DEFAULT_DISK_MAX_BYTES / 2**20)
+                disk = DiskStore(os.path.expanduser(directory), int(mb * 2**20))
+            _default = ResultCache(disk=disk)
+        return _default
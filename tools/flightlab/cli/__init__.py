@@ -0,0 +1,5 @@
+"""Headless commands dispatched by ``python -m flightlab <command>``.
+
+Each module exposes ``main(argv, prog) -> int`` and is only imported when its
+command is run, keeping shell-loop startup cheap.
+"""
@@ -0,0 +1,109 @@
+import argparse
+import os
+import re
+import sys
+from typing import Iterator, List, Sequence
+
+from flightlab.formats import FORMATS
+
+_SPLIT = re.compile(r"[,\s]+")
+
+
+def iter_tokens(spec: str) -> Iterator[str]:
+    """Tokens from a value spec.
+
+    ``"1200,900"`` is an inline comma list, ``"@path"`` reads a file and
+    ``"@-"`` reads stdin. Files may separate values with commas, whitespace or
+    newlines; ``#`` starts a comment. Files are read line by line.
+    """
+    if not spec.startswith("@"):
+        yield from (t for t in _SPLIT.split(spec) if t)
+        return
+    path = spec[1:]
+    fh = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line in fh:
+            line = line.split("#", 1)[0]
+            yield from (t for t in _SPLIT.split(line) if t)
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def iter_ints(spec: str, label: str) -> Iterator[int]:
+    for tok in iter_tokens(spec):
+        try:
+            yield int(tok)
+        except ValueError:
+            raise ValueError(f"Invalid {label} value '{tok}'. Use integers.")
+
+
+def read_floats(spec: str, label: str) -> List[float]:
+    out = []
+    for tok in iter_tokens(spec):
+        try:
+            out.append(float(tok))
+        except ValueError:
+            raise ValueError(f"Invalid {label} value '{tok}'. Use numbers.")
+    if not out:
+        raise ValueError(f"{label} cannot be empty.")
+    return out
+
+
+def read_range(spec: str, label: str) -> List[float]:
+    """START:STOP:STEP (STOP included) or a list as read_floats() takes it."""
+    parts = spec.split(":")
+    if len(parts) == 1 or spec.startswith("@"):
+        return read_floats(spec, label)
+    if len(parts) != 3:
+        raise ValueError(f"Invalid {label} range '{spec}'. Use START:STOP:STEP or a list.")
+    try:
+        start, stop, step = (float(v) for v in parts)
+    except ValueError:
+        raise ValueError(f"Invalid {label} range '{spec}'. Use numbers.")
+    if step <= 0 or stop < start:
+        raise ValueError(f"{label} range needs STOP >= START and STEP > 0.")
+    count = int((stop - start) / step + 1e-9) + 1
+    return [start + step * i for i in range(count)]
+
+
+def check_single_stdin(specs: Sequence[str]):
+    if sum(1 for s in specs if s == "@-") > 1:
+        raise ValueError("Only one input can be read from stdin (@-).")
+
+
+def expand_paths(paths: Sequence[str], suffix: str = ".stl") -> List[str]:
+    """Files as given; directories searched recursively for *<suffix>, in sorted order."""
+    out = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                out.extend(os.path.join(root, f) for f in sorted(files) if f.lower().endswith(suffix))
+        else:
+            out.append(path)
+    return out
+
+
+def add_output_arguments(parser: argparse.ArgumentParser, chunk_rows: int = 65536):
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout).")
+    parser.add_argument(
+        "-f", "--format", choices=FORMATS, default=None,
+        help="Output format (default: from the output extension, else csv).",
+    )
+    parser.add_argument(
+        "--chunk-rows", type=int, default=chunk_rows,
+        help=f"Rows computed and written per chunk (default: {chunk_rows}).",
+    )
+
+
+def fail(message: str) -> int:
+    print(f"error: {message}", file=sys.stderr)
+    return 1
+
+
+def quiet_broken_pipe() -> int:
+    # Downstream closed early (e.g. "| head"); silence the final flush at exit.
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    return 0
@@ -0,0 +1,80 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe, read_range
+
+DESCRIPTION = """\
+2-D airfoil polar from a linear-strength vortex panel method: one row per
+angle of attack with c_l, c_m about the quarter chord and, with
+--reynolds, a boundary-layer drag estimate, L/D and transition points.
+The section is a NACA 4-digit code or is cut from a wing STL at a spanwise
+station (its incidence is removed and reported on stderr). The geometry is
+solved once, so long angle sweeps cost little more than short ones.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    from flightlab.panel import DEFAULT_PANELS
+
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--naca", help="NACA 4-digit section, e.g. 2412.")
+    src.add_argument("--wing-stl", help="Cut the section from this wing STL (see --station).")
+    p.add_argument("--station", type=float, default=None, help="Spanwise station for --wing-stl (default: mid-span).")
+    p.add_argument("--span-axis", choices=("x", "y", "z"), default="y", help="Spanwise STL axis (default: y).")
+    p.add_argument("--chord-axis", choices=("x", "y", "z"), default="x", help="Chordwise STL axis (default: x).")
+    p.add_argument("--alpha", default="-5:15:0.5", help="Angles (deg): START:STOP:STEP, '0,2,4', @file or @-; write --alpha=-4:10:1 when negative (default: -5:15:0.5).")
+    p.add_argument("--panels", type=int, default=DEFAULT_PANELS, help=f"Panel count, even (default: {DEFAULT_PANELS}).")
+    p.add_argument("--reynolds", type=float, default=None, help="Chord Reynolds number; enables the drag estimate.")
+    p.add_argument("--cp", default=None, metavar="CSV", help="Also write the pressure distribution per angle to CSV.")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    import numpy as np
+
+    from flightlab.panel import AIRFOIL_COLUMNS, PanelAirfoil, airfoil_from_section, naca4
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        alpha = read_range(args.alpha, "Angle")
+        if args.naca:
+            x, y = naca4(args.naca, args.panels)
+            name = f"NACA {args.naca}"
+        else:
+            from flightlab.slicing import slice_wing
+            from flightlab.stl import load_stl
+
+            mesh = load_stl(args.wing_stl)
+            stations = [args.station] if args.station is not None else None
+            wing = slice_wing(mesh, stations, 3, args.span_axis, args.chord_axis)
+            sec = wing.sections[0] if args.station is not None else wing.sections[1]
+            x, y, incidence = airfoil_from_section(sec, args.panels)
+            name = f"{args.wing_stl} @ {sec.station:g}"
+            print(f"{name}: chord={sec.chord:.6g} t/c={sec.thickness_ratio:.4g} incidence={incidence:.3g} deg", file=sys.stderr)
+        polar = PanelAirfoil(x, y).solve(alpha, args.reynolds)
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, AIRFOIL_COLUMNS) as writer:
+            writer.write(polar.columns())
+        if args.cp:
+            cols = ("alpha_deg", "x", "y", "cp")
+            n = len(polar.x)
+            with open_writer("csv", args.cp, cols) as writer:
+                for k, a in enumerate(polar.alpha_deg):
+                    writer.write({"alpha_deg": np.full(n, a), "x": polar.x, "y": polar.y, "cp": polar.cp[k]})
+        if len(polar) > 1:
+            slope, cl0 = np.polyfit(np.radians(polar.alpha_deg), polar.cl, 1)
+            summary = f"{name}: cl_alpha={slope:.4g}/rad alpha_0={-np.degrees(cl0 / slope):.3g} deg"
+            if np.any(np.isfinite(polar.ld)):
+                k = int(np.nanargmax(polar.ld))
+                summary += f", best L/D {polar.ld[k]:.4g} at {polar.alpha_deg[k]:g} deg"
+            print(summary, file=sys.stderr)
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,54 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import expand_paths, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Check STL files for watertightness before CFD or printing: boundary,
+non-manifold and duplicate edges, inconsistent winding, degenerate and
+duplicate triangles, inward-facing normals and self-overlapping triangles.
+Directories are searched for *.stl. Exits with status 1 if any mesh fails,
+so it can gate a docs build or print queue.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="STL", help="STL files or directories.")
+    p.add_argument(
+        "--tolerance", type=float, default=None,
+        help="Vertex weld distance in model units (default: 1e-6 of the bounding-box diagonal).",
+    )
+    p.add_argument("--no-overlaps", action="store_true", help="Skip the self-overlap test.")
+    p.add_argument("--examples", type=int, default=20, help="Examples listed per issue in --json (default: 20).")
+    p.add_argument("--json", action="store_true", help="Print one JSON report per file.")
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.meshcheck import check_mesh
+    from flightlab.stl import load_stl
+
+    failed = 0
+    try:
+        paths = expand_paths(args.paths)
+        if not paths:
+            raise ValueError("No STL files found.")
+        for path in paths:
+            health = check_mesh(load_stl(path), args.tolerance, not args.no_overlaps, args.examples)
+            failed += not health.ok
+            if args.json:
+                print(json.dumps(health.to_dict()))
+            else:
+                verdict = "ok" if health.ok else "FAIL: " + "; ".join(health.problems())
+                print(f"{path}: {health.triangles} triangles, {verdict}")
+            sys.stdout.flush()
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 1 if failed else 0
@@ -0,0 +1,48 @@
+import argparse
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Run the coulomb-counting battery simulator on a simulated clock as fast as
+possible and stream one row per sample. The same inputs and --seed always
+produce identical output, so runs can be diffed in CI.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--capacity", type=float, required=True, help="Battery capacity (mAh).")
+    p.add_argument("--no-80", action="store_true", help="Use the full capacity instead of the 80%% rule.")
+    p.add_argument("--sampling", type=float, default=0.1, help="Sampling interval in seconds (default: 0.1).")
+    p.add_argument("--duration", type=float, required=True, help="Simulated duration in seconds.")
+    p.add_argument("--i-min", type=float, required=True, help="Minimum current draw (A).")
+    p.add_argument("--i-max", type=float, required=True, help="Maximum current draw (A).")
+    p.add_argument("--seed", type=int, default=None, help="Random seed for the current draw.")
+    add_output_arguments(p, chunk_rows=16384)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.battery import RECORD_COLUMNS, DischargeSimulation, effective_capacity
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        sim = DischargeSimulation(
+            effective_capacity(args.capacity, not args.no_80),
+            args.sampling, args.duration, args.i_min, args.i_max, args.seed,
+        )
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, RECORD_COLUMNS) as writer:
+            while True:
+                batch = sim.run(args.chunk_rows)
+                if not batch:
+                    break
+                writer.write(dict(zip(RECORD_COLUMNS, zip(*batch))))
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,60 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Run many independent random-current discharges at once and write percentile
+bands of remaining capacity and ETA error over time (one row per sample
+time). A depletion-time summary is printed to stderr.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--capacity", type=float, required=True, help="Battery capacity (mAh).")
+    p.add_argument("--no-80", action="store_true", help="Use the full capacity instead of the 80%% rule.")
+    p.add_argument("--sampling", type=float, default=0.1, help="Sampling interval in seconds (default: 0.1).")
+    p.add_argument("--duration", type=float, required=True, help="Simulated duration in seconds.")
+    p.add_argument("--i-min", type=float, required=True, help="Minimum current draw (A).")
+    p.add_argument("--i-max", type=float, required=True, help="Maximum current draw (A).")
+    p.add_argument("--runs", type=int, default=1000, help="Number of trajectories (default: 1000).")
+    p.add_argument("--seed", type=int, default=None, help="Base seed; run i uses child stream i.")
+    p.add_argument("--points", type=int, default=500, help="Sample times in the output (default: 500).")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: auto).")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.battery import effective_capacity, monte_carlo_discharge
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        res = monte_carlo_discharge(
+            effective_capacity(args.capacity, not args.no_80),
+            args.sampling, args.duration, args.i_min, args.i_max, args.runs,
+            seed=args.seed, n_points=args.points, workers=args.workers,
+        )
+        cols = {"Time (s)": res.times_s}
+        for p, band in zip(res.percentiles, res.remaining_bands):
+            cols[f"Remaining p{p:g} (mAh)"] = band
+        for p, band in zip(res.percentiles, res.eta_error_bands):
+            cols[f"ETA error p{p:g} (min)"] = band
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, list(cols)) as writer:
+            writer.write(cols)
+
+        dep = ", ".join(f"p{p:g}={v:.1f}" for p, v in zip(res.percentiles, res.depletion_percentiles()))
+        print(
+            f"runs={res.runs} seed={res.seed} depleted={res.depleted_fraction:.1%} depletion_s: {dep}",
+            file=sys.stderr,
+        )
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
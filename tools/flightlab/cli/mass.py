@@ -0,0 +1,79 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Estimate the printed mass and centre of gravity of STL parts (shell of
+--shell-mm walls plus --infill of the interior) and of the whole assembly.
+One row per part plus an Assembly row is written; the all-up weight
+(parts + --extra-g), recommended power and, with --thrust-g, the thrust
+checks are printed to stderr.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    from flightlab.mass import DEFAULT_INFILL, DEFAULT_SHELL_MM, MATERIAL_DENSITY_G_CM3
+    from flightlab.power import FLIGHT_TYPES
+
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="STL", help="STL part file(s), in one coordinate system.")
+    p.add_argument(
+        "--material", choices=list(MATERIAL_DENSITY_G_CM3), default="PLA",
+        help="Filament, for its density (default: PLA).",
+    )
+    p.add_argument("--density", type=float, default=None, help="Density in g/cm^3 (overrides --material).")
+    p.add_argument("--shell-mm", type=float, default=DEFAULT_SHELL_MM, help=f"Wall thickness (default: {DEFAULT_SHELL_MM}).")
+    p.add_argument("--infill", type=float, default=DEFAULT_INFILL * 100, help=f"Infill %% (default: {DEFAULT_INFILL * 100:g}).")
+    p.add_argument("--unit-mm", type=float, default=1.0, help="Millimetres per model unit (default: 1; 25.4 for inches).")
+    p.add_argument("--extra-g", type=float, default=0.0, help="Non-printed mass: electronics, battery, ... (g).")
+    p.add_argument("--flight-type", choices=FLIGHT_TYPES, default="trainer", help="Flight type for the power estimate.")
+    p.add_argument("--thrust-g", type=float, default=None, help="Static thrust (g) for the thrust checks.")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: auto).")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    import numpy as np
+
+    from flightlab.mass import MATERIAL_DENSITY_G_CM3, PART_COLUMNS, estimate_printed_mass
+    from flightlab.writers import infer_format, open_writer
+
+    density = args.density if args.density is not None else MATERIAL_DENSITY_G_CM3[args.material]
+    try:
+        res = estimate_printed_mass(
+            args.paths, density, args.shell_mm, args.infill / 100.0, args.unit_mm, workers=args.workers,
+        )
+        cg = res.cg_mm
+        total = {
+            "part": "Assembly",
+            "triangles": res.parts["triangles"].sum(),
+            "volume_cm3": res.parts["volume_cm3"].sum(),
+            "shell_cm3": res.parts["shell_cm3"].sum(),
+            "printed_cm3": res.parts["printed_cm3"].sum(),
+            "mass_g": res.mass_g,
+            "cg_x_mm": cg[0],
+            "cg_y_mm": cg[1],
+            "cg_z_mm": cg[2],
+        }
+        rows = {c: np.append(res.parts[c], total[c]) for c in PART_COLUMNS}
+        rows["part"] = rows["part"].tolist()
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, PART_COLUMNS) as writer:
+            writer.write(rows)
+
+        check = res.power_check(args.flight_type, args.thrust_g, args.extra_g)
+        thrust = " ".join(f"{k}={'OK' if check[k] else 'No'}" for k in ("hover", "takeoff", "climb") if k in check)
+        print(
+            f"weight_kg={check['weight_kg']:.3f} input_power_w={check['input_power_w']:.1f} {thrust}".rstrip(),
+            file=sys.stderr,
+        )
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
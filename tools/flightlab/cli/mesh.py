@@ -0,0 +1,57 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Load binary (memory-mapped) or ASCII STL files and print triangle count,
+bounding box, surface area, signed volume, centroid and inertia tensor.
+Values are in the model's units (usually mm); the inertia tensor is about
+the centroid for a uniform --density (mass per unit^3).
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="STL", help="STL file(s).")
+    p.add_argument("--density", type=float, default=1.0, help="Mass per unit^3 for mass and inertia (default: 1).")
+    p.add_argument("--json", action="store_true", help="Print one JSON object per file.")
+    return p
+
+
+def _text(summary) -> str:
+    vec = lambda v: " ".join(f"{x:.6g}" for x in v)
+    lines = [
+        f"{summary['path']}: {summary['triangles']} triangles ({summary['name'] or 'no name'})",
+        f"  bbox min      {vec(summary['bbox_min'])}",
+        f"  bbox max      {vec(summary['bbox_max'])}",
+        f"  size          {vec(summary['size'])}",
+        f"  surface area  {summary['surface_area']:.6g}",
+        f"  volume        {summary['volume']:.6g}",
+        f"  mass          {summary['mass']:.6g}",
+        f"  centroid      {vec(summary['centroid'])}",
+        "  inertia       " + "\n                ".join(vec(row) for row in summary["inertia"]),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.stl import load_stl
+
+    try:
+        for path in args.paths:
+            summary = load_stl(path).summary(args.density)
+            if args.json:
+                print(json.dumps({k: v.tolist() if hasattr(v, "tolist") else v for k, v in summary.items()}))
+            else:
+                print(_text(summary))
+            sys.stdout.flush()
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,64 @@
+import argparse
+from typing import Dict, List, Optional
+
+from flightlab.cli._common import (
+    add_output_arguments,
+    check_single_stdin,
+    fail,
+    iter_ints,
+    iter_tokens,
+    quiet_broken_pipe,
+    read_floats,
+)
+
+DESCRIPTION = """\
+Sweep motor KV x battery voltage and stream RPM, torque class, power and ESC
+recommendation rows. Values are inline comma lists or @file / @- (stdin).
+KV values are read lazily, so the KV list itself may be arbitrarily long.
+"""
+
+
+def _read_kv_currents(spec: str) -> Dict[int, float]:
+    pairs: Dict[int, float] = {}
+    for tok in iter_tokens(spec):
+        try:
+            kv_s, cur_s = tok.split(":")
+            pairs[int(float(kv_s))] = float(cur_s)
+        except ValueError:
+            raise ValueError(f"Invalid current draw '{tok}'. Use KV:Current pairs (e.g. 2300:30).")
+    return pairs
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--kv", required=True, help="KV ratings, e.g. 2300,1200,900 or @kv.txt.")
+    p.add_argument("--voltages", required=True, help="Battery voltages (V), e.g. 14.8,11.1.")
+    p.add_argument(
+        "--currents", default="",
+        help="KV:Current(A) pairs, e.g. 2300:30,1200:40. Missing KVs use 0 A.",
+    )
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    # Imported after argument parsing so --help stays instant.
+    from flightlab.motor_esc import RESULT_COLUMNS, iter_motor_esc_chunks
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        check_single_stdin([args.kv, args.voltages, args.currents])
+        volts = read_floats(args.voltages, "voltage")
+        currents = _read_kv_currents(args.currents)
+        fmt = args.format or infer_format(args.output)
+        kv_iter = iter_ints(args.kv, "KV")
+        with open_writer(fmt, args.output, RESULT_COLUMNS) as writer:
+            for chunk in iter_motor_esc_chunks(kv_iter, volts, currents, args.chunk_rows):
+                writer.write(chunk.export_columns())
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
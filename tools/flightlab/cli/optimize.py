@@ -0,0 +1,90 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Search the plane power-system design space for the designs that pass the
+thrust and battery checks with the best objective (default: lowest motor
+weight). Give every airframe column a fixed value or a LOW:HIGH range; the
+ranked feasible designs are written one per row and a summary is printed
+to stderr.
+"""
+
+# airframe column -> (option, example); flight_type is handled separately
+_BOUND_OPTIONS = {
+    "weight_kg": ("--weight-kg", "1.2 or 0.8:2.5"),
+    "wingspan_cm": ("--wingspan-cm", "120 or 90:180"),
+    "efficiency_pct": ("--efficiency-pct", "70"),
+    "pitch_cm": ("--pitch-cm", "15 or 8:20"),
+    "rpm": ("--rpm", "9000 or 6000:12000"),
+    "thrust_g": ("--thrust-g", "1200"),
+    "max_current_a": ("--max-current-a", "45"),
+    "capacity_mah": ("--capacity-mah", "3000 or 1000:5000"),
+    "c_rate": ("--c-rate", "35 or 20:60"),
+}
+
+
+def _bound(text: str):
+    lo, sep, hi = text.partition(":")
+    try:
+        return (float(lo), float(hi)) if sep else float(lo)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or LOW:HIGH, got '{text}'")
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    from flightlab.optimize import DEFAULT_CONSTRAINTS, DEFAULT_OBJECTIVE, SAMPLERS
+    from flightlab.power import FLIGHT_TYPES
+
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--flight-type", choices=FLIGHT_TYPES, default="trainer", help="Flight type (default: trainer).")
+    for name, (option, example) in _BOUND_OPTIONS.items():
+        p.add_argument(option, dest=name, type=_bound, required=True, metavar="V|LO:HI", help=f"e.g. {example}")
+    p.add_argument("--sampler", choices=SAMPLERS, default="lhs", help="Sampling of the box (default: lhs).")
+    p.add_argument("--samples", type=int, default=100_000, help="Points sampled (default: 100000).")
+    p.add_argument("--refine", type=int, default=3, help="Refinement rounds around the best designs (default: 3).")
+    p.add_argument("--objective", default=DEFAULT_OBJECTIVE, help=f"Column to optimize (default: {DEFAULT_OBJECTIVE}).")
+    p.add_argument("--maximize", action="store_true", help="Maximize the objective instead of minimizing it.")
+    p.add_argument(
+        "--require", default=",".join(DEFAULT_CONSTRAINTS),
+        help=f"Comma-separated checks a design must pass (default: {','.join(DEFAULT_CONSTRAINTS)}).",
+    )
+    p.add_argument("--keep", type=int, default=100, help="Ranked designs to write (default: 100).")
+    p.add_argument("--seed", type=int, default=None, help="Seed for random/lhs sampling and refinement.")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: auto).")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.optimize import optimize_airframe
+    from flightlab.power import AIRFRAME_COLUMNS, AIRFRAME_RESULT_COLUMNS, FLIGHT_TYPES
+    from flightlab.writers import infer_format, open_writer
+
+    bounds = {name: getattr(args, name) for name in _BOUND_OPTIONS}
+    bounds["flight_type"] = args.flight_type
+    try:
+        res = optimize_airframe(
+            bounds, samples=args.samples, sampler=args.sampler, objective=args.objective,
+            maximize=args.maximize, constraints=[c for c in args.require.split(",") if c],
+            keep=args.keep, refine_rounds=args.refine, seed=args.seed, workers=args.workers,
+        )
+        designs = dict(res.designs)
+        designs["flight_type"] = [FLIGHT_TYPES[int(c)] for c in designs["flight_type"].tolist()]
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS) as writer:
+            writer.write(designs)
+        print(
+            f"sampler={res.sampler} seed={res.seed} evaluated={res.evaluated} feasible={res.feasible} "
+            f"ranked={len(res)}",
+            file=sys.stderr,
+        )
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,78 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, expand_paths, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Compute C_L, C_D and L/D from CFD exports (Flow Simulation goal tables or
+tables with an AoA column; directories are searched for *.csv) and write
+one row per run, sorted by configuration, speed and AoA. The best L/D per
+configuration is printed to stderr. The reference area comes from --area
+or is measured from a wing STL with --wing-stl.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    from flightlab.aero import DEFAULT_PATTERN, DEFAULT_SPEED_MS, FRAMES, MU_KG_MS, RHO_KG_M3
+
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="CSV", help="CFD export files or directories.")
+    area = p.add_mutually_exclusive_group(required=True)
+    area.add_argument("--area", type=float, help="Reference wing area S (m^2).")
+    area.add_argument("--wing-stl", help="Measure S and the mean aerodynamic chord from this wing STL.")
+    p.add_argument("--unit-mm", type=float, default=1.0, help="Millimetres per STL unit for --wing-stl (default: 1).")
+    p.add_argument("--span-axis", choices=("x", "y", "z"), default="y", help="Spanwise STL axis (default: y).")
+    p.add_argument("--chord-axis", choices=("x", "y", "z"), default="x", help="Chordwise STL axis (default: x).")
+    p.add_argument("--rho", type=float, default=RHO_KG_M3, help=f"Air density kg/m^3 (default: {RHO_KG_M3}).")
+    p.add_argument("--speed", type=float, default=DEFAULT_SPEED_MS, help=f"Airspeed m/s for runs that name none (default: {DEFAULT_SPEED_MS:g}).")
+    p.add_argument("--mac", type=float, default=None, help="Mean aerodynamic chord (m) for Reynolds numbers.")
+    p.add_argument("--mu", type=float, default=MU_KG_MS, help=f"Dynamic viscosity kg/(m s) (default: {MU_KG_MS}).")
+    p.add_argument("--pattern", default=DEFAULT_PATTERN, help="Regex with config/aoa/speed groups, matched against file names.")
+    p.add_argument("--frame", choices=FRAMES, default="wind", help="wind: model rotated; body: flow direction rotated by AoA.")
+    p.add_argument("--lift-axis", default="y", help="Force component that is lift, e.g. y or -z (default: y).")
+    p.add_argument("--drag-axis", default="x", help="Force component that is drag (default: x).")
+    p.add_argument("--save", default=None, metavar="NPZ", help="Also save the polar dataset (.npz) for load_polars().")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: auto).")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.aero import POLAR_COLUMNS, build_polars
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        area, mac = args.area, args.mac
+        if args.wing_stl:
+            from flightlab.slicing import slice_wing
+            from flightlab.stl import load_stl
+
+            wing = slice_wing(load_stl(args.wing_stl), span_axis=args.span_axis, chord_axis=args.chord_axis)
+            m = args.unit_mm / 1000.0
+            area = wing.reference_area * m * m
+            mac = mac or wing.mean_aerodynamic_chord * m
+            print(f"{args.wing_stl}: S={area:.6g} m^2 MAC={mac:.6g} m", file=sys.stderr)
+        paths = expand_paths(args.paths, ".csv")
+        polars = build_polars(
+            paths, area, args.rho, args.speed, mac, args.mu, args.pattern,
+            args.frame, args.lift_axis, args.drag_axis, args.workers,
+        )
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, POLAR_COLUMNS) as writer:
+            writer.write(polars.columns())
+        if args.save:
+            polars.save(args.save)
+        for s in polars.summary():
+            print(
+                f"{s['config']}: {s['points']} runs, best L/D {s['best_ld']:.4g} at {s['best_ld_aoa_deg']:g} deg, "
+                f"CL max {s['cl_max']:.4g}, CD min {s['cd_min']:.4g}",
+                file=sys.stderr,
+            )
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,48 @@
+import argparse
+from itertools import chain
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Evaluate the plane power-system rules of thumb for every airframe in a CSV
+table and stream the inputs plus required power, motor weight, pack voltage,
+pitch speed, thrust/battery checks and ESC rating. The table needs a header
+with the columns listed below ('-' reads stdin); flight_type is trainer,
+glider or aerobatic (or 0/1/2).
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog=prog, description=DESCRIPTION,
+        epilog="columns: weight_kg, wingspan_cm, flight_type, efficiency_pct, pitch_cm, rpm, "
+        "thrust_g, max_current_a, capacity_mah, c_rate",
+    )
+    p.add_argument("--airframes", required=True, help="Airframe table (CSV path or '-').")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.power import AIRFRAME_COLUMNS, AIRFRAME_RESULT_COLUMNS, FLIGHT_TYPES, evaluate_airframes, iter_airframe_csv
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        fmt = args.format or infer_format(args.output)
+        chunks = iter_airframe_csv(args.airframes, args.chunk_rows)
+        first = next(chunks, None)  # surface header/parse errors before any output
+        if first is not None:
+            chunks = chain([first], chunks)
+        with open_writer(fmt, args.output, AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS) as writer:
+            for chunk in chunks:
+                results = evaluate_airframes(chunk)
+                chunk["flight_type"] = [FLIGHT_TYPES[c] for c in chunk["flight_type"].tolist()]
+                writer.write({**chunk, **results})
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
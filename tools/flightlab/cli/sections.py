@@ -0,0 +1,63 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe, read_floats
+
+DESCRIPTION = """\
+Cut a wing STL at spanwise stations and write one row per station: chord,
+max thickness, t/c, section area, closed loop and open chain counts (open
+chains mean holes in the mesh) and leading-edge position. The span, reference area S (chord integrated over the sliced span), mean
+aerodynamic chord and aspect ratio are printed to stderr; S is the area in
+C_L = L / (0.5 rho V^2 S). Lengths are in model units (usually mm).
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("path", metavar="STL", help="Wing STL file.")
+    p.add_argument("--stations", type=int, default=100, help="Evenly spaced stations over the span (default: 100).")
+    p.add_argument("--at", default=None, help="Explicit stations instead: '0,50,100', @file or @-.")
+    p.add_argument("--span-axis", choices=("x", "y", "z"), default="y", help="Spanwise model axis (default: y).")
+    p.add_argument("--chord-axis", choices=("x", "y", "z"), default="x", help="Chordwise model axis (default: x).")
+    p.add_argument("--loops", default=None, metavar="CSV", help="Also write every section polyline point to CSV.")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    import numpy as np
+
+    from flightlab.slicing import SECTION_COLUMNS, slice_wing
+    from flightlab.stl import load_stl
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        stations = read_floats(args.at, "Stations") if args.at else None
+        wing = slice_wing(load_stl(args.path), stations, args.stations, args.span_axis, args.chord_axis)
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, SECTION_COLUMNS) as writer:
+            writer.write(wing.columns())
+        if args.loops:
+            cols = ("station", "loop", "closed", "point", "chordwise", "normal")
+            with open_writer("csv", args.loops, cols) as writer:
+                for sec in wing.sections:
+                    for k, loop in enumerate(sec.loops):
+                        n = len(loop)
+                        writer.write({
+                            "station": np.full(n, sec.station), "loop": np.full(n, k), "closed": np.full(n, sec.closed[k]),
+                            "point": np.arange(n),
+                            "chordwise": loop[:, 0], "normal": loop[:, 1],
+                        })
+        print(
+            f"span={wing.span:.6g} S={wing.reference_area:.6g} MAC={wing.mean_aerodynamic_chord:.6g} "
+            f"AR={wing.aspect_ratio:.4g}",
+            file=sys.stderr,
+        )
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
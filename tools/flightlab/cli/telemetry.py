@@ -0,0 +1,83 @@
+import argparse
+import time
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe
+
+DESCRIPTION = """\
+Coulomb-count a live or recorded current stream and write one row per
+sample. --source replay plays a CSV log of time (s), current (A) rows at
+--speed x real time (0 = as fast as possible); udp and serial read
+telemetry frames with one 'current' or 't,current' sample per line.
+Stops at --duration, on depletion, at the end of a replay, or on Ctrl+C.
+"""
+
+POLL_S = 0.05
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    from flightlab.telemetry import SOURCE_KINDS
+
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--source", choices=SOURCE_KINDS, required=True, help="Current source.")
+    p.add_argument(
+        "--address", required=True,
+        help="Log path (replay), port or host:port (udp), device or device:baud (serial).",
+    )
+    p.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier (default: 1, 0 = max).")
+    p.add_argument("--capacity", type=float, required=True, help="Battery capacity (mAh).")
+    p.add_argument("--no-80", action="store_true", help="Use the full capacity instead of the 80%% rule.")
+    p.add_argument("--duration", type=float, default=float("inf"), help="Stop after this many seconds of samples.")
+    add_output_arguments(p, chunk_rows=16384)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    import numpy as np
+
+    from flightlab.battery import RECORD_COLUMNS, effective_capacity, integrate_samples
+    from flightlab.telemetry import open_source
+    from flightlab.writers import infer_format, open_writer
+
+    eff = effective_capacity(args.capacity, not args.no_80)
+    source = None
+    try:
+        source = open_source(args.source, args.address, args.speed)
+        fmt = args.format or infer_format(args.output)
+        source.start()
+        with open_writer(fmt, args.output, RECORD_COLUMNS) as writer:
+            consumed, last_t = 0.0, 0.0
+            while True:
+                samples = source.read(args.chunk_rows)
+                if len(samples):
+                    recs = integrate_samples(consumed, last_t, samples[:, 0], samples[:, 1], eff)
+                    n = len(recs)
+                    late = np.flatnonzero(recs[:, 0] >= args.duration)
+                    if late.size:
+                        n = int(late[0])
+                    empty = np.flatnonzero(recs[:n, 3] <= 0.0)
+                    if empty.size:
+                        n = int(empty[0]) + 1
+                    if n:
+                        writer.write(dict(zip(RECORD_COLUMNS, recs[:n].T)))
+                        consumed, last_t = float(recs[n - 1, 2]), float(recs[n - 1, 0])
+                    if n < len(recs):
+                        break
+                elif source.error:
+                    return fail(source.error)
+                elif source.finished:
+                    break
+                else:
+                    time.sleep(POLL_S)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    finally:
+        if source is not None:
+            source.stop()
+    return 0
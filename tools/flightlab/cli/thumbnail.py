@@ -0,0 +1,59 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import expand_paths, fail
+
+DESCRIPTION = """\
+Render static PNG thumbnails of STL files with the docs viewer's default
+camera and lighting, for pages that show an image until the reader clicks
+to load the 3D view. Directories are searched for *.stl. Thumbnails are
+only re-rendered when the STL's content or the render options change
+(tracked in thumbnails.json next to the images).
+"""
+
+
+def _size(text: str):
+    try:
+        w, h = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("use WIDTHxHEIGHT, e.g. 600x520")
+    return w, h
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="STL", help="STL files or directories.")
+    p.add_argument("--out-dir", default=None, help="Output directory (default: next to each STL).")
+    p.add_argument("--size", type=_size, default=(600, 520), help="Image size WIDTHxHEIGHT (default: 600x520).")
+    p.add_argument("--projection", choices=("perspective", "orthographic"), default="perspective")
+    p.add_argument("--color", default="#aaaaaa", help="Part color, as the viewer's data-color (default: #aaaaaa).")
+    p.add_argument("--background", default=None, help="Background color (default: transparent).")
+    p.add_argument("--supersample", type=int, default=2, help="Anti-aliasing factor per axis (default: 2).")
+    p.add_argument("--force", action="store_true", help="Re-render even if nothing changed.")
+    p.add_argument("--workers", type=int, default=None, help="Processes (default: auto; 1 = single process).")
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.render import parse_color, render_thumbnails
+
+    try:
+        paths = expand_paths(args.paths)
+        if not paths:
+            raise ValueError("No STL files found.")
+        parse_color(args.color)
+        if args.background is not None:
+            parse_color(args.background)
+        entries = render_thumbnails(
+            paths, args.out_dir, args.force, args.workers,
+            size=list(args.size), projection=args.projection, color=args.color,
+            background=args.background, supersample=args.supersample,
+        )
+        for e in entries:
+            print(f"{e['thumbnail']}: {'rendered' if e['rendered'] else 'unchanged'}", file=sys.stderr)
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
@@ -0,0 +1,81 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import add_output_arguments, fail, quiet_broken_pipe, read_range
+
+DESCRIPTION = """\
+3-D wing estimate from a vortex lattice method: one row per (alpha, beta)
+case with C_L, induced drag C_Di, Oswald efficiency e, side force and
+rolling moment. The planform is straight-tapered with sweep (quarter
+chord), dihedral, linear twist and optional winglets; lengths in any one
+unit. --alpha0 takes the section's zero-lift angle (see the airfoil
+command) to account for camber. The lattice is solved once per geometry,
+so sweeps over many cases cost little more than one.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("--span", type=float, required=True, help="Projected span, tip to tip.")
+    p.add_argument("--root-chord", type=float, required=True, help="Root chord (same unit as --span).")
+    p.add_argument("--taper", type=float, default=1.0, help="Tip chord / root chord (default: 1).")
+    p.add_argument("--sweep", type=float, default=0.0, help="Quarter-chord sweep, deg (default: 0).")
+    p.add_argument("--dihedral", type=float, default=0.0, help="Dihedral, deg (default: 0).")
+    p.add_argument("--twist", type=float, default=0.0, help="Tip incidence relative to the root, deg; negative is washout.")
+    p.add_argument("--incidence", type=float, default=0.0, help="Root incidence, deg (default: 0).")
+    p.add_argument("--alpha0", type=float, default=0.0, help="Section zero-lift angle, deg (e.g. -2.1 for a 2412).")
+    p.add_argument("--winglet-height", type=float, default=0.0, help="Winglet length along its span (default: none).")
+    p.add_argument("--winglet-cant", type=float, default=90.0, help="Winglet angle from horizontal, deg (default: 90).")
+    p.add_argument("--winglet-taper", type=float, default=1.0, help="Winglet tip chord / wing tip chord (default: 1).")
+    p.add_argument("--winglet-sweep", type=float, default=0.0, help="Winglet leading-edge sweep, deg (default: 0).")
+    p.add_argument("--alpha", default="-4:12:1", help="Angles of attack (deg): START:STOP:STEP or a list; write --alpha=-4:12:1 when negative.")
+    p.add_argument("--beta", default="0", help="Sideslip angles (deg), crossed with --alpha (default: 0).")
+    p.add_argument("--n-span", type=int, default=32, help="Spanwise panels per half wing (default: 32).")
+    p.add_argument("--n-chord", type=int, default=4, help="Chordwise panels (default: 4).")
+    p.add_argument("--n-winglet", type=int, default=8, help="Spanwise panels per winglet (default: 8).")
+    p.add_argument("--loading", default=None, metavar="CSV", help="Also write the span loading of every case to CSV.")
+    add_output_arguments(p)
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    import numpy as np
+
+    from flightlab.vlm import LOADING_COLUMNS, WING_COLUMNS, Planform, VortexLattice
+    from flightlab.writers import infer_format, open_writer
+
+    try:
+        alpha = np.array(read_range(args.alpha, "Angle"))
+        beta = np.array(read_range(args.beta, "Sideslip"))
+        planform = Planform(
+            args.span, args.root_chord, args.taper, args.sweep, args.dihedral, args.twist, args.incidence,
+            args.alpha0, args.winglet_height, args.winglet_cant, args.winglet_taper, args.winglet_sweep,
+        )
+        lattice = VortexLattice(planform, args.n_span, args.n_chord, args.n_winglet)
+        a, b = np.meshgrid(alpha, beta, indexing="ij")
+        loads = lattice.solve(a.reshape(-1), b.reshape(-1))
+        fmt = args.format or infer_format(args.output)
+        with open_writer(fmt, args.output, WING_COLUMNS) as writer:
+            writer.write(loads.columns())
+        if args.loading:
+            with open_writer("csv", args.loading, LOADING_COLUMNS) as writer:
+                writer.write(loads.loading_columns())
+        summary = (
+            f"S={planform.reference_area:.6g} AR={planform.aspect_ratio:.4g} "
+            f"MAC={planform.mean_aerodynamic_chord:.6g} panels={len(lattice)}"
+        )
+        level = loads.beta_deg == 0
+        if np.count_nonzero(level) > 1:
+            slope = np.polyfit(np.radians(loads.alpha_deg[level]), loads.cl[level], 1)[0]
+            summary += f" CL_alpha={slope:.4g}/rad"
+        if np.any(np.isfinite(loads.oswald[level])):
+            summary += f" e={np.nanmedian(loads.oswald[level]):.4g}"
+        print(summary, file=sys.stderr)
+    except BrokenPipeError:
+        return quiet_broken_pipe()
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
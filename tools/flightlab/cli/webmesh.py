@@ -0,0 +1,46 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from flightlab.cli._common import fail, read_floats
+
+DESCRIPTION = """\
+Convert STL files for the docs' 3D viewer: weld vertices, write indexed,
+quantized glb files at several levels of detail and a <name>.lods.json
+manifest. Point a viewer's data-src at the manifest and it loads the
+coarsest level first, then streams the finer ones.
+"""
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog=prog, description=DESCRIPTION)
+    p.add_argument("paths", nargs="+", metavar="STL", help="STL file(s).")
+    p.add_argument("--out-dir", default=None, help="Output directory (default: next to each STL).")
+    p.add_argument(
+        "--lods", default="1,0.25,0.05",
+        help="Triangle fractions to keep per level, e.g. '1,0.25,0.05' (default).",
+    )
+    p.add_argument("--bits", type=int, default=14, help="Position quantization bits, 1-16 (default: 14).")
+    p.add_argument("--smooth-normals", action="store_true", help="Store smooth vertex normals (default: flat shading).")
+    return p
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    args = build_parser(prog).parse_args(argv)
+
+    from flightlab.webmesh import build_web_mesh
+
+    try:
+        ratios = read_floats(args.lods, "LOD fractions")
+        if not 1 <= args.bits <= 16:
+            raise ValueError("--bits must be between 1 and 16.")
+        for path in args.paths:
+            manifest = build_web_mesh(path, args.out_dir, ratios, args.bits, args.smooth_normals)
+            levels = ", ".join(f"{lod['triangles']} tris {lod['bytes'] / 1024:.0f} KiB" for lod in manifest["lods"])
+            print(
+                f"{path}: {manifest['source_triangles']} tris {manifest['source_bytes'] / 1024:.0f} KiB -> {levels}",
+                file=sys.stderr,
+            )
+    except (ValueError, OSError) as e:
+        return fail(str(e))
+    return 0
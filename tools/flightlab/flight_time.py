@@ -0,0 +1,41 @@
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# ----------------------------
+# Flight time from capacity and current
+# ----------------------------
+
+def calculate_flight_time(
+    capacity_mAh: ArrayLike, avg_current_A: ArrayLike, use_80_percent: ArrayLike = True
+) -> Union[float, np.ndarray]:
+    """Returns flight time in minutes.
+
+    Inputs may be scalars or arrays and broadcast against each other;
+    use_80_percent may be a boolean mask selecting where the 80% rule
+    applies. Scalar inputs return a float.
+    """
+    capacity_Ah = np.asarray(capacity_mAh, dtype=np.float64) / 1000.0
+    capacity_Ah = capacity_Ah * np.where(use_80_percent, 0.8, 1.0)
+    # Only the broadcast result is allocated at full size; scale it in place.
+    minutes = np.divide(capacity_Ah, np.maximum(avg_current_A, 1e-9))
+    minutes *= 60.0
+    return float(minutes) if minutes.ndim == 0 else minutes
+
+
+def flight_time_grid(
+    capacities: ArrayLike, currents: ArrayLike, use_80_percent: ArrayLike = True
+) -> np.ndarray:
+    """Flight time (min) on a capacity x current grid, shape (n_cap, n_cur)."""
+    caps = np.asarray(capacities, dtype=np.float64).reshape(-1, 1)
+    curs = np.asarray(currents, dtype=np.float64).reshape(1, -1)
+    return calculate_flight_time(caps, curs, use_80_percent)
+
+
+def series_flight_time_vs_capacity(capacities: np.ndarray, current_A: float, use_80_percent: bool = True) -> np.ndarray:
+    return calculate_flight_time(np.asarray(capacities), current_A, use_80_percent)
+
+
+def series_flight_time_vs_current(currents: np.ndarray, capacity_mAh: float, use_80_percent: bool = True) -> np.ndarray:
+    return calculate_flight_time(capacity_mAh, np.asarray(currents), use_80_percent)
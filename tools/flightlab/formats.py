@@ -0,0 +1,20 @@
+"""Output format names, kept free of numpy so the CLI can parse arguments cheaply."""
+
+import os
+from typing import Optional
+
+FORMATS = ("csv", "jsonl", "parquet")
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def infer_format(path: Optional[str], default: str = "csv") -> str:
+    if not path or path == "-":
+        return default
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), default)
@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from flightlab.power import recommend_power, thrust_check
+from flightlab.stl import load_stl
+
+# ----------------------------
+# Printed mass and CG of STL parts
+# ----------------------------
+#
+# FDM approximation: the walls are a shell of surface area x shell thickness
+# (at most the whole part), the rest of the volume is printed at the infill
+# ratio. The shell's mass sits at the surface centroid, the infill's at the
+# centroid of the remaining interior.
+
+MATERIAL_DENSITY_G_CM3 = {
+    "PLA": 1.24,
+    "LW-PLA": 0.8,  # foamed at typical print temperatures
+    "PETG": 1.27,
+    "ABS": 1.04,
+    "ASA": 1.07,
+    "Nylon": 1.14,
+    "TPU": 1.21,
+}
+DEFAULT_SHELL_MM = 0.8  # e.g. two 0.4 mm perimeters
+DEFAULT_INFILL = 0.15
+
+PART_COLUMNS = (
+    "part",
+    "triangles",
+    "volume_cm3",
+    "shell_cm3",
+    "printed_cm3",
+    "mass_g",
+    "cg_x_mm",
+    "cg_y_mm",
+    "cg_z_mm",
+)
+
+_MASS_PARALLEL_BYTES = 16 * 1024 * 1024  # auto mode uses processes above this much STL
+
+
+def part_mass(path: str, density_g_cm3: float, shell_mm: float, infill: float, unit_mm: float = 1.0) -> Dict[str, object]:
+    """Printed volume (cm^3), mass (g) and CG (mm) of one STL part.
+
+    unit_mm is the length of one model unit in mm (1 for mm, 25.4 for inches).
+    """
+    mesh = load_stl(path)
+    try:
+        props = mesh.mass_properties()
+        surface_c = mesh.surface_centroid() * unit_mm
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}")
+    solid = abs(props["volume"]) * unit_mm ** 3 / 1000.0  # cm^3
+    solid_c = props["centroid"] * unit_mm
+    shell = min(mesh.surface_area() * unit_mm ** 2 * shell_mm / 1000.0, solid)
+    interior = solid - shell
+    printed = shell + infill * interior
+    if interior > 0.0:
+        interior_c = (solid * solid_c - shell * surface_c) / interior
+        cg = (shell * surface_c + infill * interior * interior_c) / printed
+    else:
+        cg = solid_c  # all wall
+    return {
+        "part": os.path.basename(path),
+        "triangles": len(mesh),
+        "volume_cm3": solid,
+        "shell_cm3": shell,
+        "printed_cm3": printed,
+        "mass_g": printed * density_g_cm3,
+        "cg_x_mm": cg[0],
+        "cg_y_mm": cg[1],
+        "cg_z_mm": cg[2],
+    }
+
+
+def _part_task(task):
+    return part_mass(*task)
+
+
+class PrintedMass:
+    """Per-part and assembly printed mass/CG from estimate_printed_mass().
+
+    parts holds PART_COLUMNS as arrays (one row per STL). The assembly CG
+    is the mass-weighted mean, assuming the parts share one coordinate
+    system (e.g. exported from the assembly).
+    """
+
+    def __init__(self, parts: Dict[str, np.ndarray], density_g_cm3: float, shell_mm: float, infill: float):
+        self.parts = parts
+        self.density_g_cm3 = density_g_cm3
+        self.shell_mm = shell_mm
+        self.infill = infill
+
+    def __len__(self) -> int:
+        return len(self.parts["part"])
+
+    @property
+    def mass_g(self) -> float:
+        return float(self.parts["mass_g"].sum())
+
+    @property
+    def cg_mm(self) -> np.ndarray:
+        m = self.parts["mass_g"]
+        if m.sum() <= 0.0:
+            return np.full(3, np.nan)
+        cg = np.stack([self.parts["cg_x_mm"], self.parts["cg_y_mm"], self.parts["cg_z_mm"]])
+        return cg @ m / m.sum()
+
+    def weight_kg(self, extra_g: float = 0.0) -> float:
+        """All-up weight: printed parts plus non-printed items (electronics, battery, ...)."""
+        return (self.mass_g + extra_g) / 1000.0
+
+    def power_check(self, flight_type: str = "trainer", thrust_g: Optional[float] = None, extra_g: float = 0.0) -> Dict[str, object]:
+        """recommend_power (and thrust_check when thrust_g is given) at this weight."""
+        weight_kg = self.weight_kg(extra_g)
+        out: Dict[str, object] = {"weight_kg": weight_kg, "input_power_w": recommend_power(weight_kg, flight_type)}
+        if thrust_g is not None:
+            out.update(thrust_check(thrust_g, weight_kg * 1000.0))
+        return out
+
+
+def estimate_printed_mass(
+    paths: Sequence[str],
+    density_g_cm3: float = MATERIAL_DENSITY_G_CM3["PLA"],
+    shell_mm: float = DEFAULT_SHELL_MM,
+    infill: float = DEFAULT_INFILL,
+    unit_mm: float = 1.0,
+    workers: Optional[int] = None,
+) -> PrintedMass:
+    """Printed mass and CG for every STL in `paths`, parts evaluated in parallel.
+
+    workers=None uses all cores once the STL files total more than
+    _MASS_PARALLEL_BYTES; workers=1 forces a single process.
+    """
+    if not paths:
+        raise ValueError("No STL parts given.")
+    if density_g_cm3 <= 0:
+        raise ValueError("Density must be > 0.")
+    if shell_mm < 0:
+        raise ValueError("Shell thickness must be >= 0.")
+    if not 0.0 <= infill <= 1.0:
+        raise ValueError("Infill must be between 0 and 1 (0-100%).")
+    if unit_mm <= 0:
+        raise ValueError("Model unit must be > 0 mm.")
+
+    tasks = [(p, density_g_cm3, shell_mm, infill, unit_mm) for p in paths]
+    if workers is None:
+        total = sum(os.path.getsize(p) for p in paths)
+        workers = (os.cpu_count() or 1) if total > _MASS_PARALLEL_BYTES else 1
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        rows: List[Dict[str, object]] = [_part_task(t) for t in tasks]
+    else:
+        # spawn, not fork: the GUI runs this on a Qt worker thread, and forking a
+        # multithreaded process can deadlock the child.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            rows = list(pool.map(_part_task, tasks))
+
+    parts = {c: np.array([r[c] for r in rows]) for c in PART_COLUMNS}
+    parts["part"] = np.array([r["part"] for r in rows], dtype=object)
+    return PrintedMass(parts, density_g_cm3, shell_mm, infill)
@@ -0,0 +1,311 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from flightlab.stl import StlMesh
+
+# ----------------------------
+# Mesh health: watertightness, winding, degenerate and overlapping faces
+# ----------------------------
+#
+# Vertices are welded by hashing their coordinates on a grid of `tolerance`
+# (default 1e-6 of the bounding-box diagonal), then every triangle edge is
+# keyed by its two vertex ids. A closed, consistently wound surface uses
+# every undirected edge exactly twice, once in each direction. Self-overlap
+# candidates are triangle pairs that share a cell of a uniform grid, share
+# no vertex and whose intervals on the line where their planes meet overlap.
+
+DEFAULT_TOLERANCE = 1e-6  # relative to the bounding-box diagonal
+DEFAULT_EXAMPLES = 20
+
+_GRID_BUDGET = 8  # (cell, triangle) entries per triangle before the grid is coarsened
+_EXACT = 1e-3  # tolerance of the degenerate and crossing tests, relative to the weld tolerance
+_PAIR_CHUNK = 1 << 20
+_MAX_PAIRS = 50_000_000
+
+HEALTH_COUNTS = (
+    "degenerate_triangles",
+    "duplicate_triangles",
+    "boundary_edges",
+    "non_manifold_edges",
+    "duplicate_edges",
+    "inconsistent_winding_edges",
+    "flipped_normals",
+    "overlapping_pairs",
+)
+
+
+def _vertex_ids(v: np.ndarray, tol: float) -> Tuple[np.ndarray, int]:
+    lo = v.min(axis=0)
+    extent = float((v.max(axis=0) - lo).max())
+    step = max(tol, extent / (2 ** 21 - 1), np.finfo(np.float64).tiny)
+    q = np.floor((v - lo) / step + 0.5).astype(np.int64)
+    key = (q[:, 0] << 42) | (q[:, 1] << 21) | q[:, 2]
+    uniq, ids = np.unique(key, return_inverse=True)
+    return ids.reshape(-1, 3), len(uniq)
+
+
+def _runs_pairs(sorted_keys: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Index pairs (p, q), p < q, of equal neighbours in a sorted key array.
+
+    None when there would be more than _MAX_PAIRS of them.
+    """
+    n = len(sorted_keys)
+    if n < 2:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    ends = np.r_[starts[1:], n]
+    run_end = np.repeat(ends, ends - starts)
+    counts = run_end - np.arange(n) - 1
+    total = int(counts.sum())
+    if total > _MAX_PAIRS:
+        return None
+    p = np.repeat(np.arange(n), counts)
+    offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return p, p + 1 + offset
+
+
+def _grid_pairs(lo: np.ndarray, hi: np.ndarray, area: np.ndarray) -> Optional[np.ndarray]:
+    """Candidate pairs (a < b) of triangles whose boxes share a grid cell.
+
+    Cells start at twice the typical triangle size and grow until the
+    triangles cover at most _GRID_BUDGET cells each on average.
+    """
+    t = len(lo)
+    gmin = lo.min(axis=0)
+    extent = float((hi.max(axis=0) - gmin).max())
+    h = 2.0 * float(np.sqrt(np.mean(area))) or extent / 100.0 or 1.0
+    while True:
+        clo = np.floor((lo - gmin) / h).astype(np.int64)
+        span = np.floor((hi - gmin) / h).astype(np.int64) - clo + 1
+        counts = span.prod(axis=1)
+        if counts.sum() <= _GRID_BUDGET * t + 1024:
+            break
+        h *= 2.0
+    tri = np.repeat(np.arange(t), counts)
+    r = np.arange(len(tri)) - np.repeat(np.cumsum(counts) - counts, counts)
+    sx, sy = span[tri, 0], span[tri, 1]
+    cell = clo[tri] + np.stack([r % sx, (r // sx) % sy, r // (sx * sy)], axis=1)
+    dims = cell.max(axis=0) + 1
+    key = (cell[:, 0] * dims[1] + cell[:, 1]) * dims[2] + cell[:, 2]
+    order = np.argsort(key, kind="stable")
+    runs = _runs_pairs(key[order])
+    if runs is None:
+        return None
+    p, q = runs
+    a, b = tri[order][p], tri[order][q]
+    pair = np.unique(np.minimum(a, b) * t + np.maximum(a, b))
+    return np.stack([pair // t, pair % t], axis=1)
+
+
+def _interval(v: np.ndarray, d: np.ndarray, direction: np.ndarray, tol: float):
+    """Extent along `direction` of each triangle's part on the other's plane.
+
+    v: (n, 3, 3) vertices, d: (n, 3) signed distances to the other plane.
+    """
+    proj = np.einsum("nkj,nj->nk", v, direction)
+    lo = np.full(len(v), np.inf)
+    hi = np.full(len(v), -np.inf)
+    on = np.abs(d) <= tol
+    lo = np.minimum(lo, np.where(on, proj, np.inf).min(axis=1))
+    hi = np.maximum(hi, np.where(on, proj, -np.inf).max(axis=1))
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        cross = ((d[:, i] > tol) & (d[:, j] < -tol)) | ((d[:, i] < -tol) & (d[:, j] > tol))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = proj[:, i] + (proj[:, j] - proj[:, i]) * d[:, i] / (d[:, i] - d[:, j])
+        lo = np.where(cross, np.minimum(lo, x), lo)
+        hi = np.where(cross, np.maximum(hi, x), hi)
+    return lo, hi
+
+
+def _coplanar_overlap(va: np.ndarray, vb: np.ndarray, normal: np.ndarray, eps: float) -> np.ndarray:
+    """Separating-axis test in the common plane; touching does not count."""
+    drop = np.argmax(np.abs(normal), axis=1)
+    keep = np.array([[1, 2], [0, 2], [0, 1]])[drop]
+    rows = np.arange(len(va))[:, None, None]
+    a2 = va[rows, np.arange(3)[None, :, None], keep[:, None, :]]
+    b2 = vb[rows, np.arange(3)[None, :, None], keep[:, None, :]]
+    overlap = np.ones(len(va), dtype=bool)
+    for tri in (a2, b2):
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            e = tri[:, j] - tri[:, i]
+            axis = np.stack([-e[:, 1], e[:, 0]], axis=1)
+            pa = np.einsum("nkj,nj->nk", a2, axis)
+            pb = np.einsum("nkj,nj->nk", b2, axis)
+            scale = eps * np.linalg.norm(axis, axis=1)
+            overlap &= (pa.min(axis=1) < pb.max(axis=1) - scale) & (pb.min(axis=1) < pa.max(axis=1) - scale)
+    return overlap
+
+
+def _overlapping(
+    tri: np.ndarray, ids: np.ndarray, unit_n: np.ndarray, area: np.ndarray, ok: np.ndarray, tol: float
+) -> Optional[np.ndarray]:
+    # Pairs within `tol` of each other's planes are tested as coplanar; the
+    # general test uses a much tighter plane distance, so nearly flat
+    # neighbours do not show up as crossing.
+    eps = tol * _EXACT
+    lo, hi = tri.min(axis=1), tri.max(axis=1)
+    cand = _grid_pairs(lo[ok], hi[ok], area[ok])
+    if cand is None:
+        return None
+    cand = np.flatnonzero(ok)[cand]
+    found = []
+    for s in range(0, len(cand), _PAIR_CHUNK):
+        a, b = cand[s : s + _PAIR_CHUNK, 0], cand[s : s + _PAIR_CHUNK, 1]
+        keep = ~(ids[a][:, :, None] == ids[b][:, None, :]).any(axis=(1, 2))
+        keep &= np.all((lo[a] <= hi[b] + eps) & (lo[b] <= hi[a] + eps), axis=1)
+        a, b = a[keep], b[keep]
+        va, vb = tri[a], tri[b]
+        na, nb = unit_n[a], unit_n[b]
+        db = np.einsum("nkj,nj->nk", vb - va[:, :1], na)  # B's vertices vs A's plane
+        da = np.einsum("nkj,nj->nk", va - vb[:, :1], nb)
+        straddle = ~(np.all(db > eps, axis=1) | np.all(db < -eps, axis=1))
+        straddle &= ~(np.all(da > eps, axis=1) | np.all(da < -eps, axis=1))
+        coplanar = straddle & np.all(np.abs(db) <= tol, axis=1) & np.all(np.abs(da) <= tol, axis=1)
+        general = straddle & ~coplanar
+        line = np.cross(na, nb)
+        length = np.linalg.norm(line, axis=1)
+        line = line / np.where(length > 0, length, 1.0)[:, None]
+        alo, ahi = _interval(va, da, line, eps)
+        blo, bhi = _interval(vb, db, line, eps)
+        meets = general & (alo <= bhi + eps) & (blo <= ahi + eps)
+        idx = np.flatnonzero(coplanar)
+        meets[idx] = _coplanar_overlap(va[idx], vb[idx], na[idx], eps)
+        found.append(np.stack([a[meets], b[meets]], axis=1))
+    return np.concatenate(found) if found else np.empty((0, 2), dtype=np.int64)
+
+
+class MeshHealth:
+    """Result of check_mesh(): issue counts, a few examples of each, and a verdict.
+
+    `watertight` means every edge is shared by exactly two triangles with
+    opposite directions; `ok` additionally requires no degenerate,
+    duplicate or overlapping triangles and outward-facing normals.
+    """
+
+    def __init__(self, path: str, triangles: int, vertices: int, tolerance: float, counts: Dict[str, int],
+                 examples: Dict[str, list], signed_volume: float, overlap_checked: bool):
+        self.path = path
+        self.triangles = triangles
+        self.vertices = vertices
+        self.tolerance = tolerance
+        self.counts = counts
+        self.examples = examples
+        self.signed_volume = signed_volume
+        self.overlap_checked = overlap_checked
+
+    @property
+    def watertight(self) -> bool:
+        c = self.counts
+        return self.triangles > 0 and not (
+            c["boundary_edges"] or c["non_manifold_edges"] or c["inconsistent_winding_edges"]
+        )
+
+    @property
+    def inverted(self) -> bool:
+        return self.watertight and self.signed_volume < 0.0
+
+    @property
+    def ok(self) -> bool:
+        c = self.counts
+        return self.watertight and not self.inverted and not (
+            c["degenerate_triangles"] or c["duplicate_triangles"] or c["overlapping_pairs"]
+        )
+
+    def problems(self) -> List[str]:
+        out = [f"{n} {name.replace('_', ' ')}" for name, n in self.counts.items() if n]
+        if self.inverted:
+            out.append("normals point inward (negative volume)")
+        if not self.triangles:
+            out.append("no triangles")
+        elif not self.overlap_checked:
+            out.append("self-overlap not checked")
+        return out
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "path": self.path,
+            "ok": self.ok,
+            "watertight": self.watertight,
+            "inverted": self.inverted,
+            "triangles": self.triangles,
+            "vertices": self.vertices,
+            "tolerance": self.tolerance,
+            "signed_volume": self.signed_volume,
+            "overlap_checked": self.overlap_checked,
+            **self.counts,
+            "examples": self.examples,
+        }
+
+
+def check_mesh(
+    mesh: StlMesh,
+    tolerance: Optional[float] = None,
+    overlaps: bool = True,
+    max_examples: int = DEFAULT_EXAMPLES,
+) -> MeshHealth:
+    """Check an STL mesh for the defects that break CFD meshing and slicing.
+
+    tolerance is the weld distance in model units (default
+    DEFAULT_TOLERANCE x bounding-box diagonal); it is also the height below
+    which a triangle counts as degenerate. Examples are triangle indices,
+    or vertex-id pairs for edges.
+    """
+    t = len(mesh)
+    counts = dict.fromkeys(HEALTH_COUNTS, 0)
+    if not t:
+        return MeshHealth(mesh.path, 0, 0, 0.0, counts, {}, 0.0, False)
+    tri = mesh.triangles.astype(np.float64)
+    lo, hi = mesh.bounding_box()
+    tol = float(tolerance) if tolerance is not None else DEFAULT_TOLERANCE * float(np.linalg.norm(hi - lo))
+    ids, nv = _vertex_ids(tri.reshape(-1, 3), tol)
+    examples: Dict[str, list] = {}
+
+    def record(name: str, idx: np.ndarray):
+        counts[name] = int(len(idx))
+        if len(idx):
+            examples[name] = np.asarray(idx)[:max_examples].tolist()
+
+    # Degenerate: welded corners, or (near) zero height.
+    n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    area2 = np.linalg.norm(n, axis=1)
+    longest = np.sqrt(np.max([
+        np.einsum("ij,ij->i", e, e) for e in (tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 1], tri[:, 0] - tri[:, 2])
+    ], axis=0))
+    collapsed = (ids[:, 0] == ids[:, 1]) | (ids[:, 1] == ids[:, 2]) | (ids[:, 2] == ids[:, 0])
+    degenerate = collapsed | (area2 <= tol * _EXACT * longest)
+    record("degenerate_triangles", np.flatnonzero(degenerate))
+
+    valid = np.flatnonzero(~collapsed)
+    vids = ids[valid]
+    _, first = np.unique(np.sort(vids, axis=1), axis=0, return_index=True)
+    dup = np.ones(len(valid), dtype=bool)
+    dup[first] = False
+    record("duplicate_triangles", valid[dup])
+
+    # Half-edges of the non-collapsed triangles.
+    a = vids.ravel()
+    b = vids[:, [1, 2, 0]].ravel()
+    undirected, inv, uses = np.unique(np.minimum(a, b) * nv + np.maximum(a, b), return_inverse=True, return_counts=True)
+    edge_pairs = np.stack([undirected // nv, undirected % nv], axis=1)
+    record("boundary_edges", edge_pairs[uses == 1])
+    record("non_manifold_edges", edge_pairs[uses > 2])
+    directed, dcounts = np.unique(a * nv + b, return_counts=True)
+    record("duplicate_edges", np.stack([directed // nv, directed % nv], axis=1)[dcounts > 1])
+    forward = np.bincount(inv, (a < b).astype(np.float64), minlength=len(undirected))
+    record("inconsistent_winding_edges", edge_pairs[(uses == 2) & (forward != 1)])
+
+    stored = mesh.normals.astype(np.float64)
+    has_normal = np.any(stored != 0.0, axis=1) & ~degenerate
+    record("flipped_normals", np.flatnonzero(has_normal & (np.einsum("ij,ij->i", stored, n) < 0.0)))
+
+    if overlaps:
+        unit_n = n / np.where(area2 > 0, area2, 1.0)[:, None]
+        pairs = _overlapping(tri, ids, unit_n, 0.5 * area2, ~degenerate, tol)
+        if pairs is None:
+            overlaps = False  # too dense to pair up; reported as not checked
+        else:
+            record("overlapping_pairs", pairs)
+
+    volume = mesh.mass_properties()["volume"] if mesh._moments().vol6 != 0.0 else 0.0
+    return MeshHealth(mesh.path, t, nv, tol, counts, examples, float(volume), overlaps)
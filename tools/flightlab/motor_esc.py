@@ -0,0 +1,140 @@
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+# ----------------------------
+# Domain logic (columnar engine)
+# ----------------------------
+
+RESULT_COLUMNS = (
+    "KV",
+    "Voltage (V)",
+    "RPM",
+    "Torque",
+    "Power (W)",
+    "ESC Recommendation (A)",
+)
+
+# Torque class codes stored in the "Torque" column; index into TORQUE_LABELS.
+TORQUE_LABELS = ("High", "Medium", "Low")
+TORQUE_KV_EDGES = (1000, 2000)
+
+
+def torque_class_codes(kv: np.ndarray) -> np.ndarray:
+    # 0 = High (< 1000), 1 = Medium (1000..1999), 2 = Low (>= 2000)
+    return np.digitize(kv, TORQUE_KV_EDGES).astype(np.uint8)
+
+
+def lookup_current_draws(kv: np.ndarray, current_draws: Dict[int, float]) -> np.ndarray:
+    """Vectorized current_draws.get(kv, 0.0) for an array of KV values."""
+    kv = np.asarray(kv, dtype=np.int64)
+    if not current_draws:
+        return np.zeros(kv.shape, dtype=np.float64)
+    keys = np.fromiter(current_draws.keys(), dtype=np.int64, count=len(current_draws))
+    vals = np.fromiter(current_draws.values(), dtype=np.float64, count=len(current_draws))
+    order = np.argsort(keys, kind="stable")
+    keys, vals = keys[order], vals[order]
+    idx = np.minimum(np.searchsorted(keys, kv), len(keys) - 1)
+    return np.where(keys[idx] == kv, vals[idx], 0.0)
+
+
+class MotorEscResults:
+    """Column-oriented KV x voltage results.
+
+    Rows are ordered KV-major (the same order as the nested loop in
+    calculate_motor_esc_params). Columns are flat NumPy arrays keyed by
+    RESULT_COLUMNS; "Torque" holds uint8 codes into TORQUE_LABELS. Row
+    dicts are only built on request via row() / rows().
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["KV"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def torque_labels(self) -> np.ndarray:
+        return np.asarray(TORQUE_LABELS, dtype=object)[self.columns["Torque"]]
+
+    def export_columns(self) -> Dict[str, np.ndarray]:
+        """Columns with the torque codes replaced by their labels."""
+        cols = dict(self.columns)
+        cols["Torque"] = self.torque_labels()
+        return cols
+
+    def row(self, i: int) -> Dict[str, Any]:
+        c = self.columns
+        return {
+            "KV": int(c["KV"][i]),
+            "Voltage (V)": float(c["Voltage (V)"][i]),
+            "RPM": float(c["RPM"][i]),
+            "Torque": TORQUE_LABELS[c["Torque"][i]],
+            "Power (W)": float(c["Power (W)"][i]),
+            "ESC Recommendation (A)": int(c["ESC Recommendation (A)"][i]),
+        }
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+
+def motor_esc_columns(
+    kv_ratings: Sequence[int],
+    battery_voltages: Sequence[float],
+    current_draws: Dict[int, float],
+) -> MotorEscResults:
+    kv = np.asarray(kv_ratings, dtype=np.int64).ravel()
+    volts = np.asarray(battery_voltages, dtype=np.float64).ravel()
+    current = lookup_current_draws(kv, current_draws)
+
+    n_kv, n_v = kv.size, volts.size
+    rpm = kv[:, None] * volts[None, :]
+    power = volts[None, :] * current[:, None]
+    # np.rint rounds half to even, matching Python's round()
+    esc = np.rint(current * 1.2).astype(np.int64)
+
+    return MotorEscResults(
+        {
+            "KV": np.repeat(kv, n_v),
+            "Voltage (V)": np.tile(volts, n_kv),
+            "RPM": rpm.ravel(),
+            "Torque": np.repeat(torque_class_codes(kv), n_v),
+            "Power (W)": power.ravel(),
+            "ESC Recommendation (A)": np.repeat(esc, n_v),
+        }
+    )
+
+
+def iter_motor_esc_chunks(
+    kv_ratings: Iterable[int],
+    battery_voltages: Sequence[float],
+    current_draws: Dict[int, float],
+    chunk_rows: int = 65536,
+) -> Iterator[MotorEscResults]:
+    """Yield results in blocks of whole KV values, about chunk_rows rows each.
+
+    kv_ratings may be any iterable (e.g. a lazily parsed file), so neither the
+    KV list nor the full result set has to be held in memory.
+    """
+    volts = np.asarray(battery_voltages, dtype=np.float64).ravel()
+    kv_per_chunk = max(1, chunk_rows // max(volts.size, 1))
+    buf: List[int] = []
+    for kv in kv_ratings:
+        buf.append(kv)
+        if len(buf) >= kv_per_chunk:
+            yield motor_esc_columns(buf, volts, current_draws)
+            buf = []
+    if buf:
+        yield motor_esc_columns(buf, volts, current_draws)
+
+
+def calculate_motor_esc_params(
+    kv_ratings: List[int],
+    battery_voltages: List[float],
+    current_draws: Dict[int, float],
+) -> List[Dict[str, Any]]:
+    # Compatibility wrapper: materializes every row as a dict.
+    return list(motor_esc_columns(kv_ratings, battery_voltages, current_draws).rows())
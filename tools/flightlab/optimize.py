@@ -0,0 +1,293 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from flightlab.power import (
+    AIRFRAME_COLUMNS,
+    AIRFRAME_RESULT_COLUMNS,
+    FLIGHT_TYPES,
+    evaluate_airframes,
+    flight_type_codes,
+)
+
+# ----------------------------
+# Design-space search
+# ----------------------------
+#
+# A design space maps every AIRFRAME_COLUMNS name to a fixed value or a
+# (low, high) range. Samples are generated and evaluated in blocks of
+# _OPT_BLOCK; each block is seeded from (seed, block index), so results do
+# not depend on how blocks are sharded across processes.
+
+SAMPLERS = ("grid", "random", "lhs")
+DEFAULT_OBJECTIVE = "motor_weight_g"
+DEFAULT_CONSTRAINTS = ("hover_ok", "takeoff_ok", "climb_ok", "battery_ok")
+
+_OPT_BLOCK = 65536
+_OPT_PARALLEL_SAMPLES = 500_000  # auto mode shards only above this
+_BOOL_COLUMNS = ("hover_ok", "takeoff_ok", "climb_ok", "battery_ok")
+
+# spawn_key prefixes for the independent random streams
+_STREAM_SAMPLES, _STREAM_LHS, _STREAM_REFINE = 0, 1, 2
+
+Bound = Union[float, str, Tuple[float, float]]
+
+
+class DesignSpace:
+    """Fixed values and (low, high) ranges for the airframe columns.
+
+    flight_type is always fixed (name or code); the other columns may vary.
+    """
+
+    def __init__(self, bounds: Mapping[str, Bound]):
+        missing = [c for c in AIRFRAME_COLUMNS if c not in bounds]
+        if missing:
+            raise ValueError(f"Design space is missing column(s): {', '.join(missing)}.")
+        unknown = [c for c in bounds if c not in AIRFRAME_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown design column(s): {', '.join(unknown)}.")
+        self.fixed: Dict[str, float] = {}
+        names, lo, hi = [], [], []
+        for name in AIRFRAME_COLUMNS:
+            value = bounds[name]
+            if name == "flight_type":
+                if isinstance(value, (tuple, list)):
+                    raise ValueError("flight_type cannot be a range; run one search per type.")
+                self.fixed[name] = int(flight_type_codes(value))
+            elif isinstance(value, (tuple, list)):
+                a, b = float(value[0]), float(value[1])
+                if not (np.isfinite(a) and np.isfinite(b)) or b < a:
+                    raise ValueError(f"Invalid range for {name}: {a:g}..{b:g}.")
+                if a == b:
+                    self.fixed[name] = a
+                else:
+                    names.append(name)
+                    lo.append(a)
+                    hi.append(b)
+            else:
+                self.fixed[name] = float(value)
+        if not names:
+            raise ValueError("Give at least one column a (low, high) range to search.")
+        self.names = tuple(names)
+        self.low = np.array(lo)
+        self.high = np.array(hi)
+
+    @property
+    def dims(self) -> int:
+        return len(self.names)
+
+    def columns(self, unit: np.ndarray) -> Dict[str, np.ndarray]:
+        """Airframe columns for points given in unit-cube coordinates (n, dims)."""
+        n = len(unit)
+        x = self.low + unit * (self.high - self.low)
+        cols = {name: np.full(n, value) for name, value in self.fixed.items()}
+        cols["flight_type"] = np.full(n, self.fixed["flight_type"], dtype=np.intp)
+        for i, name in enumerate(self.names):
+            cols[name] = x[:, i]
+        return cols
+
+
+def grid_points_per_dim(samples: int, dims: int) -> int:
+    """Points per axis for a full grid of at most `samples` points (>= 2)."""
+    k = max(2, int(samples ** (1.0 / dims) + 1e-9))
+    while k > 2 and k ** dims > samples:
+        k -= 1
+    return k
+
+
+def _unit_samples(sampler: str, entropy, start: int, stop: int, n_total: int, dims: int, per_dim: int, perms):
+    """Unit-cube points for global sample indices [start, stop)."""
+    if sampler == "grid":
+        idx = np.unravel_index(np.arange(start, stop), (per_dim,) * dims)
+        return np.column_stack(idx) / (per_dim - 1.0)
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(_STREAM_SAMPLES, start // _OPT_BLOCK)))
+    u = rng.random((stop - start, dims))
+    if sampler == "lhs":
+        # One stratum per sample and axis; the permutations are global.
+        u = (perms[:, start:stop].T + u) / n_total
+    return u
+
+
+def _lhs_permutations(entropy, n_total: int, dims: int) -> np.ndarray:
+    return np.stack([
+        np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(_STREAM_LHS, j))).permutation(n_total)
+        for j in range(dims)
+    ])
+
+
+class _TopK:
+    """Running best-k feasible rows; rows that cannot make the cut are pruned early."""
+
+    def __init__(self, keep: int, objective: str, maximize: bool):
+        self.keep = keep
+        self.objective = objective
+        self.sign = -1.0 if maximize else 1.0
+        self.rows: Optional[Dict[str, np.ndarray]] = None
+        self.evaluated = 0
+        self.feasible = 0
+
+    def add(self, cols: Dict[str, np.ndarray], index: np.ndarray, constraints: Sequence[str]):
+        res = evaluate_airframes(cols)
+        self.evaluated += len(index)
+        mask = np.ones(len(index), dtype=bool)
+        for c in constraints:
+            mask &= res[c]
+        score = self.sign * _column(cols, res, self.objective)
+        mask &= np.isfinite(score)
+        self.feasible += int(np.count_nonzero(mask))
+        if self.rows is not None and len(self.rows["_index"]) >= self.keep:
+            mask &= score <= self.rows["_score"][-1]
+        sel = np.flatnonzero(mask)
+        if sel.size == 0:
+            return
+        if sel.size > self.keep:
+            sel = sel[np.argpartition(score[sel], self.keep - 1)[: self.keep]]
+        new = {name: cols[name][sel] for name in AIRFRAME_COLUMNS}
+        new.update({name: res[name][sel] for name in AIRFRAME_RESULT_COLUMNS})
+        new["_score"] = score[sel]
+        new["_index"] = index[sel]
+        self.merge(new)
+
+    def merge(self, new: Optional[Dict[str, np.ndarray]]):
+        if new is None:
+            return
+        if self.rows is not None:
+            new = {k: np.concatenate([self.rows[k], new[k]]) for k in new}
+        order = np.lexsort((new["_index"], new["_score"]))[: self.keep]
+        self.rows = {k: v[order] for k, v in new.items()}
+
+
+def _column(cols, res, name):
+    return (cols[name] if name in cols else res[name]).astype(np.float64)
+
+
+def _search_shard(task):
+    space, sampler, entropy, start, stop, n_total, per_dim, objective, maximize, constraints, keep = task
+    perms = _lhs_permutations(entropy, n_total, space.dims) if sampler == "lhs" else None
+    top = _TopK(keep, objective, maximize)
+    for b0 in range(start, stop, _OPT_BLOCK):
+        b1 = min(b0 + _OPT_BLOCK, stop)
+        unit = _unit_samples(sampler, entropy, b0, b1, n_total, space.dims, per_dim, perms)
+        top.add(space.columns(unit), np.arange(b0, b1), constraints)
+    return top.rows, top.evaluated, top.feasible
+
+
+class OptimizationResult:
+    """Ranked feasible designs from optimize_airframe().
+
+    designs holds AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS arrays, best
+    first (flight_type as a code). evaluated and feasible count every
+    sample, including the refinement rounds.
+    """
+
+    def __init__(self, designs, evaluated, feasible, seed, sampler, objective, maximize):
+        self.designs = designs
+        self.evaluated = evaluated
+        self.feasible = feasible
+        self.seed = seed
+        self.sampler = sampler
+        self.objective = objective
+        self.maximize = maximize
+
+    def __len__(self) -> int:
+        return len(self.designs[AIRFRAME_COLUMNS[0]])
+
+    @property
+    def best(self) -> Optional[Dict[str, object]]:
+        if not len(self):
+            return None
+        out = {name: self.designs[name][0].item() for name in self.designs}
+        out["flight_type"] = FLIGHT_TYPES[out["flight_type"]]
+        return out
+
+
+def optimize_airframe(
+    bounds: Mapping[str, Bound],
+    samples: int = 100_000,
+    sampler: str = "lhs",
+    objective: str = DEFAULT_OBJECTIVE,
+    maximize: bool = False,
+    constraints: Sequence[str] = DEFAULT_CONSTRAINTS,
+    keep: int = 100,
+    refine_rounds: int = 3,
+    refine_samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> OptimizationResult:
+    """Search the design space for the best designs passing `constraints`.
+
+    `samples` points are drawn by the sampler ("grid" uses the largest full
+    grid with at most that many points) and evaluated block-wise; each
+    block keeps only feasible rows that can still enter the top `keep`.
+    Then `refine_rounds` rounds resample around the current best designs in
+    a box that halves every round. For a monotone objective the best designs
+    sit on the feasible boundary, so this is where the refinement samples
+    land. workers=None shards across all cores only for large searches.
+    """
+    space = DesignSpace(bounds)
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler '{sampler}'. Use one of: {', '.join(SAMPLERS)}.")
+    if samples < 1:
+        raise ValueError("Samples must be >= 1.")
+    if keep < 1:
+        raise ValueError("Keep must be >= 1.")
+    if objective in _BOOL_COLUMNS or objective not in AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS or objective == "flight_type":
+        raise ValueError(f"Objective must be a numeric airframe or result column, not '{objective}'.")
+    bad = [c for c in constraints if c not in _BOOL_COLUMNS]
+    if bad:
+        raise ValueError(f"Unknown constraint(s): {', '.join(bad)}. Use: {', '.join(_BOOL_COLUMNS)}.")
+
+    ss = np.random.SeedSequence(seed)
+    per_dim = grid_points_per_dim(samples, space.dims) if sampler == "grid" else 0
+    n_total = per_dim ** space.dims if sampler == "grid" else samples
+    if refine_samples is None:
+        refine_samples = max(1, n_total // 10)
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n_total > _OPT_PARALLEL_SAMPLES else 1
+    n_blocks = -(-n_total // _OPT_BLOCK)
+    workers = max(1, min(workers, n_blocks))
+    edges = (np.linspace(0, n_blocks, workers + 1).round().astype(int) * _OPT_BLOCK).clip(max=n_total)
+    tasks = [
+        (space, sampler, ss.entropy, int(a), int(b), n_total, per_dim, objective, maximize, tuple(constraints), keep)
+        for a, b in zip(edges[:-1], edges[1:])
+        if b > a
+    ]
+    if len(tasks) == 1:
+        parts = [_search_shard(tasks[0])]
+    else:
+        # spawn, not fork: the GUI runs this on a Qt worker thread, and forking a
+        # multithreaded process can deadlock the child.
+        with ProcessPoolExecutor(max_workers=len(tasks), mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_search_shard, tasks))
+
+    top = _TopK(keep, objective, maximize)
+    for rows, evaluated, feasible in parts:
+        top.merge(rows)
+        top.evaluated += evaluated
+        top.feasible += feasible
+
+    width = space.high - space.low
+    next_index = n_total
+    for r in range(refine_rounds):
+        if top.rows is None or refine_samples < 1:
+            break
+        centres = np.column_stack([top.rows[name] for name in space.names])
+        rng = np.random.default_rng(np.random.SeedSequence(ss.entropy, spawn_key=(_STREAM_REFINE, r)))
+        owner = rng.integers(0, len(centres), refine_samples)
+        radius = 0.1 * 0.5 ** r * width
+        x = centres[owner] + rng.uniform(-1.0, 1.0, (refine_samples, space.dims)) * radius
+        unit = (np.clip(x, space.low, space.high) - space.low) / width
+        for b0 in range(0, refine_samples, _OPT_BLOCK):
+            b1 = min(b0 + _OPT_BLOCK, refine_samples)
+            top.add(space.columns(unit[b0:b1]), np.arange(next_index + b0, next_index + b1), constraints)
+        next_index += refine_samples
+
+    if top.rows is None:
+        designs = {name: np.empty(0) for name in AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS}
+    else:
+        designs = {name: top.rows[name] for name in AIRFRAME_COLUMNS + AIRFRAME_RESULT_COLUMNS}
+    return OptimizationResult(designs, top.evaluated, top.feasible, ss.entropy, sampler, objective, maximize)
@@ -0,0 +1,206 @@
+import csv
+import sys
+from itertools import islice
+from typing import Dict, Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# ----------------------------
+# Plane power-system rules of thumb
+# ----------------------------
+#
+# Every helper accepts scalars or arrays (broadcast against each other).
+# Scalar inputs return Python scalars, as before.
+
+FLIGHT_TYPES = ("trainer", "glider", "aerobatic")
+POWER_PER_KG_W = (120, 65, 200)  # per FLIGHT_TYPES; unknown types count as trainer
+
+# Wingspan classes (cm) -> nominal pack voltage: < 100 is 3s, ..., >= 245 is 12s.
+WINGSPAN_EDGES_CM = (100, 140, 175, 215, 245)
+WINGSPAN_VOLTAGES = (11.1, 14.8, 22.2, 29.6, 37.0, 44.4)
+
+
+def _scalar(x):
+    return x.item() if np.ndim(x) == 0 else x
+
+
+def flight_type_codes(flight_type) -> np.ndarray:
+    """Index into FLIGHT_TYPES for names (or pass-through integer codes)."""
+    ft = np.asarray(flight_type)
+    if ft.dtype.kind in "iu":
+        return np.where((ft >= 0) & (ft < len(FLIGHT_TYPES)), ft, 0)
+    codes = np.zeros(ft.shape, dtype=np.intp)
+    for code, name in enumerate(FLIGHT_TYPES[1:], start=1):
+        codes[ft == name] = code
+    return codes
+
+
+def recommend_power(weight_kg: ArrayLike, flight_type="trainer"):
+    factor = np.take(POWER_PER_KG_W, flight_type_codes(flight_type))
+    return _scalar(np.multiply(weight_kg, factor))
+
+def motor_efficiency_output(input_power: ArrayLike, efficiency_percent: ArrayLike):
+    return _scalar(np.multiply(input_power, np.divide(efficiency_percent, 100.0)))
+
+def motor_weight_from_power(power_watt: ArrayLike, efficiency: ArrayLike = 70.0):
+    factor = np.where(np.less_equal(efficiency, 70), 3, 5)
+    return _scalar(np.divide(power_watt, factor))  # grams
+
+def battery_voltage_from_wingspan_cm(cm: ArrayLike):
+    idx = np.searchsorted(WINGSPAN_EDGES_CM, cm, side="right")
+    return _scalar(np.take(WINGSPAN_VOLTAGES, idx))
+
+def prop_pitch_speed(pitch_cm: ArrayLike, rpm: ArrayLike):
+    return _scalar(np.divide(np.multiply(pitch_cm, rpm), 60000.0))  # m/s
+
+def thrust_check(thrust_g: ArrayLike, plane_weight_g: ArrayLike) -> Dict[str, object]:
+    return {
+        "hover": _scalar(np.greater_equal(thrust_g, plane_weight_g)),
+        "takeoff": _scalar(np.greater_equal(thrust_g, np.multiply(0.5, plane_weight_g))),
+        "climb": _scalar(np.greater_equal(thrust_g, np.multiply(0.33, plane_weight_g))),
+    }
+
+def esc_rating(max_current: ArrayLike):
+    return _scalar(np.multiply(max_current, 1.2))
+
+def battery_discharge_check(capacity_mah: ArrayLike, c_rating: ArrayLike, load_current: ArrayLike):
+    max_safe_continuous = np.divide(np.multiply(np.multiply(capacity_mah, c_rating), 0.6), 1000.0)  # A
+    return _scalar(np.less_equal(load_current, max_safe_continuous))
+
+
+# ----------------------------
+# Batch evaluation of airframe tables
+# ----------------------------
+
+AIRFRAME_COLUMNS = (
+    "weight_kg",
+    "wingspan_cm",
+    "flight_type",
+    "efficiency_pct",
+    "pitch_cm",
+    "rpm",
+    "thrust_g",
+    "max_current_a",
+    "capacity_mah",
+    "c_rate",
+)
+
+AIRFRAME_RESULT_COLUMNS = (
+    "input_power_w",
+    "output_power_w",
+    "motor_weight_g",
+    "battery_voltage_v",
+    "pitch_speed_ms",
+    "hover_ok",
+    "takeoff_ok",
+    "climb_ok",
+    "esc_rating_a",
+    "battery_ok",
+)
+
+
+def airframe_columns(table) -> Dict[str, np.ndarray]:
+    """Normalize an airframe table to a dict of AIRFRAME_COLUMNS arrays.
+
+    Accepts a mapping of column name -> array, a structured array with those
+    field names, or a 2-D float array with columns in AIRFRAME_COLUMNS order
+    (flight_type as an integer code). flight_type is returned as codes.
+    """
+    if isinstance(table, np.ndarray) and table.dtype.names is None:
+        table = np.atleast_2d(table)
+        if table.shape[1] != len(AIRFRAME_COLUMNS):
+            raise ValueError(f"Airframe array needs {len(AIRFRAME_COLUMNS)} columns: {', '.join(AIRFRAME_COLUMNS)}.")
+        table = {name: table[:, i] for i, name in enumerate(AIRFRAME_COLUMNS)}
+    names = table.dtype.names if isinstance(table, np.ndarray) else tuple(table.keys())
+    missing = [c for c in AIRFRAME_COLUMNS if c not in names]
+    if missing:
+        raise ValueError(f"Airframe table is missing column(s): {', '.join(missing)}.")
+    out = {}
+    for name in AIRFRAME_COLUMNS:
+        col = np.asarray(table[name])
+        if name == "flight_type":
+            out[name] = flight_type_codes(col.astype(np.intp) if col.dtype.kind == "f" else col)
+        else:
+            out[name] = col.astype(np.float64, copy=False)
+    return out
+
+
+def evaluate_airframes(table) -> Dict[str, np.ndarray]:
+    """All power-system metrics for every airframe in `table` at once.
+
+    Returns AIRFRAME_RESULT_COLUMNS as arrays, one entry per airframe, with
+    the same values _on_calculate shows for a single airframe.
+    """
+    cols = airframe_columns(table)
+    input_power = recommend_power(cols["weight_kg"], cols["flight_type"])
+    thrust = thrust_check(cols["thrust_g"], cols["weight_kg"] * 1000.0)
+    out = {
+        "input_power_w": input_power,
+        "output_power_w": motor_efficiency_output(input_power, cols["efficiency_pct"]),
+        "motor_weight_g": motor_weight_from_power(input_power, cols["efficiency_pct"]),
+        "battery_voltage_v": battery_voltage_from_wingspan_cm(cols["wingspan_cm"]),
+        "pitch_speed_ms": prop_pitch_speed(cols["pitch_cm"], cols["rpm"]),
+        "hover_ok": thrust["hover"],
+        "takeoff_ok": thrust["takeoff"],
+        "climb_ok": thrust["climb"],
+        "esc_rating_a": esc_rating(cols["max_current_a"]),
+        "battery_ok": battery_discharge_check(cols["capacity_mah"], cols["c_rate"], cols["max_current_a"]),
+    }
+    return {name: np.atleast_1d(out[name]) for name in AIRFRAME_RESULT_COLUMNS}
+
+
+def iter_airframe_csv(path: str, chunk_rows: int = 65536) -> Iterator[Dict[str, np.ndarray]]:
+    """Read an airframe CSV (header row with AIRFRAME_COLUMNS) in column chunks.
+
+    flight_type may be a name or an integer code; "-" reads stdin. Each
+    chunk of lines is parsed by np.loadtxt rather than row by row.
+    """
+    fh = sys.stdin if path == "-" else open(path, "r", newline="", encoding="utf-8")
+    try:
+        header = [h.strip().lower() for h in next(csv.reader([fh.readline()]), [])]
+        missing = [c for c in AIRFRAME_COLUMNS if c not in header]
+        if missing:
+            raise ValueError(f"{path}: missing column(s): {', '.join(missing)}.")
+        index = [header.index(c) for c in AIRFRAME_COLUMNS]
+        ft = AIRFRAME_COLUMNS.index("flight_type")
+        numeric = [(name, index[i]) for i, name in enumerate(AIRFRAME_COLUMNS) if i != ft]
+        while True:
+            lines = list(islice(fh, chunk_rows))
+            if not lines:
+                break
+            lines = [ln for ln in lines if ln.strip()]
+            if not lines:
+                continue
+            try:
+                values = np.loadtxt(
+                    lines, delimiter=",", quotechar='"', ndmin=2,
+                    usecols=[col for _, col in numeric],
+                )
+                types = np.loadtxt(
+                    lines, delimiter=",", quotechar='"', ndmin=1, dtype=str, usecols=index[ft],
+                )
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+            out = {name: values[:, i] for i, (name, _) in enumerate(numeric)}
+            out["flight_type"] = _flight_type_column(types)
+            yield {name: out[name] for name in AIRFRAME_COLUMNS}
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def _flight_type_column(names: np.ndarray) -> np.ndarray:
+    names = np.char.lower(np.char.strip(names))
+    codes = flight_type_codes(names)
+    digits = np.char.isdigit(names)
+    if digits.any():
+        codes[digits] = flight_type_codes(names[digits].astype(np.intp))
+    return codes
+
+
+def read_airframe_csv(path: str) -> Dict[str, np.ndarray]:
+    chunks = list(iter_airframe_csv(path))
+    if not chunks:
+        raise ValueError(f"{path}: no airframes found.")
+    return {name: np.concatenate([c[name] for c in chunks]) for name in AIRFRAME_COLUMNS}
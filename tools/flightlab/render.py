@@ -0,0 +1,299 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from flightlab.stl import load_stl
+
+# ----------------------------
+# STL thumbnails: NumPy z-buffer rasterizer
+# ----------------------------
+#
+# Renders the view the docs' STL viewer opens with: the part turned 90
+# degrees about Y, set on the ground plane, seen from the (1, 1, 1)
+# direction through a 45 degree camera, lit by the same hemisphere and
+# directional light. Shading is Lambert only (no specular), per face like
+# the viewer's flat normals. Triangles are rasterized in batches of
+# (triangle, pixel) pairs; each batch resolves its depth with one sort.
+
+PROJECTIONS = ("perspective", "orthographic")
+DEFAULT_SIZE = (600, 520)  # the viewer's default container
+DEFAULT_COLOR = "#aaaaaa"
+FOV_DEG = 45.0
+FRAME_OFFSET = 1.35  # fitCameraToSphere margin
+
+_SKY = np.array([1.0, 1.0, 1.0])
+_GROUND = np.full(3, 0x44 / 255.0)
+_HEMI_INTENSITY = 0.85
+_DIR_INTENSITY = 0.8
+_LIGHT_DIR = np.full(3, 1.0 / np.sqrt(3.0))
+
+_PAIR_BATCH = 1 << 22
+_RENDER_PARALLEL_BYTES = 16 * 1024 * 1024  # auto mode uses processes above this much STL
+THUMBNAIL_INDEX = "thumbnails.json"
+
+
+def parse_color(value: str) -> np.ndarray:
+    """'#rgb', '#rrggbb' or '#rrggbbaa' to RGBA floats in 0..1."""
+    h = value.strip().lstrip("#")
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    if len(h) not in (6, 8):
+        raise ValueError(f"Invalid color '{value}'. Use #rrggbb.")
+    try:
+        rgba = [int(h[i : i + 2], 16) / 255.0 for i in range(0, len(h), 2)]
+    except ValueError:
+        raise ValueError(f"Invalid color '{value}'. Use #rrggbb.")
+    return np.array(rgba + [1.0] * (4 - len(rgba)))
+
+
+def _to_linear(c: np.ndarray) -> np.ndarray:
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def _to_srgb(c: np.ndarray) -> np.ndarray:
+    c = np.clip(c, 0.0, 1.0)
+    return np.where(c <= 0.0031308, c * 12.92, 1.055 * c ** (1.0 / 2.4) - 0.055)
+
+
+def viewer_placement(triangles: np.ndarray) -> np.ndarray:
+    """Vertices as the viewer places them: rotated 90 deg about Y, centred, on y = 0."""
+    v = np.asarray(triangles, dtype=np.float64).reshape(-1, 3)
+    v = np.column_stack([v[:, 2], v[:, 1], -v[:, 0]])
+    lo, hi = v.min(axis=0), v.max(axis=0)
+    v = v - (lo + hi) / 2.0
+    v[:, 0] -= 10.0  # the viewer's fixed x nudge
+    v[:, 1] -= v[:, 1].min()
+    return v.reshape(-1, 3, 3)
+
+
+def _camera(tri: np.ndarray, aspect: float, projection: str):
+    lo, hi = tri.reshape(-1, 3).min(axis=0), tri.reshape(-1, 3).max(axis=0)
+    radius = max(float(np.linalg.norm(hi - lo)) / 2.0, 1e-6)
+    vfov = np.radians(FOV_DEG)
+    hfov = 2.0 * np.arctan(np.tan(vfov / 2.0) * aspect)
+    dist = max(radius / np.sin(vfov / 2.0), radius / np.sin(hfov / 2.0)) * FRAME_OFFSET
+    eye = _LIGHT_DIR * dist  # target is the origin; the default view shares the light's direction
+    forward = -eye / dist
+    right = np.cross(forward, [0.0, 1.0, 0.0])
+    right /= np.linalg.norm(right)
+    up = np.cross(right, forward)
+    half_h = np.tan(vfov / 2.0)
+    if projection == "orthographic":
+        # Same apparent size at the target as the perspective view.
+        half_h *= dist
+    return eye, np.stack([right, up, forward]), half_h
+
+
+def rasterize(
+    triangles: np.ndarray,
+    size: Tuple[int, int] = DEFAULT_SIZE,
+    projection: str = "perspective",
+    color: str = DEFAULT_COLOR,
+    background: Optional[str] = None,
+    supersample: int = 2,
+) -> np.ndarray:
+    """Render placed triangles (see viewer_placement) to an (h, w, 4) uint8 RGBA image.
+
+    background=None leaves uncovered pixels transparent. supersample
+    renders at that many times the size and averages down.
+    """
+    if projection not in PROJECTIONS:
+        raise ValueError(f"Unknown projection '{projection}'. Use one of: {', '.join(PROJECTIONS)}.")
+    width, height = int(size[0]), int(size[1])
+    if width < 1 or height < 1:
+        raise ValueError("Image size must be at least 1x1.")
+    if supersample < 1:
+        raise ValueError("Supersample must be >= 1.")
+    base = parse_color(color)
+    W, H = width * supersample, height * supersample
+    tri = np.asarray(triangles, dtype=np.float64)
+
+    eye, basis, half_h = _camera(tri, W / H, projection)
+    cam = (tri.reshape(-1, 3) - eye) @ basis.T  # x right, y up, z ahead
+    z = cam[:, 2]
+    scale = np.full(len(cam), half_h)
+    if projection == "perspective":
+        scale = half_h * np.maximum(z, 1e-9)
+    sx = (cam[:, 0] / (scale * W / H) + 1.0) * 0.5 * W
+    sy = (1.0 - cam[:, 1] / scale) * 0.5 * H
+    # Depth key interpolated in screen space: larger is nearer.
+    depth = 1.0 / np.maximum(z, 1e-9) if projection == "perspective" else -z
+    sx, sy, depth = sx.reshape(-1, 3), sy.reshape(-1, 3), depth.reshape(-1, 3)
+
+    # Front faces only (counter-clockwise on screen with y up), like the viewer's material.
+    area = (sx[:, 1] - sx[:, 0]) * (sy[:, 2] - sy[:, 0]) - (sx[:, 2] - sx[:, 0]) * (sy[:, 1] - sy[:, 0])
+    front = (area < 0.0) & np.all(z.reshape(-1, 3) > 0.0, axis=1)
+
+    n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    n /= np.maximum(np.linalg.norm(n, axis=1), 1e-300)[:, None]
+    hemi = _GROUND + (_SKY - _GROUND) * (0.5 * n[:, 1:2] + 0.5)
+    light = _HEMI_INTENSITY * _to_linear(hemi) + _DIR_INTENSITY * np.maximum(n @ _LIGHT_DIR, 0.0)[:, None]
+    shade = _to_srgb(_to_linear(base[:3]) * light)
+
+    x0 = np.clip(np.floor(sx.min(axis=1) - 0.5), 0, W - 1).astype(np.int64)
+    x1 = np.clip(np.ceil(sx.max(axis=1) - 0.5), 0, W - 1).astype(np.int64)
+    y0 = np.clip(np.floor(sy.min(axis=1) - 0.5), 0, H - 1).astype(np.int64)
+    y1 = np.clip(np.ceil(sy.max(axis=1) - 0.5), 0, H - 1).astype(np.int64)
+    visible = front & (sx.max(axis=1) >= 0) & (sx.min(axis=1) <= W) & (sy.max(axis=1) >= 0) & (sy.min(axis=1) <= H)
+    ids = np.flatnonzero(visible & (area != 0.0))
+    bw = x1[ids] - x0[ids] + 1
+    counts = bw * (y1[ids] - y0[ids] + 1)
+
+    zbuf = np.full(W * H, -np.inf)
+    owner = np.full(W * H, -1, dtype=np.int64)
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(ids):
+        done = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, done + _PAIR_BATCH, side="right")), start + 1)
+        t_ids, c, w = ids[start:stop], counts[start:stop], bw[start:stop]
+        k = np.repeat(np.arange(len(t_ids)), c)
+        r = np.arange(int(c.sum())) - np.repeat(np.cumsum(c) - c, c)
+        t = t_ids[k]
+        px = x0[t] + r % w[k]
+        py = y0[t] + r // w[k]
+        cx, cy = px + 0.5, py + 0.5
+        ax, ay, bx, by, qx, qy = sx[t, 0], sy[t, 0], sx[t, 1], sy[t, 1], sx[t, 2], sy[t, 2]
+        inv = 1.0 / area[t]
+        w0 = ((bx - cx) * (qy - cy) - (qx - cx) * (by - cy)) * inv
+        w1 = ((qx - cx) * (ay - cy) - (ax - cx) * (qy - cy)) * inv
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= 0.0) & (w1 >= 0.0) & (w2 >= 0.0)
+        t, pix = t[inside], (py * W + px)[inside]
+        d = w0[inside] * depth[t, 0] + w1[inside] * depth[t, 1] + w2[inside] * depth[t, 2]
+        order = np.lexsort((-d, pix))
+        pix, d, t = pix[order], d[order], t[order]
+        first = np.r_[True, pix[1:] != pix[:-1]]
+        pix, d, t = pix[first], d[first], t[first]
+        nearer = d > zbuf[pix]
+        zbuf[pix[nearer]] = d[nearer]
+        owner[pix[nearer]] = t[nearer]
+        start = stop
+
+    covered = owner >= 0
+    rgb = np.zeros((W * H, 3))
+    rgb[covered] = shade[owner[covered]]
+    alpha = covered.astype(np.float64)
+    if background is not None:
+        bg = parse_color(background)
+        rgb[~covered] = bg[:3]
+        alpha[~covered] = bg[3]
+    rgb = rgb * alpha[:, None]
+    s = supersample
+    rgb = rgb.reshape(height, s, width, s, 3).mean(axis=(1, 3))
+    alpha = alpha.reshape(height, s, width, s).mean(axis=(1, 3))
+    rgb = np.divide(rgb, alpha[..., None], out=np.zeros_like(rgb), where=alpha[..., None] > 0)
+    out = np.concatenate([rgb, alpha[..., None]], axis=2)
+    return np.rint(out * 255.0).astype(np.uint8)
+
+
+def png_bytes(image: np.ndarray) -> bytes:
+    """Encode an (h, w, 4) uint8 RGBA image as PNG."""
+    h, w = image.shape[:2]
+    raw = np.zeros((h, 1 + 4 * w), dtype=np.uint8)  # filter byte 0 per row
+    raw[:, 1:] = np.asarray(image, dtype=np.uint8).reshape(h, 4 * w)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(raw.tobytes(), 9)),
+        chunk(b"IEND", b""),
+    ])
+
+
+def render_stl(path: str, **options) -> np.ndarray:
+    """Thumbnail of one STL file; options are rasterize()'s."""
+    mesh = load_stl(path)
+    if not len(mesh):
+        raise ValueError(f"{path}: mesh has no triangles.")
+    return rasterize(viewer_placement(mesh.triangles), **options)
+
+
+def _file_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _render_task(task) -> str:
+    """Render one thumbnail; returns the PNG's hash for the index."""
+    path, out_path, options = task
+    data = png_bytes(render_stl(path, **options))
+    with open(out_path, "wb") as f:
+        f.write(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def render_thumbnails(
+    paths: Sequence[str],
+    out_dir: Optional[str] = None,
+    force: bool = False,
+    workers: Optional[int] = None,
+    **options,
+) -> List[Dict[str, object]]:
+    """Render <stem>.png for every STL, skipping files whose content and options are unchanged.
+
+    Each output directory keeps a thumbnails.json index of source and PNG
+    hashes; a thumbnail is re-rendered only when its STL's hash, the render
+    options or the PNG itself changed (including a missing PNG). Returns one entry per path with "rendered"
+    telling whether it was drawn this time. workers=None uses all cores
+    once the STLs to render total more than _RENDER_PARALLEL_BYTES.
+    """
+    if options.get("projection", "perspective") not in PROJECTIONS:
+        raise ValueError(f"Unknown projection '{options['projection']}'. Use one of: {', '.join(PROJECTIONS)}.")
+    settings = json.dumps(options, sort_keys=True)
+    entries, tasks, slots, indexes = [], [], [], {}
+    for path in paths:
+        target = out_dir or os.path.dirname(os.path.abspath(path))
+        out_path = os.path.join(target, os.path.splitext(os.path.basename(path))[0] + ".png")
+        index = indexes.get(target)
+        if index is None:
+            try:
+                with open(os.path.join(target, THUMBNAIL_INDEX), encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = {}
+            indexes[target] = index
+        key = hashlib.blake2b((_file_hash(path) + settings).encode(), digest_size=16).hexdigest()
+        name = os.path.basename(out_path)
+        old = index.get(name, {})
+        fresh = (
+            not force and old.get("key") == key and os.path.exists(out_path)
+            and old.get("png") == _file_hash(out_path)
+        )
+        index[name] = {"source": os.path.basename(path), "key": key, "options": options, "png": old.get("png")}
+        entries.append({"path": path, "thumbnail": out_path, "rendered": not fresh})
+        if not fresh:
+            tasks.append((path, out_path, options))
+            slots.append(index[name])
+
+    if tasks:
+        for target in indexes:
+            os.makedirs(target, exist_ok=True)
+        if workers is None:
+            total = sum(os.path.getsize(t[0]) for t in tasks)
+            workers = (os.cpu_count() or 1) if total > _RENDER_PARALLEL_BYTES else 1
+        workers = max(1, min(workers, len(tasks)))
+        if workers == 1:
+            digests = [_render_task(t) for t in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                digests = list(pool.map(_render_task, tasks))
+        for slot, digest in zip(slots, digests):
+            slot["png"] = digest
+    for target, index in indexes.items():
+        with open(os.path.join(target, THUMBNAIL_INDEX), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+    return entries
@@ -0,0 +1,156 @@
+import os
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity, array-backed FIFO of numeric rows.
+
+    Storage is preallocated as a (capacity, ncols) array, so appends never
+    allocate. Once full, the oldest rows are overwritten; if spill_path is
+    set they are first appended to that file as raw rows (see read_spill()),
+    so the full history stays available without growing memory.
+    """
+
+    def __init__(self, capacity: int, ncols: int, spill_path: Optional[str] = None, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be >= 1.")
+        self.capacity = int(capacity)
+        self.ncols = int(ncols)
+        self.dtype = np.dtype(dtype)
+        self.spill_path = spill_path
+        self._data = np.empty((self.capacity, self.ncols), dtype=self.dtype)
+        self._start = 0  # physical index of the oldest row
+        self._len = 0
+        self.total = 0  # rows ever appended
+        self.spilled = 0  # rows written to the spill file
+        self._spill_fh = open(spill_path, "wb") if spill_path else None
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def full(self) -> bool:
+        return self._len == self.capacity
+
+    @property
+    def dropped(self) -> int:
+        """Rows evicted from memory (spilled or discarded)."""
+        return self.total - self._len
+
+    # ---- Writing ----
+    def append(self, row: Sequence[float]):
+        if self.full:
+            self._evict(1)
+        self._data[(self._start + self._len) % self.capacity] = row
+        self._len += 1
+        self.total += 1
+
+    def extend(self, rows) -> None:
+        rows = np.asarray(rows, dtype=self.dtype).reshape(-1, self.ncols)
+        k = len(rows)
+        if k == 0:
+            return
+        if k >= self.capacity:
+            # Everything held now, plus the head of the batch, falls out.
+            self._evict(self._len)
+            self._spill(rows[: k - self.capacity])
+            self.total += k - self.capacity
+            rows = rows[k - self.capacity :]
+            k = self.capacity
+        overflow = self._len + k - self.capacity
+        if overflow > 0:
+            self._evict(overflow)
+        pos = (self._start + self._len) % self.capacity
+        first = min(k, self.capacity - pos)
+        self._data[pos : pos + first] = rows[:first]
+        self._data[: k - first] = rows[first:]
+        self._len += k
+        self.total += k
+
+    def _evict(self, count: int):
+        if count <= 0:
+            return
+        if self._spill_fh is not None:
+            for seg in self._segments(0, count):
+                self._spill(seg)
+        self._start = (self._start + count) % self.capacity
+        self._len -= count
+
+    def _spill(self, rows: np.ndarray):
+        if self._spill_fh is not None and len(rows):
+            rows.tofile(self._spill_fh)
+            self.spilled += len(rows)
+
+    # ---- Reading ----
+    def physical_row(self, i: int) -> int:
+        """Storage row of logical row i (0 = oldest retained)."""
+        return (self._start + i) % self.capacity
+
+    @property
+    def data(self) -> np.ndarray:
+        """Raw storage; index rows through physical_row()."""
+        return self._data
+
+    def _segments(self, i0: int, i1: int) -> Iterator[np.ndarray]:
+        # Logical rows [i0, i1) as at most two contiguous views.
+        if i1 <= i0:
+            return
+        a = (self._start + i0) % self.capacity
+        n = i1 - i0
+        first = min(n, self.capacity - a)
+        yield self._data[a : a + first]
+        if n > first:
+            yield self._data[: n - first]
+
+    def snapshot(self) -> np.ndarray:
+        """Retained rows, oldest first, as a new contiguous array."""
+        if self._len == 0:
+            return np.empty((0, self.ncols), dtype=self.dtype)
+        return np.concatenate(list(self._segments(0, self._len)))
+
+    def last(self) -> Optional[np.ndarray]:
+        return self._data[self.physical_row(self._len - 1)] if self._len else None
+
+    def spilled_rows(self) -> np.ndarray:
+        """Rows written to the spill file so far, as a read-only memmap."""
+        if not self.spilled:
+            return np.empty((0, self.ncols), dtype=self.dtype)
+        self._spill_fh.flush()
+        return read_spill(self.spill_path, self.ncols, self.dtype, self.spilled)
+
+    def iter_chunks(self, include_spill: bool = True, chunk_rows: int = 65536) -> Iterator[np.ndarray]:
+        """Full history in order: spilled rows first, then retained rows."""
+        if include_spill:
+            spilled = self.spilled_rows()
+            for i in range(0, len(spilled), chunk_rows):
+                yield spilled[i : i + chunk_rows]
+        for seg in self._segments(0, self._len):
+            for i in range(0, len(seg), chunk_rows):
+                yield seg[i : i + chunk_rows]
+
+    # ---- Lifecycle ----
+    def clear(self):
+        self._start = 0
+        self._len = 0
+        self.total = 0
+        self.spilled = 0
+        if self._spill_fh is not None:
+            self._spill_fh.seek(0)
+            self._spill_fh.truncate()
+
+    def close(self):
+        if self._spill_fh is not None:
+            self._spill_fh.close()
+            self._spill_fh = None
+
+
+def read_spill(path: str, ncols: int, dtype=np.float64, rows: Optional[int] = None) -> np.ndarray:
+    """Memory-map a spill file written by RingBuffer as a (rows, ncols) array."""
+    dtype = np.dtype(dtype)
+    if rows is None:
+        rows = os.path.getsize(path) // (dtype.itemsize * ncols)
+    if rows == 0:
+        return np.empty((0, ncols), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(rows, ncols))
@@ -0,0 +1,311 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from flightlab.stl import StlMesh
+
+# ----------------------------
+# Plane slicing
+# ----------------------------
+#
+# All stations are cut at once. Stations are sorted, and each triangle's
+# extent along the slicing axis maps to the run of stations it spans
+# (two searchsorted calls), which yields exactly the (triangle, station)
+# pairs that intersect. This sorted-interval index costs
+# O(T log S + pairs) instead of O(T x S).
+#
+# Segments are oriented by the triangle normal, so all loops of a closed
+# mesh run the same way and holes run opposite to the outline; edge end points are
+# interpolated in a canonical vertex order and vertices lying on the plane
+# are taken as they are, so neighbouring triangles produce bit-identical
+# points and loops can be chained by exact match.
+
+AXES = {"x": 0, "y": 1, "z": 2}
+_PROFILE_SAMPLES = 201
+
+
+def _axis(name) -> int:
+    if isinstance(name, (int, np.integer)) and 0 <= name < 3:
+        return int(name)
+    try:
+        return AXES[str(name).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown axis '{name}'. Use x, y or z.")
+
+
+def _canonical_edges(a: np.ndarray, b: np.ndarray):
+    """Swap edge ends so every edge is ordered the same way in both triangles."""
+    swap = (a[:, 0] > b[:, 0]) | (
+        (a[:, 0] == b[:, 0]) & ((a[:, 1] > b[:, 1]) | ((a[:, 1] == b[:, 1]) & (a[:, 2] > b[:, 2])))
+    )
+    a2 = np.where(swap[:, None], b, a)
+    b2 = np.where(swap[:, None], a, b)
+    return a2, b2
+
+
+def slice_segments(mesh: StlMesh, stations: np.ndarray, axis=1):
+    """Intersection segments of the mesh with planes axis = stations[i].
+
+    Returns (station_index, start, end): start/end are (n, 3) points, each
+    segment oriented along plane_normal x triangle_normal.
+    """
+    ax = _axis(axis)
+    stations = np.asarray(stations, dtype=np.float64)
+    order = np.argsort(stations, kind="stable")
+    sorted_st = stations[order]
+
+    tri = mesh.triangles
+    c0, c1, c2 = tri[:, 0, ax], tri[:, 1, ax], tri[:, 2, ax]
+    lo = np.searchsorted(sorted_st, np.minimum(np.minimum(c0, c1), c2), side="left")
+    hi = np.searchsorted(sorted_st, np.maximum(np.maximum(c0, c1), c2), side="right")
+    counts = hi - lo
+    hit = np.flatnonzero(counts > 0)
+    if hit.size == 0:
+        empty = np.empty((0, 3))
+        return np.empty(0, dtype=np.intp), empty, empty
+
+    # (triangle, station) pairs
+    counts = counts[hit]
+    t_idx = np.repeat(hit, counts)
+    starts = np.repeat(lo[hit] - np.cumsum(counts) + counts, counts)
+    s_sorted = starts + np.arange(len(t_idx))
+    v = tri[t_idx].astype(np.float64)  # (p, 3, 3)
+    h = sorted_st[s_sorted]
+    d = v[:, :, ax] - h[:, None]
+    above = d >= 0.0  # vertices on the plane count as above
+
+    pts = []
+    crosses = []
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        a, b = _canonical_edges(v[:, i], v[:, j])
+        da, db = a[:, ax] - h, b[:, ax] - h
+        cross = above[:, i] != above[:, j]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(cross, da / (da - db), 0.0)
+        # a + (b - a) * 1 need not equal b bit for bit; use on-plane vertices as they are.
+        pt = np.where((db == 0.0)[:, None], b, a + (b - a) * t[:, None])
+        pts.append(np.where((da == 0.0)[:, None], a, pt))
+        crosses.append(cross)
+    crosses = np.stack(crosses, axis=1)  # (p, 3): 0 or 2 edges cross
+    keep = crosses.sum(axis=1) == 2
+    pts = np.stack(pts, axis=1)[keep]
+    crosses = crosses[keep]
+    v = v[keep]
+    s_sorted = s_sorted[keep]
+
+    first = np.argmax(crosses, axis=1)
+    second = 2 - np.argmax(crosses[:, ::-1], axis=1)
+    rows = np.arange(len(pts))
+    p, q = pts[rows, first], pts[rows, second]
+    p[:, ax] = q[:, ax] = sorted_st[s_sorted]
+
+    # Orient along plane_normal x triangle_normal.
+    n = np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0])
+    e = np.zeros(3)
+    e[ax] = 1.0
+    flip = np.einsum("ij,ij->i", q - p, np.cross(e, n)) < 0.0
+    p[flip], q[flip] = q[flip], p[flip].copy()
+    degenerate = np.all(p == q, axis=1)
+    return order[s_sorted[~degenerate]], p[~degenerate], q[~degenerate]
+
+
+def chain_loops(start: np.ndarray, end: np.ndarray) -> Tuple[List[np.ndarray], List[bool]]:
+    """Join oriented segments into polylines by exact end-point match.
+
+    Returns (polylines, closed). Closed loops are returned without
+    repeating the first point; open chains (holes in the mesh) are
+    returned as-is, with closed False.
+    """
+    n = len(start)
+    if n == 0:
+        return [], []
+    key_dtype = np.dtype((np.void, start.dtype.itemsize * start.shape[1]))
+    skeys = np.ascontiguousarray(start).view(key_dtype).ravel()
+    ekeys = np.ascontiguousarray(end).view(key_dtype).ravel()
+    order = np.argsort(skeys)
+    pos = np.searchsorted(skeys[order], ekeys)
+    pos = np.minimum(pos, n - 1)
+    nxt = np.where(skeys[order][pos] == ekeys, order[pos], -1).tolist()
+    has_prev = np.zeros(n, dtype=bool)
+    linked = np.array(nxt)
+    has_prev[linked[linked >= 0]] = True
+
+    used = [False] * n
+    loops, closed = [], []
+    # Open chains first (from segments nothing leads into), then cycles.
+    for seed in np.flatnonzero(~has_prev).tolist() + list(range(n)):
+        if used[seed]:
+            continue
+        idx = []
+        i = seed
+        while i >= 0 and not used[i]:
+            used[i] = True
+            idx.append(i)
+            i = nxt[i]
+        closed.append(i == seed)
+        if i == seed:
+            loops.append(start[idx])
+        else:
+            pts = np.empty((len(idx) + 1, start.shape[1]))
+            pts[:-1] = start[idx]
+            pts[-1] = end[idx[-1]]
+            loops.append(pts)
+    return loops, closed
+
+
+class Section:
+    """One station's cut: polylines in (chord axis, thickness axis) coordinates.
+
+    closed flags each polyline; only closed loops (outlines) are measured,
+    open chains come from holes in the mesh. The outer loop is the one
+    with the largest enclosed area; chord runs
+    from its leading edge (minimum chordwise coordinate) to the farthest
+    point from it, and thickness is the largest gap between the upper and
+    lower surface measured normal to the chord line.
+    """
+
+    def __init__(self, station: float, loops: List[np.ndarray], closed: Optional[List[bool]] = None):
+        self.station = station
+        self.loops = loops
+        self.closed = [True] * len(loops) if closed is None else list(closed)
+        self.chord = 0.0
+        self.thickness = 0.0
+        self.area = 0.0
+        self.leading_edge = np.full(2, np.nan)
+        self.trailing_edge = np.full(2, np.nan)
+        outlines = self.outlines
+        if outlines:
+            areas = [_shoelace(lp) for lp in outlines]
+            outer = outlines[int(np.argmax(np.abs(areas)))]
+            self.area = float(abs(sum(areas)))
+            self._profile(outer)
+
+    @property
+    def outlines(self) -> List[np.ndarray]:
+        return [lp for lp, c in zip(self.loops, self.closed) if c and len(lp) >= 3]
+
+    @property
+    def thickness_ratio(self) -> float:
+        return self.thickness / self.chord if self.chord > 0 else 0.0
+
+    def _profile(self, loop: np.ndarray):
+        le = int(np.argmin(loop[:, 0]))
+        te = int(np.argmax(np.linalg.norm(loop - loop[le], axis=1)))
+        self.leading_edge, self.trailing_edge = loop[le], loop[te]
+        chord_vec = loop[te] - loop[le]
+        self.chord = float(np.linalg.norm(chord_vec))
+        if self.chord == 0.0:
+            return
+        u = chord_vec / self.chord
+        rel = loop - loop[le]
+        s = rel @ u  # along the chord
+        t = rel @ np.array([-u[1], u[0]])  # normal to it
+        # The two arcs between LE and TE are the two surfaces.
+        a, b = sorted((le, te))
+        arc1 = np.r_[a:b + 1]
+        arc2 = np.r_[b:len(loop), 0:a + 1]
+        grid = np.linspace(0.0, self.chord, _PROFILE_SAMPLES)
+        surfaces = []
+        for arc in (arc1, arc2):
+            o = np.argsort(s[arc], kind="stable")
+            surfaces.append(np.interp(grid, s[arc][o], t[arc][o]))
+        self.thickness = float(np.max(np.abs(surfaces[0] - surfaces[1])))
+
+
+def _trapezoid(y: np.ndarray, x: np.ndarray) -> float:
+    return float(np.sum((y[1:] + y[:-1]) * np.diff(x)) / 2.0)
+
+
+def _shoelace(loop: np.ndarray) -> float:
+    x, y = loop[:, 0], loop[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+class WingSections:
+    """Sections at every station plus the planform quantities.
+
+    S (reference area) and the mean aerodynamic chord integrate the chord
+    over the sliced span with the trapezoid rule, so stations should cover
+    the span from tip to tip (or root to tip for a half wing).
+    """
+
+    def __init__(self, stations: np.ndarray, sections: List[Section], span_axis: int, chord_axis: int):
+        self.stations = stations
+        self.sections = sections
+        self.span_axis = span_axis
+        self.chord_axis = chord_axis
+        self.chord = np.array([s.chord for s in sections])
+        self.thickness = np.array([s.thickness for s in sections])
+
+    @property
+    def span(self) -> float:
+        return float(self.stations[-1] - self.stations[0]) if len(self.stations) else 0.0
+
+    @property
+    def reference_area(self) -> float:
+        return float(_trapezoid(self.chord, self.stations)) if len(self.stations) > 1 else 0.0
+
+    @property
+    def mean_aerodynamic_chord(self) -> float:
+        s = self.reference_area
+        return float(_trapezoid(self.chord ** 2, self.stations) / s) if s > 0 else 0.0
+
+    @property
+    def aspect_ratio(self) -> float:
+        s = self.reference_area
+        return self.span ** 2 / s if s > 0 else 0.0
+
+    def columns(self):
+        return {
+            "station": self.stations,
+            "chord": self.chord,
+            "thickness": self.thickness,
+            "thickness_ratio": np.array([s.thickness_ratio for s in self.sections]),
+            "section_area": np.array([s.area for s in self.sections]),
+            "loops": np.array([len(s.outlines) for s in self.sections]),
+            "open_chains": np.array([len(s.loops) - len(s.outlines) for s in self.sections]),
+            "le_chordwise": np.array([s.leading_edge[0] for s in self.sections]),
+            "le_normal": np.array([s.leading_edge[1] for s in self.sections]),
+        }
+
+
+SECTION_COLUMNS = (
+    "station", "chord", "thickness", "thickness_ratio", "section_area", "loops", "open_chains", "le_chordwise", "le_normal",
+)
+
+
+def slice_wing(
+    mesh: StlMesh,
+    stations: Optional[Sequence[float]] = None,
+    n_stations: int = 100,
+    span_axis="y",
+    chord_axis="x",
+) -> WingSections:
+    """Cut the mesh at spanwise stations and measure each section.
+
+    Without explicit stations, n_stations are spread evenly over the
+    mesh's span, inset by a hair so the tips still cut the surface.
+    """
+    span_ax, chord_ax = _axis(span_axis), _axis(chord_axis)
+    if span_ax == chord_ax:
+        raise ValueError("Span and chord axes must differ.")
+    normal_ax = 3 - span_ax - chord_ax
+    if stations is None:
+        if n_stations < 2:
+            raise ValueError("Use at least 2 stations.")
+        lo, hi = mesh.bounding_box()
+        inset = (hi[span_ax] - lo[span_ax]) * 1e-6
+        stations = np.linspace(lo[span_ax] + inset, hi[span_ax] - inset, n_stations)
+    stations = np.sort(np.asarray(stations, dtype=np.float64))
+
+    st_idx, p, q = slice_segments(mesh, stations, span_ax)
+    order = np.argsort(st_idx, kind="stable")
+    st_idx, p, q = st_idx[order], p[order], q[order]
+    bounds = np.searchsorted(st_idx, np.arange(len(stations) + 1))
+    plane = [chord_ax, normal_ax]
+    sections = []
+    for i, h in enumerate(stations):
+        a, b = bounds[i], bounds[i + 1]
+        loops, closed = chain_loops(p[a:b], q[a:b])
+        sections.append(Section(float(h), [lp[:, plane] for lp in loops], closed))
+    return WingSections(stations, sections, span_ax, chord_ax)
@@ -0,0 +1,228 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# ----------------------------
+# STL loading
+# ----------------------------
+#
+# Binary STL: 80-byte header, uint32 triangle count, then one 50-byte record
+# per triangle (normal, three vertices as float32, uint16 attribute). The
+# records are memory-mapped as a structured array, so loading touches no
+# triangle data; the analytics below stream over it in chunks.
+
+STL_HEADER_BYTES = 80
+STL_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])  # 50 bytes
+
+_CHUNK_TRIANGLES = 1 << 20
+_ASCII_VERTEX = re.compile(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)")
+
+
+class StlMesh:
+    """Triangles of an STL file, memory-mapped for binary files.
+
+    `records` is the structured array (STL_DTYPE); `triangles` is an
+    (n, 3, 3) float32 view of the vertices. Lengths are in model units
+    (usually mm), so areas are in units^2 and volumes in units^3.
+    """
+
+    def __init__(self, records: np.ndarray, header: bytes = b"", path: str = ""):
+        self.records = records
+        self.header = header
+        self.path = path
+        self._stats: Optional[_Moments] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def triangles(self) -> np.ndarray:
+        return self.records["vertices"]
+
+    @property
+    def normals(self) -> np.ndarray:
+        return self.records["normal"]
+
+    @property
+    def name(self) -> str:
+        return self.header.split(b"\0", 1)[0].decode("ascii", errors="replace").strip()
+
+    def chunks(self, size: int = _CHUNK_TRIANGLES):
+        """float64 (m, 3, 3) vertex blocks; bounds memory on huge meshes."""
+        tri = self.triangles
+        for i in range(0, len(tri), size):
+            yield tri[i : i + size].astype(np.float64)
+
+    # ---- Analytics ----
+
+    def _moments(self) -> "_Moments":
+        # One pass over the file for every analytic; chunks run on a thread
+        # pool (NumPy releases the GIL) when there is more than one.
+        if self._stats is None:
+            tri = self.triangles
+            blocks = [tri[i : i + _CHUNK_TRIANGLES] for i in range(0, len(tri), _CHUNK_TRIANGLES)]
+            workers = min(len(blocks), os.cpu_count() or 1)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    parts = list(pool.map(_block_moments, blocks))
+            else:
+                parts = [_block_moments(b) for b in blocks]
+            self._stats = _Moments.combine(parts)
+        return self._stats
+
+    def bounding_box(self) -> Tuple[np.ndarray, np.ndarray]:
+        if not len(self):
+            raise ValueError("Mesh has no triangles.")
+        m = self._moments()
+        return m.lo.copy(), m.hi.copy()
+
+    def triangle_areas(self) -> np.ndarray:
+        if not len(self):
+            return np.empty(0)
+        return np.concatenate([
+            0.5 * np.linalg.norm(np.cross(c[:, 1] - c[:, 0], c[:, 2] - c[:, 0]), axis=1) for c in self.chunks()
+        ])
+
+    def surface_area(self) -> float:
+        return self._moments().area
+
+    def surface_centroid(self) -> np.ndarray:
+        """Area-weighted centroid of the triangles (the centre of a thin shell)."""
+        m = self._moments()
+        if m.area == 0.0:
+            raise ValueError("Mesh has no surface area.")
+        return m.area_first / m.area
+
+    def mass_properties(self, density: float = 1.0) -> Dict[str, object]:
+        """Volume, centroid and inertia of the enclosed solid.
+
+        Each triangle spans a signed tetrahedron with the origin; summing
+        their volumes, first and second moments gives the solid's, provided
+        the mesh is closed. A negative volume means inward-facing normals
+        (the moments are corrected for it). The inertia tensor is about the
+        centroid, for a uniform `density` (mass per unit^3).
+        """
+        m = self._moments()
+        volume = m.vol6 / 6.0
+        if volume == 0.0:
+            raise ValueError("Mesh encloses no volume (open or flat surface).")
+        centroid = m.first / (4.0 * m.vol6)
+        mass = density * abs(volume)
+        cov = np.sign(volume) * density * m.second / 120.0 - mass * np.outer(centroid, centroid)
+        inertia = np.trace(cov) * np.eye(3) - cov
+        return {
+            "volume": float(volume),
+            "mass": float(mass),
+            "centroid": centroid,
+            "inertia": inertia,
+        }
+
+    def summary(self, density: float = 1.0) -> Dict[str, object]:
+        lo, hi = self.bounding_box()
+        out = {
+            "path": self.path,
+            "name": self.name,
+            "triangles": len(self),
+            "bbox_min": lo,
+            "bbox_max": hi,
+            "size": hi - lo,
+            "surface_area": self.surface_area(),
+        }
+        out.update(self.mass_properties(density))
+        return out
+
+
+class _Moments:
+    """Per-block sums: bounds, area and its first moment, 6x volume, first and second moments."""
+
+    def __init__(self, lo, hi, area, area_first, vol6, first, second):
+        self.lo, self.hi = lo, hi
+        self.area = area
+        self.area_first = area_first
+        self.vol6 = vol6
+        self.first = first
+        self.second = second
+
+    @classmethod
+    def combine(cls, parts):
+        if not parts:
+            return cls(np.full(3, np.inf), np.full(3, -np.inf), 0.0, np.zeros(3), 0.0, np.zeros(3), np.zeros((3, 3)))
+        return cls(
+            np.min([p.lo for p in parts], axis=0),
+            np.max([p.hi for p in parts], axis=0),
+            float(sum(p.area for p in parts)),
+            np.sum([p.area_first for p in parts], axis=0),
+            float(sum(p.vol6 for p in parts)),
+            np.sum([p.first for p in parts], axis=0),
+            np.sum([p.second for p in parts], axis=0),
+        )
+
+
+def _block_moments(block: np.ndarray) -> _Moments:
+    # Component rows (x0, y0, z0, x1, ..., z2), each contiguous float64.
+    c = np.array(block.reshape(-1, 9).T, dtype=np.float64, order="C")
+    x0, y0, z0, x1, y1, z1, x2, y2, z2 = c
+    lo = np.array([c[0::3].min(), c[1::3].min(), c[2::3].min()])
+    hi = np.array([c[0::3].max(), c[1::3].max(), c[2::3].max()])
+
+    ax, ay, az = x1 - x0, y1 - y0, z1 - z0
+    bx, by, bz = x2 - x0, y2 - y0, z2 - z0
+    nx = ay * bz - az * by
+    ny = az * bx - ax * bz
+    nz = ax * by - ay * bx
+    tri_area = 0.5 * np.sqrt(nx * nx + ny * ny + nz * nz)
+
+    # v0 . (v1 x v2) == v0 . ((v1 - v0) x (v2 - v0)): 6x the signed volume
+    # of the tetrahedron (origin, v0, v1, v2).
+    det = x0 * nx + y0 * ny + z0 * nz
+    s = np.stack([x0 + x1 + x2, y0 + y1 + y2, z0 + z1 + z2])
+    first = s @ det
+    area_first = s @ tri_area / 3.0
+    # Tetra covariance about the origin: det/120 * (sum_j vj vj^T + s s^T).
+    m = (c * det) @ c.T
+    second = m[0:3, 0:3] + m[3:6, 3:6] + m[6:9, 6:9] + (s * det) @ s.T
+    return _Moments(lo, hi, float(tri_area.sum()), area_first, float(det.sum()), first, second)
+
+
+def load_stl(path: str) -> StlMesh:
+    """Binary STL (memory-mapped, read-only) or ASCII STL (parsed into memory)."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(STL_HEADER_BYTES + 4)
+    if len(head) == STL_HEADER_BYTES + 4:
+        n = int(np.frombuffer(head, "<u4", 1, STL_HEADER_BYTES)[0])
+        if size == STL_HEADER_BYTES + 4 + n * STL_DTYPE.itemsize:
+            if n == 0:
+                records = np.empty(0, STL_DTYPE)
+            else:
+                records = np.memmap(path, STL_DTYPE, mode="r", offset=STL_HEADER_BYTES + 4, shape=(n,))
+            return StlMesh(records, head[:STL_HEADER_BYTES], path)
+    if head.lstrip().startswith(b"solid"):
+        return _load_ascii_stl(path)
+    raise ValueError(f"{path}: not an STL file (size does not match the triangle count).")
+
+
+def _load_ascii_stl(path: str) -> StlMesh:
+    with open(path, "rb") as f:
+        text = f.read()
+    try:
+        verts = np.array(_ASCII_VERTEX.findall(text), dtype=np.float32)
+    except ValueError:
+        raise ValueError(f"{path}: malformed vertex in ASCII STL.")
+    if len(verts) % 3:
+        raise ValueError(f"{path}: ASCII STL vertex count is not a multiple of 3.")
+    records = np.zeros(len(verts) // 3, STL_DTYPE)
+    records["vertices"] = verts.reshape(-1, 3, 3)
+    tri = records["vertices"]
+    n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    norm = np.linalg.norm(n, axis=1, keepdims=True)
+    records["normal"] = np.divide(n, norm, out=np.zeros_like(n), where=norm > 0)
+    first_line = text.split(b"\n", 1)[0]
+    return StlMesh(records, first_line[5:].strip()[:STL_HEADER_BYTES], path)
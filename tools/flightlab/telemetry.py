@@ -0,0 +1,293 @@
+import csv
+import socket
+import threading
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# ----------------------------
+# Frame parsing
+# ----------------------------
+
+# (t_s or None, current_A); None means "stamp on arrival"
+Sample = Tuple[Optional[float], float]
+
+
+def parse_frame(payload) -> List[Sample]:
+    """Samples from one telemetry frame.
+
+    A frame holds one sample per line, either ``current`` or ``t,current``
+    (commas, semicolons or whitespace separate fields). Blank lines, ``#``
+    comments and non-numeric lines (e.g. headers) are skipped.
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        payload = payload.decode("ascii", errors="replace")
+    out: List[Sample] = []
+    for line in payload.splitlines():
+        fields = line.split("#", 1)[0].replace(";", ",").replace(",", " ").split()
+        if not fields:
+            continue
+        try:
+            values = [float(f) for f in fields[:2]]
+        except ValueError:
+            continue
+        out.append((None, values[0]) if len(values) == 1 else (values[0], values[1]))
+    return out
+
+
+def load_log(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(t_s, current_A) from a recorded CSV log.
+
+    The first two numeric columns are used, so the battery tool's own CSV
+    exports replay as-is. Header and malformed rows are skipped.
+    """
+    t, amps = [], []
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            try:
+                ti, ii = float(row[0]), float(row[1])
+            except ValueError:
+                continue
+            t.append(ti)
+            amps.append(ii)
+    if not t:
+        raise ValueError(f"No (time, current) rows found in {path}.")
+    t_s = np.asarray(t)
+    if np.any(np.diff(t_s) < 0):
+        raise ValueError(f"Timestamps in {path} are not increasing.")
+    return t_s, np.asarray(amps)
+
+
+# ----------------------------
+# Current sources
+# ----------------------------
+
+SOURCE_KINDS = ("replay", "udp", "serial")
+
+
+class CurrentSource:
+    """Producer of (t_s, current_A) samples for the coulomb integrator.
+
+    read() never blocks: it returns the samples that arrived since the last
+    call as an (n, 2) float array, at most max_samples of them. Sources
+    report a stream that has ended via `finished` and a failure via `error`.
+    """
+
+    name = "source"
+
+    def __init__(self):
+        self.finished = False
+        self.error: Optional[str] = None
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def read(self, max_samples: Optional[int] = None) -> np.ndarray:
+        raise NotImplementedError
+
+
+class ReplaySource(CurrentSource):
+    """Plays back a recorded log at `speed` x real time (0 = as fast as read).
+
+    Timestamps are rebased to the first sample (t = 0 there), so a log cut
+    from the middle of a flight does not integrate its offset as one long
+    first interval. Pacing is computed from the wall clock on each read(),
+    so no thread is needed and stop()/start() pause and resume the playback.
+    """
+
+    name = "replay"
+
+    def __init__(self, path: str, speed: float = 1.0):
+        super().__init__()
+        if speed < 0:
+            raise ValueError("Replay speed must be >= 0.")
+        t_s, self.current_A = load_log(path)
+        self.t_s = t_s - t_s[0]
+        self.speed = speed
+        self.pos = 0
+        self._wall0: Optional[float] = None
+        self._log0 = 0.0
+
+    def start(self):
+        # Rebase so the next sample is due now.
+        self._wall0 = time.perf_counter()
+        self._log0 = self.t_s[self.pos] if self.pos < len(self.t_s) else 0.0
+
+    def stop(self):
+        self._wall0 = None
+
+    def read(self, max_samples: Optional[int] = None) -> np.ndarray:
+        if self._wall0 is None or self.finished:
+            return np.empty((0, 2))
+        if self.speed > 0:
+            log_now = self._log0 + (time.perf_counter() - self._wall0) * self.speed
+            end = int(np.searchsorted(self.t_s, log_now, side="right"))
+        else:
+            end = len(self.t_s)
+        if max_samples is not None:
+            end = min(end, self.pos + max_samples)
+        out = np.column_stack((self.t_s[self.pos : end], self.current_A[self.pos : end]))
+        self.pos = end
+        if self.pos >= len(self.t_s):
+            self.finished = True
+        return out
+
+
+class ThreadedSource(CurrentSource):
+    """Base for live sources: a worker thread reads frames into a queue.
+
+    Subclasses implement _open(), _read_frame() (return bytes, or None on a
+    timeout; it should block for at most ~0.2 s) and _close(). Samples
+    without a timestamp are stamped with the arrival time; device
+    timestamps are rebased so the first one is 0.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._queue: deque = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._clock0: Optional[float] = None
+        self._device0: Optional[float] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self._clock0 is None:
+            self._clock0 = time.perf_counter()
+        self._open()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, name=f"{self.name}-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._close()
+
+    def read(self, max_samples: Optional[int] = None) -> np.ndarray:
+        n = len(self._queue)
+        if max_samples is not None:
+            n = min(n, max_samples)
+        q = self._queue
+        return np.array([q.popleft() for _ in range(n)], dtype=float).reshape(-1, 2)
+
+    def _worker(self):
+        try:
+            while not self._stop.is_set():
+                frame = self._read_frame()
+                if not frame:
+                    continue
+                arrival = time.perf_counter() - self._clock0
+                for t, amps in parse_frame(frame):
+                    if t is None:
+                        t = arrival
+                    else:
+                        if self._device0 is None:
+                            self._device0 = t
+                        t -= self._device0
+                    self._queue.append((t, amps))
+        except Exception as e:  # surfaced to the consumer, thread ends
+            self.error = f"{self.name}: {e}"
+            self.finished = True
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _read_frame(self) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class UdpSource(ThreadedSource):
+    """Telemetry frames as UDP datagrams on host:port."""
+
+    name = "udp"
+
+    def __init__(self, port: int, host: str = "0.0.0.0"):
+        super().__init__()
+        self.host = host
+        self.port = int(port)
+        self._sock: Optional[socket.socket] = None
+
+    def _open(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(0.2)
+        sock.bind((self.host, self.port))
+        self._sock = sock
+
+    def _read_frame(self) -> Optional[bytes]:
+        try:
+            return self._sock.recv(65535)
+        except socket.timeout:
+            return None
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class SerialSource(ThreadedSource):
+    """Line-oriented telemetry from a serial port (requires pyserial)."""
+
+    name = "serial"
+
+    def __init__(self, port: str, baudrate: int = 115200):
+        super().__init__()
+        self.port = port
+        self.baudrate = int(baudrate)
+        self._serial = None
+
+    def _open(self):
+        try:
+            import serial  # optional dependency
+        except ImportError:
+            raise ValueError("Serial telemetry requires pyserial (pip install pyserial).")
+        self._serial = serial.Serial(self.port, self.baudrate, timeout=0.2)
+
+    def _read_frame(self) -> Optional[bytes]:
+        return self._serial.readline() or None
+
+    def _close(self):
+        if self._serial is not None:
+            self._serial.close()
+            self._serial = None
+
+
+def open_source(kind: str, address: str, speed: float = 1.0) -> CurrentSource:
+    """Source from a UI/CLI spec.
+
+    replay: address is a log path. udp: ``port`` or ``host:port``.
+    serial: ``device`` or ``device:baud`` (e.g. ``/dev/ttyUSB0:115200``).
+    """
+    address = address.strip()
+    if not address:
+        raise ValueError(f"An address is required for the {kind} source.")
+    if kind == "replay":
+        return ReplaySource(address, speed)
+    if kind == "udp":
+        host, _, port = address.rpartition(":")
+        try:
+            return UdpSource(int(port), host or "0.0.0.0")
+        except ValueError:
+            raise ValueError(f"Invalid UDP address '{address}'. Use port or host:port.")
+    if kind == "serial":
+        device, sep, baud = address.rpartition(":")
+        if sep and baud.isdigit() and device:
+            return SerialSource(device, int(baud))
+        return SerialSource(address)
+    raise ValueError(f"Unknown telemetry source '{kind}'.")
+
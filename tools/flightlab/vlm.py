@@ -0,0 +1,299 @@
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from flightlab.cache import ResultCache, default_cache
+
+# ----------------------------
+# 3-D wing analysis: vortex lattice method
+# ----------------------------
+#
+# Horseshoe vortices on a chordwise x spanwise lattice over the whole wing
+# (both halves, so sideslip is allowed): bound leg on the panel quarter
+# chord, control point at three quarters, straight trailing legs to +x
+# infinity. The normal-wash condition is linear in the freestream vector,
+# so the influence matrix is solved once per geometry for the three unit
+# freestreams and any (alpha, beta) case is a weighted sum of the three
+# solutions. Solved lattices are kept in the content-addressed result
+# cache, keyed by the planform and lattice sizes.
+#
+# Strips use cosine spacing over the span (and up each winglet), with the
+# control points and the Trefftz-plane evaluation points at the cosine
+# midpoint of each strip. Placed that way, the loading and the induced
+# drag converge within a few strips and planar wings keep e <= 1, where
+# geometric midpoints overestimate e until the lattice is very fine.
+#
+# Axes: x aft, y right, z up; lengths in any one unit. Lift comes from
+# Kutta-Joukowski on the bound legs, induced drag from a Trefftz-plane
+# analysis of the trailing legs (wake along x, so drag at large sideslip is
+# approximate). The reference area and span are the projected main wing,
+# without winglets, so a winglet shows up as Oswald efficiency above 1.
+
+
+class Planform:
+    """Straight-tapered wing with optional winglets.
+
+    span is tip to tip (projected), sweep_deg is the quarter-chord sweep,
+    twist_deg the tip incidence relative to the root (negative is
+    washout) and alpha0_deg the section's zero-lift angle (camber, e.g.
+    from the panel method) applied as an incidence offset. Winglets rise
+    winglet_height along the tip at winglet_cant_deg from horizontal
+    (90 is vertical), with winglet_taper relative to the tip chord.
+    """
+
+    def __init__(
+        self,
+        span: float,
+        root_chord: float,
+        taper: float = 1.0,
+        sweep_deg: float = 0.0,
+        dihedral_deg: float = 0.0,
+        twist_deg: float = 0.0,
+        incidence_deg: float = 0.0,
+        alpha0_deg: float = 0.0,
+        winglet_height: float = 0.0,
+        winglet_cant_deg: float = 90.0,
+        winglet_taper: float = 1.0,
+        winglet_sweep_deg: float = 0.0,
+    ):
+        if span <= 0 or root_chord <= 0:
+            raise ValueError("Span and root chord must be > 0.")
+        if not 0 < taper <= 1.5 or not 0 < winglet_taper <= 1.5:
+            raise ValueError("Taper ratios must be in (0, 1.5].")
+        if winglet_height < 0:
+            raise ValueError("Winglet height must be >= 0.")
+        for name, value in (("Sweep", sweep_deg), ("Dihedral", dihedral_deg), ("Winglet sweep", winglet_sweep_deg)):
+            if abs(value) >= 80:
+                raise ValueError(f"{name} must be within +/-80 deg.")
+        self.span = float(span)
+        self.root_chord = float(root_chord)
+        self.taper = float(taper)
+        self.sweep_deg = float(sweep_deg)
+        self.dihedral_deg = float(dihedral_deg)
+        self.twist_deg = float(twist_deg)
+        self.incidence_deg = float(incidence_deg)
+        self.alpha0_deg = float(alpha0_deg)
+        self.winglet_height = float(winglet_height)
+        self.winglet_cant_deg = float(winglet_cant_deg)
+        self.winglet_taper = float(winglet_taper)
+        self.winglet_sweep_deg = float(winglet_sweep_deg)
+
+    def key(self) -> tuple:
+        return tuple(vars(self).values())
+
+    @property
+    def reference_area(self) -> float:
+        return 0.5 * self.span * self.root_chord * (1.0 + self.taper)
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self.span ** 2 / self.reference_area
+
+    @property
+    def mean_aerodynamic_chord(self) -> float:
+        t = self.taper
+        return 2.0 / 3.0 * self.root_chord * (1.0 + t + t * t) / (1.0 + t)
+
+
+def _stations(p: Planform, n_span: int, n_winglet: int):
+    """Right-half stations root -> tip (-> winglet top): leading edges, chord vectors and,
+    per strip, where its control point sits as a fraction of the strip width."""
+    half = p.span / 2.0
+    phi = 0.5 * np.pi * np.arange(n_span + 1) / n_span
+    eta = np.sin(phi)  # clustered at the tip: cosine spacing over the whole span
+    eta_mid = np.sin(0.5 * (phi[:-1] + phi[1:]))
+    frac = (eta_mid - eta[:-1]) / np.diff(eta)
+    y = eta * half
+    chord = p.root_chord * (1.0 - (1.0 - p.taper) * eta)
+    z = y * np.tan(np.radians(p.dihedral_deg))
+    x_le = 0.25 * p.root_chord + y * np.tan(np.radians(p.sweep_deg)) - 0.25 * chord
+    theta = np.radians(p.incidence_deg + p.twist_deg * eta - p.alpha0_deg)
+    g = np.radians(p.dihedral_deg)
+    up = np.array([0.0, -np.sin(g), np.cos(g)])  # section normal, rotated by the dihedral
+    le = np.column_stack([x_le, y, z])
+    cvec = chord[:, None] * (np.cos(theta)[:, None] * [1.0, 0.0, 0.0] - np.sin(theta)[:, None] * up)
+    if p.winglet_height > 0 and n_winglet > 0:
+        psi = 0.5 * np.pi * np.arange(n_winglet + 1) / n_winglet
+        s_all = 1.0 - np.cos(psi)
+        s_mid = 1.0 - np.cos(0.5 * (psi[:-1] + psi[1:]))
+        frac = np.r_[frac, (s_mid - s_all[:-1]) / np.diff(s_all)]
+        s = p.winglet_height * s_all[1:]
+        cant = np.radians(p.winglet_cant_deg)
+        c_tip = chord[-1]
+        cw = c_tip * (1.0 - (1.0 - p.winglet_taper) * s / p.winglet_height)
+        wle = le[-1] + np.column_stack([
+            s * np.tan(np.radians(p.winglet_sweep_deg)) + 0.25 * (c_tip - cw), s * np.cos(cant), s * np.sin(cant),
+        ])
+        le = np.vstack([le, wle])
+        cvec = np.vstack([cvec, cw[:, None] * [1.0, 0.0, 0.0]])
+    return le, cvec, frac
+
+
+def _segment(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Velocity at p from unit-strength filaments a -> b (broadcast over leading axes)."""
+    r1, r2 = p - a, p - b
+    cross = np.cross(r1, r2)
+    c2 = np.einsum("...i,...i", cross, cross)
+    n1, n2 = np.linalg.norm(r1, axis=-1), np.linalg.norm(r2, axis=-1)
+    r0 = b - a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.einsum("...i,...i", r0, r1 / n1[..., None] - r2 / n2[..., None]) / (4.0 * np.pi * c2)
+    k = np.where(c2 > 1e-12 * np.einsum("...i,...i", r0, r0) ** 2, k, 0.0)
+    return cross * k[..., None]
+
+
+def _trailing(p: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """Velocity at p from unit-strength semi-infinite filaments a -> +x infinity."""
+    r = p - a
+    d2 = r[..., 1] ** 2 + r[..., 2] ** 2
+    n = np.linalg.norm(r, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = (1.0 + r[..., 0] / n) / (4.0 * np.pi * d2)
+    k = np.where(d2 > 1e-12, k, 0.0)
+    return np.stack([np.zeros_like(k), -r[..., 2] * k, r[..., 1] * k], axis=-1)
+
+
+def _trefftz(p: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """(y, z) velocity at p from unit 2-D vortices at a, axis +x (the far wake)."""
+    r = p - a
+    d2 = r[..., 0] ** 2 + r[..., 1] ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(d2 > 1e-12, 1.0 / (2.0 * np.pi * d2), 0.0)
+    return np.stack([-r[..., 1] * k, r[..., 0] * k], axis=-1)
+
+
+def _lattice(planform_key: tuple, n_span: int, n_chord: int, n_winglet: int) -> Dict[str, np.ndarray]:
+    p = Planform(*planform_key)
+    le, cvec, frac = _stations(p, n_span, n_winglet)
+    # Whole wing, left tip to right tip, so every bound leg runs left to right.
+    mirror = np.array([1.0, -1.0, 1.0])
+    le = np.vstack([le[:0:-1] * mirror, le])
+    cvec = np.vstack([cvec[:0:-1] * mirror, cvec])
+    frac = np.r_[1.0 - frac[::-1], frac]
+    n_strips = len(le) - 1
+    f = np.arange(n_chord + 1) / n_chord
+    grid = le[:, None, :] + f[None, :, None] * cvec[:, None, :]  # (station, chordwise, 3)
+    p00, p01 = grid[:-1, :-1], grid[:-1, 1:]  # left edge: panel leading / trailing corner
+    p10, p11 = grid[1:, :-1], grid[1:, 1:]
+    a = (p00 + 0.25 * (p01 - p00)).reshape(-1, 3)
+    b = (p10 + 0.25 * (p11 - p10)).reshape(-1, 3)
+    s = frac[:, None, None]
+    cp = (p00 + s * (p10 - p00) + 0.75 * ((1.0 - s) * (p01 - p00) + s * (p11 - p10))).reshape(-1, 3)
+    normal = np.cross(p11 - p00, p10 - p01).reshape(-1, 3)
+    normal /= np.linalg.norm(normal, axis=1)[:, None]
+
+    P = cp[:, None, :]
+    v = _segment(P, a[None], b[None]) + _trailing(P, b[None]) - _trailing(P, a[None])
+    aic = np.einsum("ijk,ik->ij", v, normal)
+    basis = np.linalg.solve(aic, -normal)  # (panel, 3): circulation per unit freestream along x, y, z
+
+    # Trefftz plane: normal wash at each strip's control point from every panel's leg pair.
+    strip = np.repeat(np.arange(n_strips), n_chord)
+    ends = grid[:, -1, 1:]  # trailing-edge (y, z) per station
+    mid = ends[:-1] + frac[:, None] * (ends[1:] - ends[:-1])
+    seg = ends[1:] - ends[:-1]
+    length = np.linalg.norm(seg, axis=1)
+    n_yz = np.column_stack([-seg[:, 1], seg[:, 0]]) / length[:, None]
+    w = _trefftz(mid[:, None, :], b[None, :, 1:]) - _trefftz(mid[:, None, :], a[None, :, 1:])
+    trefftz = np.einsum("ijk,ik->ij", w, n_yz)  # (strip, panel)
+
+    n_tip = n_strips // 2 - n_span  # winglet strips per side
+    winglet = np.r_[np.ones(n_tip, bool), np.zeros(2 * n_span, bool), np.ones(n_tip, bool)]
+    chord = 0.5 * (np.linalg.norm(cvec[:-1], axis=1) + np.linalg.norm(cvec[1:], axis=1))
+    return {
+        "a": a, "b": b, "normal": normal, "basis": basis, "trefftz": trefftz,
+        "strip": strip, "strip_mid": mid, "strip_length": length, "strip_chord": chord, "winglet": winglet,
+    }
+
+
+class WingLoads:
+    """Results per (alpha, beta) case: CL, induced drag CDi, Oswald
+    efficiency e, side force CY, rolling moment C_roll (right wing down
+    positive) and the span loading per strip (case x strip).
+    """
+
+    def __init__(self, alpha_deg, beta_deg, cl, cdi, cy, croll, ccl, lattice, planform: Planform):
+        self.alpha_deg = alpha_deg
+        self.beta_deg = beta_deg
+        self.cl = cl
+        self.cdi = cdi
+        self.cy = cy
+        self.croll = croll
+        self.ccl = ccl  # local chord x section lift coefficient, in length units
+        self.strip_y = lattice["strip_mid"][:, 0]
+        self.strip_z = lattice["strip_mid"][:, 1]
+        self.strip_chord = lattice["strip_chord"]
+        self.winglet = lattice["winglet"]
+        self.aspect_ratio = planform.aspect_ratio
+
+    def __len__(self) -> int:
+        return len(self.alpha_deg)
+
+    @property
+    def oswald(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.cdi > 0, self.cl ** 2 / (np.pi * self.aspect_ratio * self.cdi), np.nan)
+
+    @property
+    def cl_local(self) -> np.ndarray:
+        return self.ccl / self.strip_chord
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {
+            "alpha_deg": self.alpha_deg, "beta_deg": self.beta_deg, "cl": self.cl, "cdi": self.cdi,
+            "oswald": self.oswald, "cy": self.cy, "croll": self.croll,
+        }
+
+    def loading_columns(self) -> Dict[str, np.ndarray]:
+        """Long-form span loading: one row per case and strip."""
+        k, s = self.ccl.shape
+        return {
+            "alpha_deg": np.repeat(self.alpha_deg, s), "beta_deg": np.repeat(self.beta_deg, s),
+            "y": np.tile(self.strip_y, k), "z": np.tile(self.strip_z, k), "chord": np.tile(self.strip_chord, k),
+            "ccl": self.ccl.reshape(-1), "cl_local": self.cl_local.reshape(-1),
+            "winglet": np.tile(self.winglet, k),
+        }
+
+
+WING_COLUMNS = ("alpha_deg", "beta_deg", "cl", "cdi", "oswald", "cy", "croll")
+LOADING_COLUMNS = ("alpha_deg", "beta_deg", "y", "z", "chord", "ccl", "cl_local", "winglet")
+
+
+class VortexLattice:
+    """A planform's lattice, with its influence matrix solved once (and cached)."""
+
+    def __init__(self, planform: Planform, n_span: int = 32, n_chord: int = 4, n_winglet: int = 8,
+                 cache: Optional[ResultCache] = None):
+        if n_span < 2 or n_chord < 1 or n_winglet < 0:
+            raise ValueError("Use n_span >= 2, n_chord >= 1 and n_winglet >= 0.")
+        self.planform = planform
+        self.lattice = (cache or default_cache()).call(_lattice, planform.key(), n_span, n_chord, n_winglet)
+
+    def __len__(self) -> int:
+        return len(self.lattice["a"])
+
+    def solve(self, alpha_deg: ArrayLike, beta_deg: ArrayLike = 0.0) -> WingLoads:
+        """All cases in one go; alpha and beta broadcast against each other."""
+        alpha, beta = np.broadcast_arrays(np.atleast_1d(np.asarray(alpha_deg, dtype=np.float64)),
+                                          np.atleast_1d(np.asarray(beta_deg, dtype=np.float64)))
+        a, bt = np.radians(alpha), np.radians(beta)
+        v_inf = np.column_stack([np.cos(a) * np.cos(bt), -np.sin(bt), np.sin(a) * np.cos(bt)])  # (k, 3)
+        lat = self.lattice
+        gamma = lat["basis"] @ v_inf.T  # (panel, k)
+        bound = lat["b"] - lat["a"]
+        mid = 0.5 * (lat["a"] + lat["b"])
+        # Kutta-Joukowski with rho = 1, |V| = 1, q = 1/2.
+        force = np.cross(v_inf, gamma.T @ bound)  # (k, 3)
+        moment = np.einsum("pk,kpj->kj", gamma, np.cross(mid[None], np.cross(v_inf[:, None, :], bound[None])))
+        s = self.planform.reference_area
+        lift_dir = np.column_stack([-np.sin(a), np.zeros_like(a), np.cos(a)])
+        cl = 2.0 * np.einsum("kj,kj->k", force, lift_dir) / s
+        cy = 2.0 * force[:, 1] / s
+        croll = -2.0 * moment[:, 0] / (s * self.planform.span)
+        n_strips = len(lat["strip_length"])
+        strip_gamma = np.zeros((n_strips, len(a)))
+        np.add.at(strip_gamma, lat["strip"], gamma)
+        wash = lat["trefftz"] @ gamma  # (strip, k)
+        cdi = -np.einsum("sk,sk,s->k", strip_gamma, wash, lat["strip_length"]) / s
+        return WingLoads(alpha, beta, cl, cdi, cy, croll, 2.0 * strip_gamma.T, lat, self.planform)
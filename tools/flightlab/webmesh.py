@@ -0,0 +1,344 @@
+import json
+import os
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from flightlab.stl import load_stl
+
+# ----------------------------
+# STL -> indexed, quantized glTF (glb) with levels of detail
+# ----------------------------
+#
+# STL is a triangle soup: every vertex is stored once per triangle, with a
+# per-face normal. For the web viewer the vertices are welded on a
+# quantization grid, positions are written as uint16 (KHR_mesh_quantization,
+# the node transform maps them back to model units) and triangles as
+# indices. Coarser levels come from quadric-error edge collapses, done in
+# vectorized rounds of independent (vertex-disjoint) collapses.
+
+DEFAULT_BITS = 14  # position grid per axis; 1/16384 of the part size
+DEFAULT_LOD_RATIOS = (1.0, 0.25, 0.05)  # fractions of the welded triangle count
+
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+_UINT8, _INT8, _UINT16, _UINT32 = 5121, 5120, 5123, 5125
+_ARRAY_BUFFER, _ELEMENT_ARRAY_BUFFER = 34962, 34963
+
+_BOUNDARY_WEIGHT = 1000.0  # keeps open edges from eroding
+_MAX_FLIP_PASSES = 4
+
+
+def weld_vertices(triangles: np.ndarray, bits: int = DEFAULT_BITS) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge vertices that share a cell of a 2^bits grid over the bounding box.
+
+    Returns (positions (v, 3) float64, faces (f, 3) int64); triangles that
+    collapse to a line or point on the grid are dropped.
+    """
+    if not 1 <= bits <= 20:
+        raise ValueError("Quantization bits must be between 1 and 20.")
+    v = np.asarray(triangles, dtype=np.float64).reshape(-1, 3)
+    if not len(v):
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    lo, hi = v.min(axis=0), v.max(axis=0)
+    step = np.where(hi > lo, (hi - lo) / (2 ** bits - 1), 1.0)
+    q = np.rint((v - lo) / step).astype(np.int64)
+    key = (q[:, 0] << (2 * bits)) | (q[:, 1] << bits) | q[:, 2]
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    faces = inverse.reshape(-1, 3)
+    ok = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+    return v[first], faces[ok]
+
+
+def _compact(positions: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    used, faces = np.unique(faces, return_inverse=True)
+    return positions[used], faces.reshape(-1, 3)
+
+
+def _unique_faces(faces: np.ndarray) -> np.ndarray:
+    """Drop degenerate faces and repeated copies of the same vertex triple."""
+    ok = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+    faces = faces[ok]
+    _, first = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    return faces[np.sort(first)]
+
+
+def _edges(faces: np.ndarray, n_vertices: int):
+    """Unique undirected edges (i < j), and how many faces use each."""
+    e = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    e.sort(axis=1)
+    key, counts = np.unique(e[:, 0] * n_vertices + e[:, 1], return_counts=True)
+    return np.stack([key // n_vertices, key % n_vertices], axis=1), counts
+
+
+def _quadrics(positions: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted plane quadrics summed per vertex, plus boundary planes: (v, 4, 4)."""
+    nv = len(positions)
+    v0, v1, v2 = positions[faces[:, 0]], positions[faces[:, 1]], positions[faces[:, 2]]
+    n = np.cross(v1 - v0, v2 - v0)
+    area2 = np.linalg.norm(n, axis=1)
+    n = n / np.where(area2 > 0, area2, 1.0)[:, None]
+    planes = np.column_stack([n, -np.einsum("ij,ij->i", n, v0)])
+    k = planes[:, :, None] * planes[:, None, :] * (0.5 * area2)[:, None, None]
+    q = np.zeros((nv, 16))
+    flat = k.reshape(-1, 16)
+    for corner in range(3):
+        for c in range(16):
+            q[:, c] += np.bincount(faces[:, corner], flat[:, c], minlength=nv)
+
+    # Open edges: a plane through the edge, perpendicular to its face.
+    e = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    face_of = np.tile(np.arange(len(faces)), 3)
+    key = np.minimum(e[:, 0], e[:, 1]) * nv + np.maximum(e[:, 0], e[:, 1])
+    _, inv, counts = np.unique(key, return_inverse=True, return_counts=True)
+    open_ = counts[inv] == 1
+    if open_.any():
+        a, b = positions[e[open_, 0]], positions[e[open_, 1]]
+        d = b - a
+        length = np.linalg.norm(d, axis=1)
+        m = np.cross(d, n[face_of[open_]])
+        m = m / np.maximum(np.linalg.norm(m, axis=1), 1e-300)[:, None]
+        bp = np.column_stack([m, -np.einsum("ij,ij->i", m, a)])
+        bk = (bp[:, :, None] * bp[:, None, :] * (_BOUNDARY_WEIGHT * length ** 2)[:, None, None]).reshape(-1, 16)
+        for ends in (e[open_, 0], e[open_, 1]):
+            for c in range(16):
+                q[:, c] += np.bincount(ends, bk[:, c], minlength=nv)
+    return q.reshape(nv, 4, 4)
+
+
+def _quadric_error(q: np.ndarray, p: np.ndarray) -> np.ndarray:
+    h = np.column_stack([p, np.ones(len(p))])
+    return np.einsum("ni,nij,nj->n", h, q, h)
+
+
+def decimate(positions: np.ndarray, faces: np.ndarray, target_faces: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Quadric-error edge-collapse simplification down to about target_faces.
+
+    Each round ranks every edge by the error of its best end point or
+    midpoint, then collapses the cheapest edges that are the cheapest at
+    both of their vertices (so collapses in a round never share a vertex).
+    Collapses that would flip a neighbouring face are rejected.
+    """
+    positions = np.array(positions, dtype=np.float64)
+    faces = _unique_faces(np.asarray(faces, dtype=np.int64))
+    q = _quadrics(positions, faces)
+    nv = len(positions)
+    blocked = np.empty(0, dtype=np.int64)  # edge keys whose collapse flipped a face
+    while len(faces) > target_faces:
+        edges, _ = _edges(faces, nv)
+        i, j = edges[:, 0], edges[:, 1]
+        qe = q[i] + q[j]
+        cands = (positions[i], positions[j], 0.5 * (positions[i] + positions[j]))
+        errs = np.stack([_quadric_error(qe, c) for c in cands])
+        pick = np.argmin(errs, axis=0)
+        target = np.choose(pick[:, None], cands)
+        cost = errs[pick, np.arange(len(edges))]
+        key = i * nv + j
+        open_ = ~np.isin(key, blocked, assume_unique=True)
+
+        # Local minima: edges cheaper than every other edge at both ends.
+        order = np.flatnonzero(open_)[np.argsort(cost[open_], kind="stable")]
+        rank = np.full(len(edges), len(edges))
+        rank[order] = np.arange(len(order))
+        best = np.full(nv, len(edges))
+        np.minimum.at(best, i, rank)
+        np.minimum.at(best, j, rank)
+        accept = open_ & (best[i] == rank) & (best[j] == rank)
+        # Each collapse removes about two faces; don't overshoot the target.
+        chosen = np.flatnonzero(accept)
+        keep = (len(faces) - target_faces) // 2 + 1
+        if len(chosen) > keep:
+            accept[chosen[np.argsort(rank[chosen])[keep:]]] = False
+
+        for _ in range(_MAX_FLIP_PASSES):
+            a, b = i[accept], j[accept]
+            remap = np.arange(nv)
+            remap[b] = a
+            moved = positions.copy()
+            moved[a] = target[accept]
+            new_faces = remap[faces]
+            ok = (new_faces[:, 0] != new_faces[:, 1]) & (new_faces[:, 1] != new_faces[:, 2]) & (new_faces[:, 2] != new_faces[:, 0])
+            touched = np.zeros(nv, dtype=bool)
+            touched[a] = True
+            check = ok & touched[new_faces].any(axis=1)
+            f_old, f_new = faces[check], new_faces[check]
+            n_old = np.cross(positions[f_old[:, 1]] - positions[f_old[:, 0]], positions[f_old[:, 2]] - positions[f_old[:, 0]])
+            n_new = np.cross(moved[f_new[:, 1]] - moved[f_new[:, 0]], moved[f_new[:, 2]] - moved[f_new[:, 0]])
+            flipped = np.einsum("ij,ij->i", n_old, n_new) <= 0.0
+            if not flipped.any():
+                break
+            bad = np.zeros(nv, dtype=bool)
+            bad[f_new[flipped].ravel()] = True
+            reject = accept & bad[i]
+            blocked = np.union1d(blocked, key[reject])
+            accept &= ~reject
+        else:
+            accept[:] = False
+        if not accept.any():
+            if not open_.any() or np.all(np.isin(key, blocked)):
+                break
+            continue
+
+        a, b = i[accept], j[accept]
+        positions[a] = target[accept]
+        q[a] += q[b]
+        remap = np.arange(nv)
+        remap[b] = a
+        faces = _unique_faces(remap[faces])
+    return _compact(positions, faces)
+
+
+def vertex_normals(positions: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted smooth vertex normals (unit length; zero for isolated vertices)."""
+    v0, v1, v2 = positions[faces[:, 0]], positions[faces[:, 1]], positions[faces[:, 2]]
+    fn = np.cross(v1 - v0, v2 - v0)
+    n = np.zeros_like(positions)
+    for corner in range(3):
+        for c in range(3):
+            n[:, c] += np.bincount(faces[:, corner], fn[:, c], minlength=len(positions))
+    length = np.linalg.norm(n, axis=1, keepdims=True)
+    return np.divide(n, length, out=np.zeros_like(n), where=length > 0)
+
+
+def _pad4(data: bytes, fill: bytes = b"\0") -> bytes:
+    return data + fill * (-len(data) % 4)
+
+
+def glb_bytes(
+    positions: np.ndarray,
+    faces: np.ndarray,
+    smooth_normals: bool = False,
+    bits: int = DEFAULT_BITS,
+    name: str = "",
+) -> bytes:
+    """One mesh as binary glTF with uint16 positions and uint16/uint32 indices.
+
+    Positions are stored as integers on a 2^bits grid (4-byte aligned, so
+    8 bytes per vertex) and the node's scale/translation restores model
+    units. Without normals, viewers shade flat, like the STL's face normals;
+    smooth_normals adds int8 vertex normals (4 bytes per vertex).
+    """
+    if not 1 <= bits <= 16:
+        raise ValueError("Position bits must be between 1 and 16.")
+    positions = np.asarray(positions, dtype=np.float64)
+    faces = np.asarray(faces)
+    if not len(faces):
+        raise ValueError("Mesh has no triangles.")
+    lo, hi = positions.min(axis=0), positions.max(axis=0)
+    qmax = 2 ** bits - 1
+    scale = np.where(hi > lo, (hi - lo) / qmax, 1.0)
+    qpos = np.zeros((len(positions), 4), dtype="<u2")
+    qpos[:, :3] = np.rint((positions - lo) / scale)
+
+    views: List[Dict[str, object]] = []
+    accessors: List[Dict[str, object]] = []
+    blobs: List[bytes] = []
+    offset = 0
+
+    def add(data: bytes, view: Dict[str, object], accessor: Dict[str, object]) -> int:
+        nonlocal offset
+        views.append(dict(buffer=0, byteOffset=offset, byteLength=len(data), **view))
+        accessors.append(dict(bufferView=len(views) - 1, **accessor))
+        blobs.append(_pad4(data))
+        offset += len(blobs[-1])
+        return len(accessors) - 1
+
+    attributes = {
+        "POSITION": add(
+            qpos.tobytes(),
+            {"byteStride": 8, "target": _ARRAY_BUFFER},
+            {
+                "componentType": _UINT16, "count": len(qpos), "type": "VEC3",
+                "min": qpos[:, :3].min(axis=0).tolist(), "max": qpos[:, :3].max(axis=0).tolist(),
+            },
+        )
+    }
+    if smooth_normals:
+        qn = np.zeros((len(positions), 4), dtype="i1")
+        qn[:, :3] = np.rint(vertex_normals(positions, faces) * 127.0)
+        attributes["NORMAL"] = add(
+            qn.tobytes(),
+            {"byteStride": 4, "target": _ARRAY_BUFFER},
+            {"componentType": _INT8, "normalized": True, "count": len(qn), "type": "VEC3"},
+        )
+    index_type = "<u2" if len(positions) <= 0xFFFF else "<u4"
+    indices = add(
+        faces.astype(index_type).tobytes(),
+        {"target": _ELEMENT_ARRAY_BUFFER},
+        {"componentType": _UINT16 if index_type == "<u2" else _UINT32, "count": faces.size, "type": "SCALAR"},
+    )
+
+    gltf = {
+        "asset": {"version": "2.0", "generator": "flightlab webmesh"},
+        "extensionsUsed": ["KHR_mesh_quantization"],
+        "extensionsRequired": ["KHR_mesh_quantization"],
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "translation": lo.tolist(), "scale": scale.tolist()}],
+        "meshes": [{"name": name, "primitives": [{"attributes": attributes, "indices": indices, "mode": 4}]}],
+        "buffers": [{"byteLength": offset}],
+        "bufferViews": views,
+        "accessors": accessors,
+    }
+    json_chunk = _pad4(json.dumps(gltf, separators=(",", ":")).encode("utf-8"), b" ")
+    bin_chunk = b"".join(blobs)
+    total = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    return b"".join([
+        struct.pack("<III", _GLB_MAGIC, 2, total),
+        struct.pack("<II", len(json_chunk), _CHUNK_JSON), json_chunk,
+        struct.pack("<II", len(bin_chunk), _CHUNK_BIN), bin_chunk,
+    ])
+
+
+def build_web_mesh(
+    stl_path: str,
+    out_dir: Optional[str] = None,
+    ratios: Sequence[float] = DEFAULT_LOD_RATIOS,
+    bits: int = DEFAULT_BITS,
+    smooth_normals: bool = False,
+    name: Optional[str] = None,
+) -> Dict[str, object]:
+    """Write <name>.lod<k>.glb per ratio plus <name>.lods.json, coarsest first.
+
+    Levels are simplified from one another, finest to coarsest, so each is
+    a simplification of the next. Returns the manifest (also written), whose
+    "lods" list is ordered coarse to fine with URLs relative to it.
+    """
+    ratios = sorted({float(r) for r in ratios}, reverse=True)
+    if not ratios or ratios[-1] <= 0.0 or ratios[0] > 1.0:
+        raise ValueError("LOD ratios must be in (0, 1].")
+    out_dir = out_dir or os.path.dirname(os.path.abspath(stl_path))
+    name = name or os.path.splitext(os.path.basename(stl_path))[0]
+    mesh = load_stl(stl_path)
+    if not len(mesh):
+        raise ValueError(f"{stl_path}: mesh has no triangles.")
+    positions, faces = weld_vertices(mesh.triangles, bits)
+    positions, faces = _compact(positions, _unique_faces(faces))
+    welded = len(faces)
+
+    os.makedirs(out_dir, exist_ok=True)
+    lods = []
+    for level, ratio in enumerate(ratios):
+        if ratio < 1.0:
+            positions, faces = decimate(positions, faces, max(4, int(round(welded * ratio))))
+        url = f"{name}.lod{level}.glb"
+        data = glb_bytes(positions, faces, smooth_normals, min(bits, 16), name)
+        with open(os.path.join(out_dir, url), "wb") as f:
+            f.write(data)
+        lods.append({
+            "url": url, "ratio": ratio, "triangles": int(len(faces)), "vertices": int(len(positions)), "bytes": len(data),
+        })
+    lo, hi = mesh.bounding_box()
+    manifest = {
+        "source": os.path.basename(stl_path),
+        "source_triangles": len(mesh),
+        "source_bytes": os.path.getsize(stl_path),
+        "bbox_min": lo.tolist(),
+        "bbox_max": hi.tolist(),
+        "lods": lods[::-1],
+    }
+    with open(os.path.join(out_dir, f"{name}.lods.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
@@ -0,0 +1,155 @@
+"""Chunked result writers (CSV, JSON Lines, Parquet).
+
+Each writer takes column chunks (a mapping of column name -> 1-D array) and
+appends them to the output, so large sweeps can be written without holding
+the full result set in memory. Values are written at full precision.
+"""
+
+import csv
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from flightlab.formats import FORMATS, infer_format
+
+
+def _column_lists(chunk: Mapping[str, np.ndarray], columns: Sequence[str]):
+    # tolist() converts to Python scalars in C; repr() of a float is the
+    # shortest string that round-trips, so nothing is lost in the text formats.
+    return [np.asarray(chunk[c]).tolist() for c in columns]
+
+
+class ChunkWriter:
+    binary = False
+
+    def __init__(self, target, columns: Sequence[str]):
+        self.columns = list(columns)
+        self.rows_written = 0
+        if target is None or target == "-":
+            self._fh = sys.stdout.buffer if self.binary else sys.stdout
+            self._owns = False
+        elif isinstance(target, (str, os.PathLike)):
+            if self.binary:
+                self._fh = open(target, "wb")
+            else:
+                self._fh = open(target, "w", encoding="utf-8", newline="")
+            self._owns = True
+        else:
+            self._fh = target
+            self._owns = False
+
+    def write(self, chunk: Mapping[str, np.ndarray]) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        if self._owns:
+            self._fh.close()
+        else:
+            self._fh.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvChunkWriter(ChunkWriter):
+    def __init__(self, target, columns: Sequence[str]):
+        super().__init__(target, columns)
+        self._writer = csv.writer(self._fh, lineterminator="\n")
+        self._writer.writerow(self.columns)
+
+    def write(self, chunk: Mapping[str, np.ndarray]) -> int:
+        return self.write_columns([chunk[c] for c in self.columns])
+
+    def write_columns(self, columns: Sequence[np.ndarray]) -> int:
+        """Like write(), with columns given positionally (headers may repeat)."""
+        cols = [np.asarray(c).tolist() for c in columns]
+        n = len(cols[0]) if cols else 0
+        self._writer.writerows(zip(*cols))
+        self.rows_written += n
+        return n
+
+
+class JsonLinesChunkWriter(ChunkWriter):
+    def write(self, chunk: Mapping[str, np.ndarray]) -> int:
+        cols = _column_lists(chunk, self.columns)
+        n = len(cols[0]) if cols else 0
+        names = self.columns
+        dumps = json.dumps
+        self._fh.writelines(dumps(dict(zip(names, row))) + "\n" for row in zip(*cols))
+        self.rows_written += n
+        return n
+
+
+class ParquetChunkWriter(ChunkWriter):
+    binary = True
+
+    def __init__(self, target, columns: Sequence[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquet output requires pyarrow (pip install pyarrow).")
+        if target is None or target == "-":
+            raise ValueError("Parquet output needs a file path, not stdout.")
+        super().__init__(target, columns)
+        self._pa = pa
+        self._pq = pq
+        self._writer = None
+
+    def write(self, chunk: Mapping[str, np.ndarray]) -> int:
+        pa = self._pa
+        table = pa.table({c: np.asarray(chunk[c]) for c in self.columns})
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._fh, table.schema)
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+        return table.num_rows
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        super().close()
+
+
+_WRITERS: Dict[str, type] = {
+    "csv": CsvChunkWriter,
+    "jsonl": JsonLinesChunkWriter,
+    "parquet": ParquetChunkWriter,
+}
+
+
+def open_writer(fmt: str, target, columns: Sequence[str]) -> ChunkWriter:
+    try:
+        cls = _WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown output format '{fmt}'. Use one of: {', '.join(FORMATS)}.")
+    return cls(target, columns)
+
+
+def write_csv(
+    target,
+    headers: Sequence[str],
+    chunks: Iterable[Sequence[np.ndarray]],
+    total_rows: Optional[int] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> int:
+    """Stream column chunks (one sequence of column arrays per chunk) to CSV.
+
+    progress(rows_written, total_rows) is called after every chunk; writing
+    stops early once cancelled() returns True. Returns rows written.
+    """
+    with CsvChunkWriter(target, headers) as writer:
+        for cols in chunks:
+            if cancelled is not None and cancelled():
+                break
+            writer.write_columns(cols)
+            if progress is not None:
+                progress(writer.rows_written, total_rows)
+        return writer.rows_written
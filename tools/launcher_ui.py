@@ -0,0 +1,112 @@
+import sys
+import time
+
+_IMPORT_T0 = time.perf_counter()  # for --startup-time
+
+from importlib import import_module
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ui_common import StartupProbe, apply_dark_theme
+
+# ----------------------------
+# Tools hosted as tabs
+# ----------------------------
+
+# (tab label, module, main window class); modules are imported on first open
+TOOLS = [
+    ("Motor & ESC", "calculate_params_ui", "MotorEscCalculator"),
+    ("Power System", "calculate_power_system_ui", "PlanePowerCalculator"),
+    ("Flight Time", "flight_time_ui", "FlightTimeEstimator"),
+    ("Battery Monitor", "flight_measure_ui", "BatterySimWindow"),
+]
+
+
+# ----------------------------
+# Main window
+# ----------------------------
+
+class FlightLabLauncher(QMainWindow):
+    """All tools in one process: one QApplication, theme and thread pool.
+
+    Each tab starts as an empty host widget; the tool's module is imported
+    and its window built (embedded as a child widget, menus included) the
+    first time the tab is shown.
+    """
+
+    def __init__(self, initial: int = 0):
+        super().__init__()
+        self.setWindowTitle("FlightLab")
+        self.resize(1020, 620)
+        apply_dark_theme()
+
+        self.tabs = QTabWidget()
+        self.tabs.setDocumentMode(True)
+        self.tools = [None] * len(TOOLS)
+        for label, _, _ in TOOLS:
+            host = QWidget()
+            layout = QVBoxLayout(host)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(host, label)
+        self.setCentralWidget(self.tabs)
+
+        self.tabs.setCurrentIndex(initial)
+        self.tabs.currentChanged.connect(self._ensure_tool)
+        self._ensure_tool(initial)
+
+    def _ensure_tool(self, index: int) -> QMainWindow:
+        tool = self.tools[index]
+        if tool is None:
+            label, module, cls = TOOLS[index]
+            tool = getattr(import_module(module), cls)()
+            tool.setWindowFlags(Qt.WindowType.Widget)
+            # A tool's File > Quit closes its own window, which embedded only hides it.
+            for action in tool.findChildren(QAction):
+                if action.text() == "Quit":
+                    action.triggered.disconnect()
+                    action.triggered.connect(self.close)
+            self.tabs.widget(index).layout().addWidget(tool)
+            self.tools[index] = tool
+        self.setWindowTitle(f"FlightLab - {tool.windowTitle()}")
+        return tool
+
+    def closeEvent(self, event):
+        # Embedded tools do not get a close event of their own.
+        for tool in self.tools:
+            if tool is not None:
+                tool.close()
+        super().closeEvent(event)
+
+
+def _initial_tab(argv) -> int:
+    # Optional tab label or module name, e.g. "launcher_ui.py flight_time_ui".
+    for arg in argv[1:]:
+        for i, (label, module, _) in enumerate(TOOLS):
+            if arg in (label, module, module + ".py"):
+                return i
+    return 0
+
+
+# ----------------------------
+# Entrypoint
+# ----------------------------
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    app.setApplicationName("FlightLab")
+    probe = StartupProbe(_IMPORT_T0, "launcher_ui") if StartupProbe.requested(sys.argv) else None
+    win = FlightLabLauncher(_initial_tab(sys.argv))
+    if probe:
+        probe.window_built()
+        for i in range(len(TOOLS)):
+            probe.after_paint(f"open {TOOLS[i][0]}", lambda i=i: win._ensure_tool(i))
+    win.show()
+    sys.exit(app.exec())
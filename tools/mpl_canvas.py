@@ -0,0 +1,33 @@
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+# ----------------------------
+# Matplotlib canvas (dark)
+# ----------------------------
+
+class MplCanvas(FigureCanvas):
+    def __init__(self):
+        fig = Figure(figsize=(5, 4), dpi=100, facecolor="#121212")
+        self.ax = fig.add_subplot(111)
+        self.colorbar = None
+        self._style_axes()
+        self.ax.grid(True, alpha=0.25)
+        super().__init__(fig)
+
+    def _style_axes(self):
+        # Dark theme for axes
+        self.ax.set_facecolor("#161616")
+        for spine in self.ax.spines.values():
+            spine.set_color("#aaaaaa")
+        self.ax.tick_params(colors="#dddddd")
+        self.ax.title.set_color("#dddddd")
+        self.ax.xaxis.label.set_color("#dddddd")
+        self.ax.yaxis.label.set_color("#dddddd")
+
+    def reset(self):
+        """Clear the axes (and any colorbar) and re-apply the dark styling."""
+        if self.colorbar is not None:
+            self.colorbar.remove()
+            self.colorbar = None
+        self.ax.clear()
+        self._style_axes()
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from flightlab.battery import DischargeSimulation, effective_capacity, monte_carlo_discharge
+
+CONFIG = dict(
+    effective_capacity_mAh=effective_capacity(1500), sampling_interval_s=0.1, duration_s=1200.0,
+    i_min=2.0, i_max=10.0, seed=7,
+)
+
+
+def _paced(speed: float, tick_s: float = 0.016):
+    """Records as the battery monitor takes them: every step due at `speed` per UI tick."""
+    sim = DischargeSimulation(**CONFIG)
+    records, wall = [], 0.0
+    while not sim.finished:
+        wall += tick_s
+        due = int(wall * speed / sim.sampling_interval_s) if speed > 0 else None
+        while due is None or sim.steps < due:
+            rec = sim.step()
+            if rec is None:
+                break
+            records.append(rec)
+    return records
+
+
+def test_fixed_seed_gives_bit_identical_records():
+    a = DischargeSimulation(**CONFIG).run()
+    b = DischargeSimulation(**CONFIG).run()
+    assert a == b
+    assert len(a) > 1000
+
+
+@pytest.mark.parametrize("speed", [0.0, 1.0, 25.0, 1000.0])
+def test_speed_factor_does_not_change_records(speed):
+    reference = DischargeSimulation(**CONFIG).run()
+    assert _paced(speed) == reference
+
+
+def test_eta_and_termination_are_stable():
+    sim = DischargeSimulation(**CONFIG)
+    records = sim.run()
+    assert sim.finished == "depleted"
+    t, current, consumed, remaining, eta = records[-1]
+    assert remaining == 0.0 and eta == 0.0
+    t, current, consumed, remaining, eta = records[100]
+    assert eta == pytest.approx(remaining / 1000.0 / current * 60.0)
+
+
+def test_monte_carlo_is_independent_of_worker_count():
+    kwargs = dict(
+        effective_capacity_mAh=CONFIG["effective_capacity_mAh"], sampling_interval_s=0.5, duration_s=1200.0,
+        i_min=2.0, i_max=10.0, runs=400, seed=7,
+    )
+    one = monte_carlo_discharge(workers=1, **kwargs)
+    four = monte_carlo_discharge(workers=4, **kwargs)
+    np.testing.assert_array_equal(one.remaining_bands, four.remaining_bands)
+    np.testing.assert_array_equal(one.eta_error_bands, four.eta_error_bands)
+    np.testing.assert_array_equal(one.depletion_s, four.depletion_s)
@@ -0,0 +1,21 @@
+import numpy as np
+
+from flightlab import cache
+from flightlab.cache import ResultCache, cache_key
+from flightlab.vlm import _lattice
+
+
+def test_key_follows_the_package_source(monkeypatch):
+    args = ((8.0, 1.0), 8, 4, 0)
+    before = cache_key(_lattice, args)
+    assert cache_key(_lattice, args) == before
+    # An edited helper (e.g. vlm._segment) changes the package digest, not _lattice's bytecode.
+    monkeypatch.setitem(cache._source_digests, "flightlab", b"edited")
+    assert cache_key(_lattice, args) != before
+
+
+def test_call_freezes_the_computed_result_in_place():
+    result = np.arange(3.0)
+    rc = ResultCache()
+    assert rc.call(lambda: result) is result
+    assert not result.flags.writeable
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+_PROBE = """
+import sys
+from flightlab.__main__ import main
+try:
+    main([{name!r}, "--help"])
+except SystemExit:
+    pass
+sys.stderr.write(str("numpy" in sys.modules))
+"""
+
+
+@pytest.mark.parametrize("name", ["motor-esc", "power", "discharge", "discharge-mc", "check"])
+def test_help_does_not_load_numpy(name):
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(name=name)], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert out.stderr == "False"
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from flightlab.__main__ import main
+from flightlab.meshcheck import check_mesh
+from flightlab.stl import STL_DTYPE, StlMesh, load_stl
+
+# Unit cube, two triangles per face, counter-clockwise seen from outside.
+_CORNERS = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)])
+_FACES = [
+    (0, 1, 3), (0, 3, 2),  # x = 0
+    (4, 6, 7), (4, 7, 5),  # x = 1
+    (0, 4, 5), (0, 5, 1),  # y = 0
+    (2, 3, 7), (2, 7, 6),  # y = 1
+    (0, 2, 6), (0, 6, 4),  # z = 0
+    (1, 5, 7), (1, 7, 3),  # z = 1
+]
+
+
+def _box(offset=(0.0, 0.0, 0.0)) -> np.ndarray:
+    return _CORNERS[np.array(_FACES)] + offset
+
+
+def _records(tris) -> np.ndarray:
+    records = np.zeros(len(tris), STL_DTYPE)
+    records["vertices"] = tris
+    return records
+
+
+def _write_stl(path, tris) -> str:
+    records = _records(tris)
+    with open(path, "wb") as f:
+        f.write(b"\0" * 80)
+        f.write(np.uint32(len(records)).tobytes())
+        f.write(records.tobytes())
+    return str(path)
+
+
+def _defects():
+    box = _box()
+    flipped = box.copy()
+    flipped[3] = flipped[3][::-1]
+    return {
+        "removed_face": (box[1:], "boundary_edges", 3),
+        "flipped_face": (flipped, "inconsistent_winding_edges", 3),
+        "duplicate_face": (np.concatenate([box, box[:1]]), "duplicate_triangles", 1),
+        "zero_area_face": (np.concatenate([box, [[_CORNERS[0], _CORNERS[1], _CORNERS[1]]]]), "degenerate_triangles", 1),
+        "intersecting_boxes": (np.concatenate([box, _box((0.5, 0.5, 0.5))]), "overlapping_pairs", 1),
+    }
+
+
+def test_closed_box_passes(tmp_path):
+    path = _write_stl(tmp_path / "box.stl", _box())
+    health = check_mesh(load_stl(path))
+    assert health.ok and health.watertight
+    assert not any(health.counts.values())
+    assert health.signed_volume == pytest.approx(1.0)
+    assert main(["check", path]) == 0
+
+
+def test_inside_out_box_fails():
+    health = check_mesh(StlMesh(_records(_box()[:, ::-1])))
+    assert health.watertight and health.inverted and not health.ok
+
+
+@pytest.mark.parametrize("name", list(_defects()))
+def test_each_defect_is_reported(tmp_path, name, capsys):
+    tris, count, at_least = _defects()[name]
+    path = _write_stl(tmp_path / f"{name}.stl", tris)
+    health = check_mesh(load_stl(path))
+    assert health.counts[count] >= at_least
+    assert not health.ok
+    assert main(["check", path]) == 1
+    assert "FAIL" in capsys.readouterr().out
+
+
+def test_one_failing_file_fails_the_directory(tmp_path):
+    _write_stl(tmp_path / "a_box.stl", _box())
+    _write_stl(tmp_path / "b_open.stl", _box()[1:])
+    assert main(["check", str(tmp_path)]) == 1
+    assert main(["check", str(tmp_path / "a_box.stl")]) == 0
+
+
+def test_exit_status_of_the_command(tmp_path):
+    good = _write_stl(tmp_path / "box.stl", _box())
+    bad = _write_stl(tmp_path / "open.stl", _box()[1:])
+    tools = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for path, status in ((good, 0), (bad, 1)):
+        run = subprocess.run([sys.executable, "-m", "flightlab", "check", path], cwd=tools, capture_output=True)
+        assert run.returncode == status
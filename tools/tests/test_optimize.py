@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from flightlab.optimize import _OPT_BLOCK, optimize_airframe
+
+BOUNDS = {
+    "weight_kg": (0.8, 2.5), "wingspan_cm": 120.0, "flight_type": "trainer", "efficiency_pct": 70.0,
+    "pitch_cm": (8.0, 20.0), "rpm": (6000.0, 12000.0), "thrust_g": 1500.0, "max_current_a": 40.0,
+    "capacity_mah": (1000.0, 5000.0), "c_rate": (20.0, 60.0),
+}
+SAMPLES = 3 * _OPT_BLOCK + 1000  # four blocks, split unevenly between shards
+
+
+@pytest.mark.parametrize("sampler", ["lhs", "random", "grid"])
+def test_designs_do_not_depend_on_sharding(sampler):
+    runs = [
+        optimize_airframe(BOUNDS, SAMPLES, sampler, keep=20, refine_rounds=1, seed=11, workers=w)
+        for w in (1, 2, 3)
+    ]
+    assert len(runs[0]) == 20
+    for other in runs[1:]:
+        assert (other.evaluated, other.feasible) == (runs[0].evaluated, runs[0].feasible)
+        for name, column in runs[0].designs.items():
+            np.testing.assert_array_equal(other.designs[name], column, err_msg=name)
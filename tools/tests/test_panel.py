@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from flightlab.panel import PanelAirfoil, airfoil_from_loop, naca4
+
+
+def test_symmetric_section_has_no_lift_at_zero_and_antisymmetric_cl():
+    polar = PanelAirfoil(*naca4("0012")).solve([-6.0, -3.0, 0.0, 3.0, 6.0])
+    assert abs(polar.cl[2]) < 1e-12
+    assert abs(polar.cm[2]) < 1e-12
+    np.testing.assert_allclose(polar.cl[::-1], -polar.cl, atol=1e-12)
+    np.testing.assert_allclose(polar.cm[::-1], -polar.cm, atol=1e-12)
+
+
+def test_naca0012_lift_at_4_degrees():
+    cl = PanelAirfoil(*naca4("0012")).solve(4.0).cl[0]
+    assert cl == pytest.approx(0.48, abs=0.01)
+
+
+def test_cambered_section_lift_and_moment_at_zero():
+    polar = PanelAirfoil(*naca4("2412")).solve(0.0)
+    assert polar.cl[0] == pytest.approx(0.26, abs=0.01)
+    assert polar.cm[0] == pytest.approx(-0.055, abs=0.005)
+
+
+@pytest.mark.parametrize("incidence", [-7.0, 0.0, 5.0, 12.0])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_airfoil_from_loop_round_trips(incidence, reverse):
+    x, y = naca4("2412", 240)
+    loop = np.c_[x, y][:-1]
+    if reverse:
+        loop = loop[::-1]
+    a = np.radians(incidence)
+    nose_up = np.array([[np.cos(a), np.sin(a)], [-np.sin(a), np.cos(a)]])
+    placed = loop @ nose_up.T * 180.0 + [40.0, -12.0]
+
+    xs, ys, found = airfoil_from_loop(placed, 160)
+    x_ref, y_ref, base = airfoil_from_loop(loop, 160)
+    # The chord runs to the point farthest from the trailing edge, a little
+    # off the NACA nose, so the 2412 itself reads as ~0.13 deg nose up.
+    assert 0.0 < base < 0.2
+    assert found - base == pytest.approx(incidence, abs=1e-9)
+    np.testing.assert_allclose(xs, x_ref, atol=1e-12)
+    np.testing.assert_allclose(ys, y_ref, atol=1e-4)
+    # Lower surface TE -> LE, then upper LE -> TE, on the original section.
+    half = len(xs) // 2
+    for surface, sx, sy in ((slice(None, half + 1), x[: len(x) // 2 + 1], y[: len(y) // 2 + 1]),
+                            (slice(half, None), x[len(x) // 2 :], y[len(y) // 2 :])):
+        o = np.argsort(sx)
+        np.testing.assert_allclose(ys[surface], np.interp(xs[surface], sx[o], sy[o]), atol=3e-3)
+    x0, y0 = naca4("2412", 160)
+    cl = PanelAirfoil(xs, ys).solve(base).cl[0]
+    assert cl == pytest.approx(PanelAirfoil(x0, y0).solve(0.0).cl[0], abs=0.01)
+
+
+def test_drag_estimate_is_finite_and_positive():
+    polar = PanelAirfoil(*naca4("2412")).solve([-2.0, 0.0, 4.0], reynolds=1e6)
+    assert np.all(np.isfinite(polar.cd)) and np.all(polar.cd > 0.0)
+    assert np.all((polar.cd > 0.004) & (polar.cd < 0.02))
+    for xtr in (polar.xtr_upper, polar.xtr_lower):
+        assert np.all((xtr > 0.0) & (xtr <= 1.0))
+    assert polar.xtr_upper[2] < polar.xtr_upper[0]  # transition moves forward with alpha
+    assert np.all(np.isnan(PanelAirfoil(*naca4("2412")).solve(0.0).cd))
@@ -0,0 +1,45 @@
+import numpy as np
+
+from flightlab.panel import naca4
+from flightlab.slicing import Section, chain_loops, slice_wing
+from flightlab.stl import STL_DTYPE, StlMesh
+
+
+def _extruded_wing(rows=11, span=(-500.0, 500.0), chord=200.0) -> StlMesh:
+    x, z = naca4("2412", 120)
+    prof = np.column_stack([x[:-1], z[:-1]]) * chord
+    m = len(prof)
+    secs = [np.column_stack([prof[:, 0], np.full(m, y), prof[:, 1]]) for y in np.linspace(*span, rows)]
+    tris = []
+    for a, b in zip(secs[:-1], secs[1:]):
+        for i in range(m):
+            j = (i + 1) % m
+            tris += [[a[i], b[j], a[j]], [a[i], b[i], b[j]]]
+    for ring, flip in ((secs[0], True), (secs[-1], False)):
+        c = ring.mean(axis=0)
+        for i in range(m):
+            t = [c, ring[(i + 1) % m], ring[i]]
+            tris.append(t[::-1] if flip else t)
+    records = np.zeros(len(tris), STL_DTYPE)
+    records["vertices"] = np.array(tris)
+    return StlMesh(records)
+
+
+def test_stations_through_vertex_rows_give_one_closed_loop():
+    wing = slice_wing(_extruded_wing(), [-400.0, 0.0, 100.0, 250.0])
+    for sec in wing.sections:
+        assert sec.closed == [True]
+        assert sec.chord == np.float64(200.0)
+    np.testing.assert_array_equal(wing.columns()["loops"], [1, 1, 1, 1])
+    np.testing.assert_array_equal(wing.columns()["open_chains"], [0, 0, 0, 0])
+
+
+def test_open_chains_are_flagged_and_not_measured():
+    start = np.array([[0.0, 0.0], [1.0, 0.0]])
+    end = np.array([[1.0, 0.0], [1.0, 1.0]])
+    loops, closed = chain_loops(start, end)
+    assert closed == [False]
+    assert len(loops[0]) == 3
+    sec = Section(0.0, loops, closed)
+    assert sec.outlines == []
+    assert sec.chord == 0.0
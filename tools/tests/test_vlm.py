@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from flightlab.cache import ResultCache
+from flightlab.vlm import Planform, VortexLattice
+
+
+@pytest.mark.parametrize("taper", [1.0, 0.6, 0.4])
+@pytest.mark.parametrize("n_span", [4, 8, 32, 64])
+def test_planar_wing_oswald_efficiency_is_at_most_one(taper, n_span):
+    loads = VortexLattice(Planform(8.0, 1.0, taper=taper), n_span, 4, cache=ResultCache()).solve([2.0, 5.0, 10.0])
+    assert np.all(loads.oswald <= 1.0)
+    assert np.all(loads.oswald > 0.9)
+
+
+def test_induced_drag_converges_at_the_default_lattice():
+    planform = Planform(8.0, 1.0, taper=0.4)
+    fine = VortexLattice(planform, 128, 4, cache=ResultCache()).solve([5.0])
+    default = VortexLattice(planform, cache=ResultCache()).solve([5.0])
+    assert default.oswald[0] == pytest.approx(fine.oswald[0], rel=1e-3)
+    assert default.cl[0] == pytest.approx(fine.cl[0], rel=1e-3)
+
+
+def test_winglets_raise_oswald_efficiency_above_one():
+    plain = VortexLattice(Planform(8.0, 1.0, taper=0.4), cache=ResultCache()).solve([5.0])
+    winglet = VortexLattice(Planform(8.0, 1.0, taper=0.4, winglet_height=0.6), cache=ResultCache()).solve([5.0])
+    assert plain.oswald[0] < 1.0 < winglet.oswald[0]
+
+
+def test_sideslip_is_antisymmetric_with_stable_dihedral_effect():
+    loads = VortexLattice(Planform(8.0, 1.0, taper=0.4, dihedral_deg=5.0), cache=ResultCache()).solve(5.0, [-5.0, 0.0, 5.0])
+    assert loads.croll[2] < 0.0
+    assert loads.croll[0] == pytest.approx(-loads.croll[2])
+    assert loads.cl[0] == pytest.approx(loads.cl[2])
+    assert abs(loads.cy[1]) < 1e-12
@@ -0,0 +1,713 @@
+import os
+import sys
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QObject, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QKeySequence, QPalette, QShortcut
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QFileDialog,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QTableView,
+)
+
+from flightlab.cache import default_cache
+from flightlab.writers import write_csv
+
+# ----------------------------
+# Array-backed table model
+# ----------------------------
+
+Formatter = Union[str, Callable[[object], str]]
+
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+def _formatter(fmt: Optional[Formatter]) -> Callable[[object], str]:
+    if fmt is None:
+        return str
+    if isinstance(fmt, str):
+        return fmt.format
+    return fmt
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """Read-only table model over NumPy columns.
+
+    Cells are formatted in data(), i.e. only for rows the view actually
+    paints, so memory stays proportional to the numeric arrays. Sorting
+    keeps a row permutation instead of reordering the data. append_rows()
+    grows the columns geometrically for streaming producers.
+
+    Exports use the raw column values; export_formats (per column, None =
+    raw) only maps codes that have no meaning outside the table, e.g. enums.
+    """
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        formats: Optional[Sequence[Optional[Formatter]]] = None,
+        right_align: Optional[Sequence[int]] = None,
+        tooltips: Optional[Sequence[str]] = None,
+        export_formats: Optional[Sequence[Optional[Callable[[object], object]]]] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._cols: List[np.ndarray] = []
+        self._n = 0
+        self._order: Optional[np.ndarray] = None
+        self._configure(headers, formats, right_align, tooltips, export_formats)
+
+    def _configure(self, headers, formats, right_align, tooltips, export_formats=None):
+        self._headers = list(headers)
+        ncols = len(self._headers)
+        formats = list(formats) if formats is not None else [None] * ncols
+        self._fmt = [_formatter(f) for f in formats]
+        self._right = None if right_align is None else frozenset(right_align)
+        self._tooltips = list(tooltips) if tooltips is not None else None
+        self._export_fmt = list(export_formats) if export_formats is not None else [None] * ncols
+
+    # ---- Data ----
+    def set_columns(
+        self,
+        columns: Sequence[np.ndarray],
+        headers: Optional[Sequence[str]] = None,
+        formats: Optional[Sequence[Optional[Formatter]]] = None,
+        right_align: Optional[Sequence[int]] = None,
+    ):
+        self.beginResetModel()
+        if headers is not None:
+            self._configure(headers, formats, right_align, None)
+        self._cols = [np.asarray(c) for c in columns]
+        self._n = len(self._cols[0]) if self._cols else 0
+        self._order = None
+        self.endResetModel()
+
+    def append_rows(self, *columns):
+        values = [np.atleast_1d(np.asarray(c)) for c in columns]
+        k = len(values[0])
+        if k == 0:
+            return
+        need = self._n + k
+        if not self._cols:
+            self._cols = [np.empty(max(k, 256), dtype=v.dtype) for v in values]
+        elif need > len(self._cols[0]):
+            cap = max(need, 2 * len(self._cols[0]))
+            grown = []
+            for col in self._cols:
+                g = np.empty(cap, dtype=col.dtype)
+                g[: self._n] = col[: self._n]
+                grown.append(g)
+            self._cols = grown
+        self.beginInsertRows(QModelIndex(), self._n, need - 1)
+        for col, v in zip(self._cols, values):
+            col[self._n : need] = v
+        if self._order is not None:
+            self._order = np.concatenate([self._order, np.arange(self._n, need)])
+        self._n = need
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._cols = []
+        self._n = 0
+        self._order = None
+        self.endResetModel()
+
+    def columns(self) -> List[np.ndarray]:
+        """Columns in storage order (unaffected by view sorting)."""
+        return [c[: self._n] for c in self._cols]
+
+    def headers(self) -> List[str]:
+        return list(self._headers)
+
+    def display_rows(self) -> Iterator[List[str]]:
+        """Formatted rows in the current view order."""
+        rows = self._order if self._order is not None else range(self._n)
+        for r in rows:
+            yield [fmt(col[r]) for fmt, col in zip(self._fmt, self._cols)]
+
+    def export_row_count(self) -> int:
+        return self._n
+
+    def export_chunks(self, chunk_rows: int = 65536) -> Iterator[List[np.ndarray]]:
+        """Raw column chunks in the current view order, for export.
+
+        The columns and order are captured when this is called, so the
+        iterator can be consumed on another thread while the model changes.
+        """
+        n = self._n
+        cols = [c[:n] for c in self._cols]
+        order = self._order
+        maps = list(self._export_fmt)
+
+        def chunks():
+            for i in range(0, n, chunk_rows):
+                idx = order[i : i + chunk_rows] if order is not None else slice(i, i + chunk_rows)
+                yield [c[idx] if m is None else [m(v) for v in c[idx].tolist()] for c, m in zip(cols, maps)]
+
+        return chunks()
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._n
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        c = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            r = index.row()
+            if self._order is not None:
+                r = self._order[r]
+            return self._fmt[c](self._cols[c][r])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if self._right is None:
+                right = self._cols and self._cols[c].dtype.kind in "iufb"
+            else:
+                right = c in self._right
+            return int(_ALIGN_RIGHT if right else _ALIGN_LEFT)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or section >= len(self._headers):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        if role == Qt.ItemDataRole.ToolTipRole and self._tooltips:
+            return self._tooltips[section]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not self._n or column >= len(self._cols):
+            return
+        self.layoutAboutToBeChanged.emit()
+        perm = np.argsort(self._cols[column][: self._n], kind="stable")
+        if order == Qt.SortOrder.DescendingOrder:
+            perm = perm[::-1]
+        self._order = perm
+        self.layoutChanged.emit()
+
+
+def make_table_view(model: QAbstractTableModel, parent=None) -> QTableView:
+    """QTableView configured like the tools' tables: stretched columns, fixed row height."""
+    view = QTableView(parent)
+    view.setModel(model)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    vh = view.verticalHeader()
+    vh.setVisible(False)
+    vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vh.setDefaultSectionSize(22)
+    view.setAlternatingRowColors(True)
+    view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    view.setWordWrap(False)
+    return view
+
+
+class RingTableModel(QAbstractTableModel):
+    """Read-only table model over a flightlab.ringbuffer.RingBuffer.
+
+    The model never copies rows; data() reads the buffer's storage for the
+    rows the view paints. Call sync() after appending to the buffer: while
+    it fills, new rows are inserted; once full, the row count stays fixed
+    and only a dataChanged is emitted, so per-append cost stays constant.
+    """
+
+    def __init__(
+        self,
+        ring,
+        headers: Sequence[str],
+        formats: Optional[Sequence[Optional[Formatter]]] = None,
+        right_align: Optional[Sequence[int]] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._ring = ring
+        self._rows = len(ring)
+        self._headers = list(headers)
+        formats = list(formats) if formats is not None else [None] * len(self._headers)
+        self._fmt = [_formatter(f) for f in formats]
+        self._right = frozenset(right_align) if right_align is not None else frozenset(range(len(headers)))
+
+    @property
+    def ring(self):
+        return self._ring
+
+    def set_ring(self, ring):
+        self.beginResetModel()
+        self._ring = ring
+        self._rows = len(ring)
+        self.endResetModel()
+
+    def sync(self):
+        n = len(self._ring)
+        if n < self._rows:
+            self.beginResetModel()
+            self._rows = n
+            self.endResetModel()
+            return
+        if n > self._rows:
+            self.beginInsertRows(QModelIndex(), self._rows, n - 1)
+            self._rows = n
+            self.endInsertRows()
+        if self._ring.full and n:
+            self.dataChanged.emit(self.index(0, 0), self.index(n - 1, len(self._headers) - 1))
+
+    def headers(self) -> List[str]:
+        return list(self._headers)
+
+    def display_rows(self) -> Iterator[List[str]]:
+        """Formatted rows of the full history (spilled rows included)."""
+        for chunk in self._ring.iter_chunks():
+            for row in chunk:
+                yield [fmt(v) for fmt, v in zip(self._fmt, row)]
+
+    def export_row_count(self) -> int:
+        return self._ring.spilled + len(self._ring)
+
+    def export_chunks(self, chunk_rows: int = 65536) -> Iterator[List[np.ndarray]]:
+        """Raw column chunks of the full history, for export.
+
+        Retained rows are copied and the spill length fixed when this is
+        called, so the buffer may keep filling while a thread consumes it.
+        """
+        ring = self._ring
+        history = (ring.spilled_rows(), ring.snapshot())
+        return (
+            [part[i : i + chunk_rows, c] for c in range(ring.ncols)]
+            for part in history
+            for i in range(0, len(part), chunk_rows)
+        )
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ring):
+            return None
+        c = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            r = self._ring.physical_row(index.row())
+            return self._fmt[c](self._ring.data[r, c])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(_ALIGN_RIGHT if c in self._right else _ALIGN_LEFT)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+
+# ----------------------------
+# Shared dark theme
+# ----------------------------
+
+DARK_STYLESHEET = """
+QMainWindow, QWidget {
+    background-color: #121212;
+    color: #dcdcdc;
+    font-family: Arial;
+    font-size: 10pt;
+}
+QGroupBox {
+    border: 1px solid #2b2b2b;
+    border-radius: 6px;
+    margin-top: 6px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 2px;
+    font-size: 10pt;
+}
+QLineEdit {
+    background-color: #1a1a1a;
+    color: #ffffff;
+    border: 1px solid #3a3a3a;
+    border-radius: 5px;
+    padding: 4px 6px;
+    font-size: 10pt;
+}
+QLineEdit:focus {
+    border: 1px solid #0a84ff;
+}
+QComboBox {
+    background-color: #1a1a1a;
+    color: #ffffff;
+    border: 1px solid #3a3a3a;
+    border-radius: 5px;
+    padding: 3px 6px;
+    font-size: 10pt;
+}
+QCheckBox {
+    spacing: 6px;
+}
+QPushButton {
+    background-color: #0a84ff;
+    color: #ffffff;
+    border: none;
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-weight: 600;
+    font-size: 10pt;
+    min-height: 26px;
+}
+QPushButton:hover { background-color: #2b95ff; }
+QPushButton:pressed { background-color: #086ed6; }
+QTableView {
+    gridline-color: #2a2a2a;
+    background-color: #161616;
+    alternate-background-color: #141414;
+    color: #dcdcdc;
+    selection-background-color: #0a84ff;
+    selection-color: #000000;
+    border: 1px solid #2a2a2a;
+    border-radius: 6px;
+    font-size: 10pt;
+}
+QHeaderView::section {
+    background-color: #1c1c1c;
+    color: #dcdcdc;
+    padding: 4px 6px;
+    border: 0px;
+    border-right: 1px solid #2a2a2a;
+    font-size: 10pt;
+}
+QTabWidget::pane {
+    border: 1px solid #2a2a2a;
+    border-radius: 6px;
+}
+QTabBar::tab {
+    background-color: #1a1a1a;
+    color: #a0a0a0;
+    padding: 6px 14px;
+    border: 1px solid #2a2a2a;
+    border-bottom: none;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}
+QTabBar::tab:selected {
+    background-color: #232323;
+    color: #ffffff;
+}
+QSplitter::handle { background: #1b1b1b; }
+QLabel#cacheStatus {
+    color: #9a9a9a;
+    padding: 0 6px;
+}
+QLabel#tips {
+    color: #a0a0a0;
+    padding: 4px 0;
+    font-size: 9pt;
+}
+QLabel#chartPlaceholder {
+    color: #6a6a6a;
+    background-color: #161616;
+    border: 1px dashed #2b2b2b;
+    border-radius: 6px;
+}
+QTextBrowser {
+    background-color: #1a1a1a;
+    color: #e6e6e6;
+    border: 1px solid #3a3a3a;
+    border-radius: 6px;
+    padding: 6px;
+    font-size: 10pt;
+}
+"""
+
+
+def apply_dark_theme(app: Optional[QApplication] = None):
+    """Dark font, palette and stylesheet for all tools.
+
+    Applied to the QApplication once; later calls (one per tool window, or
+    per tab in the launcher) are no-ops.
+    """
+    app = app or QApplication.instance()
+    if app.property("flightlabDarkTheme"):
+        return
+    app.setFont(QFont("Arial", 10))
+
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor("#121212"))
+    palette.setColor(QPalette.WindowText, QColor("#dcdcdc"))
+    palette.setColor(QPalette.Base, QColor("#1a1a1a"))
+    palette.setColor(QPalette.AlternateBase, QColor("#171717"))
+    palette.setColor(QPalette.ToolTipBase, QColor("#2a2a2a"))
+    palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
+    palette.setColor(QPalette.Text, QColor("#dcdcdc"))
+    palette.setColor(QPalette.Button, QColor("#232323"))
+    palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
+    palette.setColor(QPalette.BrightText, QColor("#ff6666"))
+    palette.setColor(QPalette.Highlight, QColor("#0a84ff"))
+    palette.setColor(QPalette.HighlightedText, QColor("#000000"))
+    app.setPalette(palette)
+
+    app.setStyleSheet(DARK_STYLESHEET)
+    app.setProperty("flightlabDarkTheme", True)
+
+
+def compute_pool() -> QThreadPool:
+    """Thread pool for background work (exports etc.), shared by every tool in the process."""
+    return QThreadPool.globalInstance()
+
+
+class ComputeJob(QObject):
+    """Runs fn(*args, **kwargs) on the compute pool.
+
+    finished(result, seconds) or failed(message) is delivered on the GUI
+    thread; `active` is True while the job runs.
+    """
+
+    finished = Signal(object, float)
+    failed = Signal(str)
+
+    def __init__(self, parent, fn: Callable, *args, **kwargs):
+        super().__init__(parent)
+        self._call = (fn, args, kwargs)
+        self.active = False
+        self.finished.connect(self._done)
+        self.failed.connect(self._done)
+
+    def start(self):
+        self.active = True
+        compute_pool().start(self._run)
+
+    def _run(self):
+        fn, args, kwargs = self._call
+        t0 = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(result, time.perf_counter() - t0)
+
+    def _done(self, *_):
+        self.active = False
+
+
+# ----------------------------
+# Background CSV export
+# ----------------------------
+
+EXPORT_CHUNK_ROWS = 65536
+
+
+class CsvExport(QObject):
+    """Streams a model's export_chunks() to a CSV file on the thread pool.
+
+    Values are written from the raw columns at full precision, one chunk at
+    a time, so memory stays flat and the UI keeps running. Progress and the
+    outcome are reported in the window's status bar. Esc cancels a running
+    export (see also cancel_export()); the partial file is deleted.
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(int)
+    cancelled = Signal()
+    failed = Signal(str)
+
+    def __init__(self, window, path: str, model, chunk_rows: int = EXPORT_CHUNK_ROWS):
+        super().__init__(window)
+        self.window = window
+        self.path = path
+        self.active = False
+        self._cancel = False
+        self._done = threading.Event()
+        # Captured on the GUI thread; see the models' export_chunks().
+        self._headers = model.headers()
+        self._total = model.export_row_count()
+        self._chunks = model.export_chunks(chunk_rows)
+        self._shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), window)
+        self._shortcut.setEnabled(False)
+        self._shortcut.activated.connect(self.cancel)
+        self.progress.connect(self._on_progress)
+        self.finished.connect(self._on_finished)
+        self.cancelled.connect(self._on_cancelled)
+        self.failed.connect(self._on_failed)
+
+    def start(self, pool: Optional[QThreadPool] = None):
+        self.active = True
+        self._shortcut.setEnabled(True)
+        (pool or compute_pool()).start(self._run)
+
+    def cancel(self, wait: bool = False):
+        """Stop after the current chunk; with wait, block until the file is removed."""
+        self._cancel = True
+        if wait and self.active:
+            self._done.wait()
+
+    def _run(self):
+        try:
+            rows = write_csv(
+                self.path, self._headers, self._chunks, self._total,
+                progress=lambda done, total: self.progress.emit(done, total),
+                cancelled=lambda: self._cancel,
+            )
+            if self._cancel:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+                self.cancelled.emit()
+            else:
+                self.finished.emit(rows)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self._done.set()
+
+    def _end(self):
+        self.active = False
+        self._shortcut.setEnabled(False)
+
+    def _on_progress(self, done: int, total: int):
+        if not self.active:
+            return
+        pct = 100 * done // total if total else 100
+        self.window.statusBar().showMessage(f"Exporting... {done:,} / {total:,} rows ({pct}%), Esc to cancel")
+
+    def _on_finished(self, rows: int):
+        self._end()
+        self.window.statusBar().showMessage(f"Exported {rows:,} rows to {self.path}", 3000)
+
+    def _on_cancelled(self):
+        self._end()
+        self.window.statusBar().showMessage("Export cancelled; partial file removed.", 3000)
+
+    def _on_failed(self, message: str):
+        self._end()
+        self.window.statusBar().clearMessage()
+        QMessageBox.critical(self.window, "Export Error", f"Failed to export CSV: {message}")
+
+
+def export_model_csv(window, model, default_name: str) -> Optional[CsvExport]:
+    """File > Export handler shared by the tools: ask for a path, export in the background."""
+    if model.export_row_count() == 0:
+        QMessageBox.information(window, "Export", "No results to export.")
+        return None
+    running = getattr(window, "_csv_export", None)
+    if running is not None and running.active:
+        QMessageBox.information(window, "Export", "An export is already in progress.")
+        return None
+    path, _ = QFileDialog.getSaveFileName(window, "Export Results", default_name, "CSV Files (*.csv)")
+    if not path:
+        return None
+    job = CsvExport(window, path, model)
+    window._csv_export = job
+    job.start()
+    return job
+
+
+def cancel_export(window):
+    """Cancel the window's running export_model_csv() job and wait for it; call from closeEvent()."""
+    job = getattr(window, "_csv_export", None)
+    if job is not None and job.active:
+        job.cancel(wait=True)
+
+
+# ----------------------------
+# Result cache status
+# ----------------------------
+
+class CacheStatus(QLabel):
+    """Permanent status-bar label with the shared result cache's hit/miss counts.
+
+    call() runs a computation through the cache and refreshes the label, so
+    tools route repeatable work through it instead of calling directly.
+    """
+
+    def __init__(self, window, cache=None):
+        super().__init__()
+        self.setObjectName("cacheStatus")
+        self.cache = cache or default_cache()
+        window.statusBar().addPermanentWidget(self)
+        self.refresh()
+
+    def call(self, fn: Callable, *args, **kwargs):
+        try:
+            return self.cache.call(fn, *args, **kwargs)
+        finally:
+            self.refresh()
+
+    def refresh(self):
+        self.setText(self.cache.stats_text())
+
+
+# ----------------------------
+# Startup-time measurement
+# ----------------------------
+
+STARTUP_TIME_FLAG = "--startup-time"
+
+
+class StartupProbe(QObject):
+    """Measures cold-start latency for a tool run with --startup-time.
+
+    Create it right after the tool's imports with the perf_counter() value
+    taken before them, call window_built() after constructing the window,
+    and show it. On the first paint the probe prints import, window and
+    first-paint times (plus any after_paint callbacks, e.g. deferred work)
+    to stderr and quits the application.
+    """
+
+    def __init__(self, t_import_start: float, label: str):
+        super().__init__()
+        self.label = label
+        self._t0 = t_import_start
+        self._t_imported = time.perf_counter()
+        self._t_window = None
+        self._painted = False
+        self._after_paint: List[tuple] = []
+        QApplication.instance().installEventFilter(self)
+
+    @staticmethod
+    def requested(argv: Sequence[str]) -> bool:
+        return STARTUP_TIME_FLAG in argv
+
+    def window_built(self):
+        self._t_window = time.perf_counter()
+
+    def after_paint(self, name: str, fn: Callable[[], object]):
+        """Time fn() once the first frame is up; reported as `name`."""
+        self._after_paint.append((name, fn))
+
+    def eventFilter(self, obj, event):
+        if not self._painted and event.type() == QEvent.Type.Paint:
+            self._painted = True
+            # Report once this paint has been handled and the frame is out.
+            QTimer.singleShot(0, self._report)
+        return False
+
+    def _report(self):
+        t_paint = time.perf_counter()
+        t_window = self._t_window or self._t_imported
+        parts = [
+            f"import {1000 * (self._t_imported - self._t0):.1f} ms",
+            f"window {1000 * (t_window - self._t_imported):.1f} ms",
+            f"first paint {1000 * (t_paint - t_window):.1f} ms",
+            f"total {1000 * (t_paint - self._t0):.1f} ms",
+        ]
+        for name, fn in self._after_paint:
+            t = time.perf_counter()
+            fn()
+            parts.append(f"{name} {1000 * (time.perf_counter() - t):.1f} ms")
+        print(f"{self.label} startup: " + ", ".join(parts), file=sys.stderr)
+        QApplication.instance().quit()
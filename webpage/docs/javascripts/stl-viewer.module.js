@@ -1,6 +1,7 @@
 import * as THREE from "https://esm.sh/three@0.160.0";
 import { OrbitControls } from "https://esm.sh/three@0.160.0/examples/jsm/controls/OrbitControls.js";
 import { STLLoader } from "https://esm.sh/three@0.160.0/examples/jsm/loaders/STLLoader.js";
+import { GLTFLoader } from "https://esm.sh/three@0.160.0/examples/jsm/loaders/GLTFLoader.js";
 
 function initViewer(container) {
   const status = document.createElement("div");
@@ -90,60 +91,142 @@ function initViewer(container) {
     ctrls.update();
   }
 
-  // Load STL
-  const loader = new STLLoader();
-  loader.load(
-    src,
-    geometry => {
-      geometry.computeVertexNormals();
-
-      const color = new THREE.Color(container.getAttribute("data-color") || "#aaaaaa");
-      const metalness = parseFloat(container.getAttribute("data-metalness") || "0.1");
-      const roughness = parseFloat(container.getAttribute("data-roughness") || "0.7");
-
-      const mesh = new THREE.Mesh(
-        geometry,
-        new THREE.MeshStandardMaterial({ color, metalness, roughness })
-      );
-      scene.add(mesh);
-
-      // Apply rotation immediately after creating mesh
-      mesh.rotation.set(
-        THREE.MathUtils.degToRad(0),   // rotate X
-        THREE.MathUtils.degToRad(90),  // rotate Y
-        THREE.MathUtils.degToRad(0)    // rotate Z
-      );
-
-      // Center the object at the origin in WORLD space
-      const boxA = new THREE.Box3().setFromObject(mesh);
-      const center = boxA.getCenter(new THREE.Vector3());
-      mesh.position.sub(center);
-
-      // Place the object on the ground plane (y = 0)
-      const boxB = new THREE.Box3().setFromObject(mesh);
-      mesh.position.x -= 10;
-      mesh.position.y -= boxB.min.y;
-
-      // Frame after final transforms
-      const boxC = new THREE.Box3().setFromObject(mesh);
-      const sphere = boxC.getBoundingSphere(new THREE.Sphere());
-      controls.target.set(0, 0, 0);
-      fitCameraToSphere(camera, controls, Math.max(sphere.radius, 1e-6), 1.35);
-
-      status.textContent = "Drag to rotate, scroll to zoom";
-      start();
-    },
-    xhr => {
+  // Model: one mesh whose geometry is swapped as finer levels arrive
+  const color = new THREE.Color(container.getAttribute("data-color") || "#aaaaaa");
+  const metalness = parseFloat(container.getAttribute("data-metalness") || "0.1");
+  const roughness = parseFloat(container.getAttribute("data-roughness") || "0.7");
+  const material = new THREE.MeshStandardMaterial({ color, metalness, roughness });
+  let mesh = null;
+
+  // bounds: model-space Box3 used for placement and framing. Levels of
+  // detail pass the source STL's box from the manifest: decimation moves
+  // vertices and each glb is quantized over its own box, so the levels'
+  // own boxes differ slightly and would shift the model as they swap.
+  function showGeometry(geometry, bounds = null) {
+    if (!geometry.getAttribute("normal")) {
+      material.flatShading = true; // quantized levels without normals
+      material.needsUpdate = true;
+    }
+    if (mesh) {
+      const old = mesh.geometry;
+      mesh.geometry = geometry;
+      old.dispose();
+      return;
+    }
+
+    mesh = new THREE.Mesh(geometry, material);
+    scene.add(mesh);
+
+    // Apply rotation immediately after creating mesh
+    mesh.rotation.set(
+      THREE.MathUtils.degToRad(0),   // rotate X
+      THREE.MathUtils.degToRad(90),  // rotate Y
+      THREE.MathUtils.degToRad(0)    // rotate Z
+    );
+    mesh.updateMatrixWorld(true);
+    if (!bounds) {
+      geometry.computeBoundingBox();
+      bounds = geometry.boundingBox;
+    }
+    const box = bounds.clone().applyMatrix4(mesh.matrixWorld);
+
+    // Center the object at the origin in WORLD space
+    const center = box.getCenter(new THREE.Vector3());
+    mesh.position.sub(center);
+
+    // Place the object on the ground plane (y = 0)
+    mesh.position.x -= 10;
+    mesh.position.y -= box.min.y - center.y;
+
+    // Frame after final transforms
+    const sphere = box.getBoundingSphere(new THREE.Sphere());
+    controls.target.set(0, 0, 0);
+    fitCameraToSphere(camera, controls, Math.max(sphere.radius, 1e-6), 1.35);
+    start();
+  }
+
+  function onProgress(prefix) {
+    return xhr => {
       if (xhr.total) {
         const pct = Math.round((xhr.loaded / xhr.total) * 100);
-        status.textContent = "Loading " + pct + "%";
+        status.textContent = prefix + pct + "%";
       }
-    },
-    err => {
-      status.textContent = "Failed to load STL";
-      console.error("STL load error:", err);
+    };
+  }
+
+  function onError(err) {
+    status.textContent = "Failed to load model";
+    console.error("Model load error:", err);
+  }
+
+  // Quantized glb (KHR_mesh_quantization): integer positions plus a node
+  // transform. Convert to float and bake the transform so every level
+  // lands in model units like the STL.
+  function toFloat(attr) {
+    const out = new THREE.BufferAttribute(new Float32Array(attr.count * attr.itemSize), attr.itemSize);
+    for (let i = 0; i < attr.count; i++) {
+      for (let c = 0; c < attr.itemSize; c++) out.setComponent(i, c, attr.getComponent(i, c));
     }
-  );
+    return out;
+  }
+
+  async function loadGlb(loader, url, prefix) {
+    const gltf = await loader.loadAsync(url, onProgress(prefix));
+    gltf.scene.updateMatrixWorld(true);
+    let found = null;
+    gltf.scene.traverse(o => { if (!found && o.isMesh) found = o; });
+    if (!found) throw new Error("No mesh in " + url);
+    const geometry = new THREE.BufferGeometry();
+    geometry.setIndex(found.geometry.getIndex());
+    for (const name of ["position", "normal"]) {
+      const attr = found.geometry.getAttribute(name);
+      if (attr) geometry.setAttribute(name, toFloat(attr));
+    }
+    geometry.applyMatrix4(found.matrixWorld);
+    found.geometry.dispose();
+    return geometry;
+  }
+
+  // Level-of-detail manifest from `python -m flightlab webmesh`: show the
+  // coarsest level as soon as it arrives, then stream the finer ones.
+  async function loadLods(url) {
+    const response = await fetch(url);
+    if (!response.ok) throw new Error(response.status + " " + response.statusText);
+    const manifest = await response.json();
+    const loader = new GLTFLoader();
+    const lods = manifest.lods || [];
+    const bounds = manifest.bbox_min && manifest.bbox_max
+      ? new THREE.Box3(new THREE.Vector3(...manifest.bbox_min), new THREE.Vector3(...manifest.bbox_max))
+      : null;
+    for (let i = 0; i < lods.length; i++) {
+      const prefix = i === 0 ? "Loading " : "Refining " + (i + 1) + "/" + lods.length + " ";
+      showGeometry(await loadGlb(loader, new URL(lods[i].url, url).href, prefix), bounds);
+      status.textContent = i + 1 < lods.length ? "Refining..." : "Drag to rotate, scroll to zoom";
+    }
+  }
+
+  const path = new URL(src).pathname.toLowerCase();
+  if (path.endsWith(".json")) {
+    loadLods(src).catch(onError);
+  } else if (path.endsWith(".glb") || path.endsWith(".gltf")) {
+    loadGlb(new GLTFLoader(), src, "Loading ")
+      .then(geometry => {
+        showGeometry(geometry);
+        status.textContent = "Drag to rotate, scroll to zoom";
+      })
+      .catch(onError);
+  } else {
+    new STLLoader().load(
+      src,
+      geometry => {
+        geometry.computeVertexNormals();
+        showGeometry(geometry);
+        status.textContent = "Drag to rotate, scroll to zoom";
+      },
+      onProgress("Loading "),
+      onError
+    );
+  }
 
   // Resize handling
   const resize = () => {
@@ -172,8 +255,43 @@ function initViewer(container) {
   ).observe(container);
 }
 
+// With data-poster (a thumbnail from `python -m flightlab thumbnail`), show
+// the image and start WebGL and the download only when the reader asks.
+function initPoster(container) {
+  const img = document.createElement("img");
+  img.className = "stl-poster";
+  img.src = new URL(container.getAttribute("data-poster"), document.baseURI).href;
+  img.alt = container.getAttribute("data-alt") || "3D model preview";
+  const status = document.createElement("div");
+  status.className = "stl-status";
+  status.textContent = "Click to load 3D view";
+  container.append(img, status);
+  container.tabIndex = 0;
+  container.setAttribute("role", "button");
+
+  let loaded = false;
+  function load() {
+    if (loaded) return;
+    loaded = true;
+    img.remove();
+    status.remove();
+    container.removeAttribute("role");
+    initViewer(container);
+  }
+  container.addEventListener("click", load);
+  container.addEventListener("keydown", e => {
+    if (e.key === "Enter" || e.key === " ") {
+      e.preventDefault();
+      load();
+    }
+  });
+}
+
 function initAll() {
-  document.querySelectorAll(".stl-viewer").forEach(initViewer);
+  document.querySelectorAll(".stl-viewer").forEach(container => {
+    if (container.hasAttribute("data-poster")) initPoster(container);
+    else initViewer(container);
+  });
 }
 
 // MkDocs Material SPA hook